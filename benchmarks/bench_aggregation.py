@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs. multi-process results aggregation.
+
+Writes a synthetic results log (compact records, rotated into several
+segments), then aggregates it per section, difficulty and question with
+aggregate_results, once in the current process and once sharded across
+a process pool. Checks that both runs produce identical aggregates.
+The speedup is only reported on machines with more than one CPU.
+
+Usage:
+    python benchmarks/bench_aggregation.py [num_quizzes] [workers]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.aggregation import aggregate_results, plan_shards, result_files
+from quizzmaker.models import CompactQuizSummary, CompactResult, Question
+from quizzmaker.results_log import ResultsLog
+
+
+def synthetic_bank(count: int):
+    """Return a bank spread over sections and difficulties."""
+    return [
+        Question(id=i, section=f"{i % 12 + 1}.{i % 5 + 1}", section_title="Section",
+                 difficulty=("Easy", "Medium", "Hard")[i % 3], type="Multiple Choice",
+                 question=f"Question {i}?", options=["A", "B", "C", "D"], answer="A", explanation="")
+        for i in range(1, count + 1)
+    ]
+
+
+def write_log(path: Path, quizzes: int, bank_size: int) -> None:
+    """Write 20-question compact quizzes, rotating every 64 MB."""
+    rng = random.Random(0)
+    with ResultsLog(path, flush_every=1000, fsync=False, max_bytes=64 * 1024 * 1024) as log:
+        for n in range(quizzes):
+            log.append(CompactQuizSummary(
+                [CompactResult(q, rng.randrange(4), rng.random() < 0.6, 1700000000.0 + n)
+                 for q in rng.sample(range(1, bank_size + 1), 20)],
+                learner_id=f"learner-{n % 5000}"
+            ))
+
+
+def timed(fn):
+    """Run fn once; return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    quizzes = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    bank = synthetic_bank(2000)
+
+    print("=" * 60)
+    print(f"Aggregation benchmark - {quizzes:,} quizzes ({quizzes * 20:,} responses)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / 'results.jsonl'
+        _, seconds = timed(lambda: write_log(log_path, quizzes, len(bank)))
+        size = sum(p.stat().st_size for p in Path(tmp).iterdir())
+        print(f"Log written: {size / 1e6:.0f} MB in {len(list(Path(tmp).iterdir()))} segment(s), {seconds:.1f} s")
+        shards = len(plan_shards(result_files([tmp])))
+        print(f"Shards: {shards} (a pool uses at most one process per shard)")
+
+        serial, serial_time = timed(lambda: aggregate_results([tmp], bank, workers=1))
+        print(f"\nserial:            {serial_time:6.2f} s")
+        parallel, parallel_time = timed(lambda: aggregate_results([tmp], bank, workers=workers))
+        if (os.cpu_count() or 1) > 1:
+            print(f"{workers:2d} workers:        {parallel_time:6.2f} s  (speedup x{serial_time / parallel_time:.1f})")
+        else:
+            # The pool processes share one CPU: their timing says nothing about scaling
+            print(f"{workers:2d} workers:        {parallel_time:6.2f} s  (1 CPU: speedup not measured)")
+
+        assert parallel.to_dict() == serial.to_dict()
+        print("\nAggregates identical: yes")
+
+
+if __name__ == "__main__":
+    main()
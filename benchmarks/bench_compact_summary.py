@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory and breakdown cost of in-memory quiz summaries.
+
+Builds the same long quizzes as QuizSummary objects, as lists of
+CompactResult tuples (the previous CompactQuizSummary storage) and as
+array-backed CompactQuizSummary objects, and reports the memory each
+representation holds (tracemalloc) and the time to read the
+per-difficulty breakdown of every summary twice.
+
+Usage:
+    python benchmarks/bench_compact_summary.py [num_summaries] [questions_per_quiz]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.models import CompactQuizSummary, CompactResult, Question, QuizResult, QuizSummary
+
+
+def synthetic_bank(count: int):
+    """Return a bank spread over sections and difficulties."""
+    return [
+        Question(id=i, section=f"{i % 12 + 1}.{i % 5 + 1}", section_title="Section",
+                 difficulty=("Easy", "Medium", "Hard")[i % 3], type="Multiple Choice",
+                 question=f"Question {i}?", options=["A", "B", "C", "D"], answer="A", explanation="")
+        for i in range(1, count + 1)
+    ]
+
+
+def measured(build):
+    """Return (objects, bytes allocated while building them)."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objects, size
+
+
+def timed(fn):
+    """Run fn once; return seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    bank = synthetic_bank(2000)
+    by_id = {q.id: q for q in bank}
+    rng = random.Random(0)
+    quizzes = [[(q, rng.random() < 0.6) for q in rng.sample(range(1, 2001), length)] for _ in range(count)]
+
+    print("=" * 60)
+    print(f"Summary benchmark - {count:,} quizzes of {length} questions")
+    print("=" * 60)
+
+    full, full_size = measured(lambda: [
+        QuizSummary(0, length, 0.0, [QuizResult(q, by_id[q].question, "A) A", "A", ok, by_id[q].difficulty)
+                                     for q, ok in quiz])
+        for quiz in quizzes])
+    tuples, tuples_size = measured(lambda: [[CompactResult(q, 0, ok) for q, ok in quiz] for quiz in quizzes])
+    packed, packed_size = measured(lambda: [
+        CompactQuizSummary([CompactResult(q, 0, ok) for q, ok in quiz]).classify(by_id) for quiz in quizzes])
+
+    print(f"QuizSummary:              {full_size / count:8.0f} bytes/summary")
+    print(f"list of CompactResult:    {tuples_size / count:8.0f} bytes/summary")
+    print(f"CompactQuizSummary:       {packed_size / count:8.0f} bytes/summary "
+          f"(x{tuples_size / packed_size:.1f} smaller than the tuples)")
+
+    def breakdowns(summaries):
+        for _ in range(2):
+            for summary in summaries:
+                summary.get_performance_by_difficulty()
+
+    print(f"\nbreakdown x2, QuizSummary:        {timed(lambda: breakdowns(full)):6.2f} s")
+    print(f"breakdown x2, CompactQuizSummary: {timed(lambda: breakdowns(packed)):6.2f} s (second pass cached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cohort results dashboard from a large results log.
+
+Writes a synthetic results log (one compact 20-question quiz per learner,
+spread over cohorts), applies it to ResultsViews, then renders the
+dashboard from the views. Reports the time of each step and the size of
+the generated page, which depends on cohorts and sections, not learners.
+
+Usage:
+    python benchmarks/bench_dashboard.py [num_learners] [num_cohorts]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.dashboard_exporter import export_results_dashboard
+from quizzmaker.models import CompactQuizSummary, CompactResult, Question
+from quizzmaker.results_log import ResultsLog
+from quizzmaker.results_views import ResultsViews
+
+
+def synthetic_bank(count: int):
+    """Return a bank spread over sections and difficulties."""
+    return [
+        Question(id=i, section=f"{i % 12 + 1}.{i % 5 + 1}", section_title="Section",
+                 difficulty=("Easy", "Medium", "Hard")[i % 3], type="Multiple Choice",
+                 question=f"Question {i}?", options=["A", "B", "C", "D"], answer="A", explanation="")
+        for i in range(1, count + 1)
+    ]
+
+
+def write_log(path: Path, learners: int, cohorts: int, bank_size: int) -> None:
+    """Write one 20-question compact quiz per learner."""
+    rng = random.Random(0)
+    with ResultsLog(path, flush_every=1000, fsync=False) as log:
+        for n in range(learners):
+            log.append(CompactQuizSummary(
+                [CompactResult(q, rng.randrange(4), rng.random() < 0.3 + 0.5 * q / bank_size)
+                 for q in rng.sample(range(1, bank_size + 1), 20)],
+                learner_id=f"learner-{n}", cohort=f"class-{n % cohorts:03d}"
+            ))
+
+
+def timed(fn):
+    """Run fn once; return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    learners = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    cohorts = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    bank = synthetic_bank(2000)
+
+    print("=" * 60)
+    print(f"Dashboard benchmark - {learners:,} learners in {cohorts} cohorts")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / 'results.jsonl'
+        _, seconds = timed(lambda: write_log(log_path, learners, cohorts, len(bank)))
+        print(f"Log written: {log_path.stat().st_size / 1e6:.0f} MB, {seconds:.1f} s")
+
+        with ResultsViews(Path(tmp) / 'views.sqlite3', bank) as views:
+            applied, catch_up_time = timed(lambda: views.catch_up(log_path))
+            print(f"\nviews catch-up:    {catch_up_time:6.2f} s  ({applied:,} quizzes)")
+            filename, render_time = timed(
+                lambda: export_results_dashboard(views, bank, str(Path(tmp) / 'dashboard.html')))
+            print(f"dashboard render:  {render_time:6.2f} s  ({Path(filename).stat().st_size / 1e3:.0f} kB)")
+            _, seconds = timed(lambda: views.catch_up(log_path))
+            print(f"no-op catch-up:    {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch grading of answer sheets.
+
+Generates synthetic answer sheets for one exam drawn from the bank
+(id -> answer, mixing option texts, bank-order letters and True/False
+words, with some questions left unanswered) and grades them with
+BatchGrader in batches, reporting the sustained sheets per minute.
+
+Usage:
+    python benchmarks/bench_grading.py [num_sheets] [questions_per_sheet] [batch_size]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.grading import BatchGrader
+from quizzmaker.models import Question
+
+
+def synthetic_bank(count: int):
+    """Return a bank of multiple choice and True/False questions."""
+    return [
+        Question(id=i, section=f"{i % 12 + 1}.{i % 5 + 1}", section_title="Section",
+                 difficulty=("Easy", "Medium", "Hard")[i % 3],
+                 type="Multiple Choice" if i % 4 else "True/False",
+                 question=f"Question {i}?", options=["Alpha", "Beta", "Gamma", "Delta"] if i % 4 else [],
+                 answer="Alpha" if i % 4 else "True", explanation="")
+        for i in range(1, count + 1)
+    ]
+
+
+def synthetic_sheets(count: int, exam):
+    """Return answer sheets for the exam, each skipping about one question in ten."""
+    rng = random.Random(0)
+    answers = ["Alpha", "Beta", "C", "d", "True", "F"]
+    return [{q: rng.choice(answers) for q in exam if rng.random() < 0.9} for _ in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 10_000
+    bank = synthetic_bank(2000)
+    exam = random.Random(1).sample(range(1, len(bank) + 1), length)
+    sheets = synthetic_sheets(count, exam)
+
+    print("=" * 60)
+    print(f"Grading benchmark - {count:,} sheets of a {length}-question exam")
+    print("=" * 60)
+
+    grader = BatchGrader(bank, question_ids=exam)
+    start = time.perf_counter()
+    graded = 0
+    for first in range(0, count, batch_size):
+        graded += len(grader.grade(sheets[first:first + batch_size]))
+    seconds = time.perf_counter() - start
+    print(f"graded {graded:,} sheets in {seconds:.2f} s: {graded / seconds * 60:,.0f} sheets/minute")
+
+
+if __name__ == "__main__":
+    main()
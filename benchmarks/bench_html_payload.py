@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JS-literal payload vs. application/json payload in exported quizzes.
+
+Generates a large synthetic quiz, then measures in Node.js how long the
+browser-side work takes to turn the embedded payload into the `questions`
+array:
+
+    - legacy:  `const questions = [...];` compiled and run as JavaScript
+    - json:    `JSON.parse(textContent)` of the <script type="application/json"> block
+
+Node is used as a stand-in for the page's script engine (same V8 parser as
+Chromium), which is the part of time-to-interactive the payload format
+controls. The script also reports the size of the generated HTML.
+
+Usage:
+    python benchmarks/bench_html_payload.py [num_questions] [repeats]
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.models import Question
+from quizzmaker.html_exporter import HTMLQuizExporter
+
+
+NODE_SCRIPT = r"""
+const fs = require('fs');
+const vm = require('vm');
+const [literalPath, jsonPath, repeats] = process.argv.slice(2);
+const literalSource = fs.readFileSync(literalPath, 'utf8');
+const jsonText = fs.readFileSync(jsonPath, 'utf8');
+
+function best(fn) {
+    let bestMs = Infinity;
+    for (let i = 0; i < Number(repeats); i++) {
+        const start = process.hrtime.bigint();
+        fn();
+        const ms = Number(process.hrtime.bigint() - start) / 1e6;
+        bestMs = Math.min(bestMs, ms);
+    }
+    return bestMs;
+}
+
+const legacy = best(() => {
+    // A fresh Script each time so V8 cannot reuse its compile cache.
+    const context = vm.createContext({});
+    new vm.Script(literalSource + '\n;questions.length', { filename: 'quiz-' + Math.random() + '.js' })
+        .runInContext(context);
+});
+const parsed = best(() => JSON.parse(jsonText).length);
+console.log(JSON.stringify({ legacy, parsed }));
+"""
+
+
+def make_questions(count: int):
+    """Build a synthetic bank with realistic text lengths."""
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 3
+    questions = []
+    for i in range(1, count + 1):
+        questions.append(Question(
+            id=i,
+            section=f"{i % 12 + 1}.{i % 5 + 1}",
+            section_title=f"Section {i % 12 + 1}",
+            difficulty=("Easy", "Medium", "Hard")[i % 3],
+            type="Multiple Choice",
+            question=f"Question {i}: {filler}</script>?",
+            options=[f"Option {c} for {i}" for c in "ABCD"],
+            answer=f"Option A for {i}",
+            explanation=f"Explanation {i}: {filler}"
+        ))
+    return questions
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print("=" * 60)
+    print(f"Payload benchmark - {count} questions, best of {repeats}")
+    print("=" * 60)
+
+    exporter = HTMLQuizExporter(make_questions(count))
+    start = time.perf_counter()
+    payload = exporter._questions_to_json()
+    print(f"Python serialization: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"Payload size: {len(payload.encode('utf-8')) / 1e6:.2f} MB")
+
+    node = shutil.which('node')
+    if node is None:
+        print("⚠️  Node.js not found: skipping parse timings")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        literal_path = Path(tmp) / 'literal.js'
+        json_path = Path(tmp) / 'payload.json'
+        script_path = Path(tmp) / 'bench.js'
+        # The legacy exporter inlined the raw JSON as a JS literal.
+        literal_path.write_text(f"const questions = {payload};", encoding='utf-8')
+        json_path.write_text(payload, encoding='utf-8')
+        script_path.write_text(NODE_SCRIPT, encoding='utf-8')
+
+        output = subprocess.run([node, str(script_path), str(literal_path), str(json_path), str(repeats)],
+                                check=True, capture_output=True, text=True).stdout
+        timings = json.loads(output)
+
+    print(f"JS literal (compile + run): {timings['legacy']:.1f} ms")
+    print(f"JSON.parse:                 {timings['parsed']:.1f} ms")
+    print(f"Speedup:                    {timings['legacy'] / timings['parsed']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
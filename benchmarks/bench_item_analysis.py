@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized item analysis over a large response matrix.
+
+Builds a synthetic learner x question response matrix (COO arrays) and
+measures ResponseMatrix.item_statistics (p-value, point-biserial,
+option counts), then the CSV report. A smaller results log is also
+written and loaded back to measure the streamed JSONL reading.
+
+Usage:
+    python benchmarks/bench_item_analysis.py [num_responses]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.item_analysis import ResponseMatrix
+from quizzmaker.models import CompactQuizSummary, CompactResult
+from quizzmaker.results_log import ResultsLog
+
+
+def synthetic_responses(count: int, learners: int, questions: int, seed: int = 0):
+    """Return COO arrays where abler learners answer harder questions correctly."""
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, learners, count)
+    cols = rng.integers(0, questions, count)
+    ability = rng.normal(size=learners)
+    difficulty = rng.normal(size=questions)
+    correct = rng.random(count) < 1 / (1 + np.exp(difficulty[cols] - ability[rows]))
+    answers = np.where(correct, 0, rng.integers(1, 4, count))
+    return rows, cols, answers, correct
+
+
+def timed(fn):
+    """Run fn once; return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    learners, questions = max(count // 50, 1), 5000
+
+    print("=" * 60)
+    print(f"Item analysis benchmark - {count:,} responses, {learners:,} learners, {questions:,} questions")
+    print("=" * 60)
+
+    rows, cols, answers, correct = synthetic_responses(count, learners, questions)
+    matrix = ResponseMatrix(rows, cols, answers, correct, list(range(learners)), np.arange(questions))
+    stats, seconds = timed(matrix.item_statistics)
+    print(f"item_statistics:  {seconds:6.2f} s  ({count / seconds / 1e6:.1f} M responses/s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _, seconds = timed(lambda: stats.write_csv(Path(tmp) / 'items.csv'))
+        print(f"CSV report:       {seconds:6.2f} s")
+
+        # Log round trip on a sample: JSON decoding dominates
+        sample = min(count, 1_000_000)
+        log_path = Path(tmp) / 'results.jsonl'
+        with ResultsLog(log_path, flush_every=1000, fsync=False) as log:
+            for start in range(0, sample, 20):
+                stop = min(start + 20, sample)
+                log.append(CompactQuizSummary(
+                    [CompactResult(int(q), int(a), bool(c))
+                     for q, a, c in zip(cols[start:stop], answers[start:stop], correct[start:stop])],
+                    learner_id=f"learner-{rows[start]}"
+                ))
+        loaded, seconds = timed(lambda: ResponseMatrix.from_log(log_path))
+        print(f"from_log:         {seconds:6.2f} s  ({len(loaded) / seconds / 1e6:.2f} M responses/s, "
+              f"{log_path.stat().st_size / 1e6:.0f} MB log)")
+
+
+if __name__ == "__main__":
+    main()
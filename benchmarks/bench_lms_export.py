@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming GIFT / QTI export throughput and memory.
+
+Writes a synthetic bank of mixed question types to a CSV file (streamed
+with the csv module), then measures for each LMS format:
+
+    - throughput of write_gift / write_qti from an in-memory list
+    - end-to-end CSV -> LMS conversion with iter_questions_from_csv
+    - peak Python memory (tracemalloc) of the streamed conversion, which
+      should stay flat as the bank grows
+
+Usage:
+    python benchmarks/bench_lms_export.py [num_questions]
+"""
+
+import csv
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.lms_export import iter_questions_from_csv, write_gift, write_qti
+from quizzmaker.models import Question
+
+
+def iter_synthetic_questions(count: int):
+    """Yield a synthetic bank with realistic text lengths and special characters."""
+    filler = "Lorem ipsum {dolor} sit amet: consectetur <adipiscing> & elit = 1. " * 2
+    for i in range(1, count + 1):
+        kind = ("Multiple Choice", "True/False", "Short Answer")[i % 3]
+        options = {
+            "Multiple Choice": [f"Option {c} for {i}" for c in "ABCD"],
+            "True/False": [],
+            "Short Answer": [],
+        }[kind]
+        answer = {"Multiple Choice": f"Option A for {i}", "True/False": "True", "Short Answer": f"answer {i}"}[kind]
+        yield Question(
+            id=i,
+            section=f"{i % 12 + 1}.{i % 5 + 1}",
+            section_title=f"Section {i % 12 + 1}",
+            difficulty=("Easy", "Medium", "Hard")[i % 3],
+            type=kind,
+            question=f"Question {i}: {filler}?",
+            options=options,
+            answer=answer,
+            explanation=f"Explanation {i}: {filler}"
+        )
+
+
+def write_csv(path: Path, count: int) -> None:
+    """Write the synthetic bank in the CSV layout of QuestionGenerator.save_to_csv."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = None
+        for question in iter_synthetic_questions(count):
+            row = question.to_dict()
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+
+
+def timed(fn):
+    """Run fn once; return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    print("=" * 60)
+    print(f"LMS export benchmark - {count} questions")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / 'bank.csv'
+        _, seconds = timed(lambda: write_csv(csv_path, count))
+        print(f"CSV bank written: {csv_path.stat().st_size / 1e6:.1f} MB in {seconds:.2f} s")
+
+        questions = list(iter_synthetic_questions(count))
+        for name, writer, suffix in (("GIFT", write_gift, '.gift'), ("QTI", write_qti, '.xml')):
+            out_path = tmp / f'bank{suffix}'
+            _, seconds = timed(lambda: writer(questions, out_path))
+            size = out_path.stat().st_size / 1e6
+            print(f"\n{name} from list:  {count / seconds:10,.0f} questions/s  "
+                  f"{size / seconds:6.1f} MB/s  ({size:.1f} MB)")
+
+            tracemalloc.start()
+            _, seconds = timed(lambda: writer(iter_questions_from_csv(csv_path), out_path))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name} from CSV:   {count / seconds:10,.0f} questions/s  "
+                  f"peak memory {peak / 1e6:.2f} MB (tracemalloc slows this run)")
+
+
+if __name__ == "__main__":
+    main()
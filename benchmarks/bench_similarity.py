@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark: all-pairs answer similarity over an exam.
+
+Generates random answer sheets (a few of them copied from others), then
+times find_similar_pairs, which counts shared wrong answers of every pair
+with blocked float32 matrix products, and checks the copied pairs come
+out on top.
+
+Usage:
+    python benchmarks/bench_similarity.py [num_sheets] [num_questions] [workers]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from quizzmaker.item_analysis import ResponseMatrix
+from quizzmaker.similarity import find_similar_pairs
+
+
+def synthetic_exam(sheets: int, questions: int, copies: int, seed: int = 0) -> ResponseMatrix:
+    """Return an exam where option 0 is correct and `copies` sheets copy another one."""
+    rng = np.random.default_rng(seed)
+    answers = np.where(rng.random((sheets, questions)) < 0.6, 0, rng.integers(1, 4, (sheets, questions)))
+    for k in range(copies):
+        answers[2 * k + 1, : questions * 3 // 4] = answers[2 * k, : questions * 3 // 4]
+    learners = np.repeat(np.arange(sheets), questions)
+    question_ids = np.tile(np.arange(questions), sheets)
+    return ResponseMatrix.from_arrays(learners, question_ids, answers.ravel(), answers.ravel() == 0)
+
+
+def main():
+    sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    questions = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    copies = 5
+
+    print("=" * 60)
+    print(f"Similarity benchmark - {sheets:,} sheets x {questions} questions "
+          f"({sheets * (sheets - 1) // 2:,} pairs)")
+    print("=" * 60)
+
+    matrix = synthetic_exam(sheets, questions, copies)
+    start = time.perf_counter()
+    pairs = find_similar_pairs(matrix, top_k=10, workers=workers)
+    seconds = time.perf_counter() - start
+    print(f"find_similar_pairs: {seconds:6.2f} s with {workers} worker(s)")
+
+    found = {(int(p.learner_a), int(p.learner_b)) for p in pairs[:copies]}
+    print(f"Planted copies ranked first: {found == {(2 * k, 2 * k + 1) for k in range(copies)}}")
+    for pair in pairs[:copies + 2]:
+        print(f"   {pair.learner_a:>6} / {pair.learner_b:<6} shared wrong {pair.shared_wrong:3d} "
+              f"({pair.shared_wrong_ratio:.0%}), identical {pair.identical}/{pair.common}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,7 @@ Usage basique:
 __version__ = "1.0.0"
 __author__ = "Système de Quiz"
 
-from quizzmaker.models import Question, QuizResult, QuizSummary
+from quizzmaker.models import CompactQuizSummary, CompactResult, Question, QuizResult, QuizSummary
 from quizzmaker.question_generator import QuestionGenerator
 from quizzmaker.quiz_runner import QuizRunner
 
@@ -34,6 +34,8 @@ __all__ = [
     'Question',
     'QuizResult', 
     'QuizSummary',
+    'CompactResult',
+    'CompactQuizSummary',
     'QuestionGenerator',
     'QuizRunner'
 ]
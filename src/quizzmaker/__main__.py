@@ -0,0 +1,7 @@
+"""Permet d'exécuter ``python -m quizzmaker``."""
+
+import sys
+
+from quizzmaker.cli import main
+
+sys.exit(main())
@@ -0,0 +1,398 @@
+"""
+Module d'agrégation des résultats de quiz en map-reduce.
+
+Ce module calcule les scores par section, par difficulté, par question et
+l'histogramme des scores sur l'ensemble des fichiers de résultats (JSON de
+QuizRunner.save_results et segments JSONL de ResultsLog). Les fichiers
+sont découpés en tranches traitées par un pool de processus ; chaque
+tranche produit un agrégat partiel (des compteurs) et les agrégats
+partiels sont fusionnés. Le résultat est identique à un calcul en série.
+Les fichiers JSON qui ne sont pas des résultats (manifeste, configuration,
+fichier corrompu) sont ignorés et signalés dans l'agrégat.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import reduce
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+import json
+import os
+
+from quizzmaker.models import QuestionBank, questions_by_id
+
+# Tranche maximale d'un fichier JSONL confiée à un processus
+SHARD_BYTES = 32 * 1024 * 1024
+# Section des questions absentes de la banque
+UNKNOWN_SECTION = ''
+HISTOGRAM_BINS = 11
+
+Shard = Tuple[str, int, int]
+Lookup = Dict[int, Tuple[str, str]]
+
+# Section et difficulté par question, installées dans chaque processus
+_worker_lookup: Lookup = {}
+
+
+@dataclass
+class ResultsAggregate:
+    """
+    Agrégat fusionnable des résultats : uniquement des compteurs.
+
+    Attributs:
+        quizzes (int): Nombre de quiz agrégés
+        by_section_difficulty (Dict[Tuple[str, str], List[int]]): [bonnes
+            réponses, réponses] par (section, difficulté)
+        by_question (Dict[int, List[int]]): [bonnes réponses, réponses] par question
+        score_histogram (List[int]): Quiz par tranche de 10 % de score
+            (dernière case : 100 %)
+        skipped_files (List[str]): Fichiers ignorés, en tout ou en partie,
+            car ce ne sont pas des résultats de quiz
+    """
+    quizzes: int = 0
+    by_section_difficulty: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)
+    by_question: Dict[int, List[int]] = field(default_factory=dict)
+    score_histogram: List[int] = field(default_factory=lambda: [0] * HISTOGRAM_BINS)
+    skipped_files: List[str] = field(default_factory=list)
+
+    def add_response(self, question_id: int, section: str, difficulty: str, is_correct: bool) -> None:
+        """
+        Ajoute une réponse à l'agrégat.
+
+        Args:
+            question_id (int): ID de la question
+            section (str): Section de la question
+            difficulty (str): Difficulté de la question
+            is_correct (bool): Si la réponse est correcte
+        """
+        self.add_counts(question_id, section, difficulty, int(is_correct), 1)
+
+    def add_counts(self, question_id: int, section: str, difficulty: str, correct: int, total: int) -> None:
+        """
+        Ajoute plusieurs réponses à une même question.
+
+        Args:
+            question_id (int): ID de la question
+            section (str): Section de la question
+            difficulty (str): Difficulté de la question
+            correct (int): Nombre de bonnes réponses
+            total (int): Nombre de réponses
+        """
+        for counters, key in ((self.by_section_difficulty, (section, difficulty)),
+                              (self.by_question, question_id)):
+            counts = counters.get(key)
+            if counts is None:
+                counters[key] = [correct, total]
+            else:
+                counts[0] += correct
+                counts[1] += total
+
+    def add_quiz(self, score: int, total: int) -> None:
+        """
+        Compte un quiz dans l'histogramme des scores.
+
+        Args:
+            score (int): Nombre de bonnes réponses
+            total (int): Nombre de questions
+        """
+        self.quizzes += 1
+        if total:
+            self.score_histogram[min(score * 10 // total, HISTOGRAM_BINS - 1)] += 1
+
+    def merge(self, other: 'ResultsAggregate') -> 'ResultsAggregate':
+        """
+        Ajoute les compteurs d'un autre agrégat à celui-ci.
+
+        Args:
+            other (ResultsAggregate): Agrégat partiel à fusionner
+
+        Returns:
+            ResultsAggregate: Cet agrégat (pour functools.reduce)
+        """
+        self.quizzes += other.quizzes
+        for mine, theirs in ((self.by_section_difficulty, other.by_section_difficulty),
+                             (self.by_question, other.by_question)):
+            for key, (correct, total) in theirs.items():
+                counts = mine.get(key)
+                if counts is None:
+                    mine[key] = [correct, total]
+                else:
+                    counts[0] += correct
+                    counts[1] += total
+        self.score_histogram = [a + b for a, b in zip(self.score_histogram, other.score_histogram)]
+        # Un fichier coupé en tranches peut être signalé par plusieurs tranches
+        self.skipped_files += [path for path in other.skipped_files if path not in self.skipped_files]
+        return self
+
+    def by_section(self) -> Dict[str, List[int]]:
+        """Retourne [bonnes réponses, réponses] par section."""
+        return self._rollup(0)
+
+    def by_difficulty(self) -> Dict[str, List[int]]:
+        """Retourne [bonnes réponses, réponses] par difficulté."""
+        return self._rollup(1)
+
+    def to_dict(self) -> dict:
+        """
+        Convertit l'agrégat en dictionnaire (clés triées) pour sauvegarde JSON.
+
+        Returns:
+            dict: Compteurs et pourcentages de réussite par section,
+            difficulté, section × difficulté et question
+        """
+        def rates(counts: dict) -> dict:
+            return {str(key): {'correct': c, 'total': t, 'percentage': round(c / t * 100, 2)}
+                    for key, (c, t) in sorted(counts.items())}
+
+        return {
+            'quizzes': self.quizzes,
+            'by_section': rates(self.by_section()),
+            'by_difficulty': rates(self.by_difficulty()),
+            'by_section_difficulty': {
+                section: rates({d: counts for (s, d), counts in self.by_section_difficulty.items()
+                                if s == section})
+                for section in sorted(self.by_section())
+            },
+            'by_question': rates(self.by_question),
+            'score_histogram': self.score_histogram,
+        }
+
+    def _rollup(self, axis: int) -> Dict[str, List[int]]:
+        """Somme les compteurs section × difficulté sur un des deux axes."""
+        totals: Dict[str, List[int]] = {}
+        for key, (correct, total) in self.by_section_difficulty.items():
+            counts = totals.setdefault(key[axis], [0, 0])
+            counts[0] += correct
+            counts[1] += total
+        return totals
+
+
+def result_files(sources: Iterable[Union[str, Path]]) -> List[Path]:
+    """
+    Liste les fichiers de résultats de fichiers et dossiers.
+
+    Args:
+        sources (Iterable[Union[str, Path]]): Fichiers, ou dossiers parcourus
+            récursivement (fichiers *.json et *.jsonl ; les documents JSON
+            qui ne sont pas des résultats de quiz sont ignorés à l'agrégation
+            et listés dans ResultsAggregate.skipped_files)
+
+    Returns:
+        List[Path]: Fichiers de résultats, triés
+    """
+    files = []
+    for source in map(Path, sources):
+        if source.is_dir():
+            files.extend(p for p in source.rglob('*') if p.suffix in ('.json', '.jsonl') and p.is_file())
+        else:
+            files.append(source)
+    return sorted(files)
+
+
+def plan_shards(files: Iterable[Union[str, Path]], shard_bytes: int = SHARD_BYTES) -> List[Shard]:
+    """
+    Découpe les fichiers de résultats en tranches (fichier, début, fin).
+
+    Un fichier JSONL est coupé en tranches d'environ shard_bytes octets ;
+    chaque ligne appartient à la tranche où elle commence. Un fichier JSON
+    forme une seule tranche.
+
+    Args:
+        files (Iterable[Union[str, Path]]): Fichiers de résultats
+        shard_bytes (int): Taille maximale d'une tranche
+
+    Returns:
+        List[Shard]: Tranches à agréger
+    """
+    shards = []
+    for path in map(str, files):
+        size = os.path.getsize(path)
+        if not path.endswith('.jsonl'):
+            shards.append((path, 0, size))
+            continue
+        shards.extend((path, start, min(start + shard_bytes, size)) for start in range(0, size, shard_bytes))
+    return shards
+
+
+def aggregate_results(sources: Iterable[Union[str, Path]], bank: Optional[QuestionBank] = None,
+                      workers: Optional[int] = None, shard_bytes: int = SHARD_BYTES) -> ResultsAggregate:
+    """
+    Agrège des fichiers de résultats en parallèle (map-reduce).
+
+    Args:
+        sources (Iterable[Union[str, Path]]): Fichiers ou dossiers de résultats
+        bank (Optional[QuestionBank]): Banque donnant la section (et la
+            difficulté des résultats compacts) de chaque question
+        workers (Optional[int]): Nombre de processus (nombre de CPU si None,
+            1 pour un calcul en série dans le processus courant)
+        shard_bytes (int): Taille maximale d'une tranche de fichier JSONL
+
+    Returns:
+        ResultsAggregate: Agrégat de tous les résultats
+
+    Example:
+        >>> aggregate = aggregate_results(["results/"], bank, workers=8)
+        >>> aggregate.by_section()
+        {'1.1': [812, 1024], ...}
+    """
+    lookup = question_lookup(bank)
+    shards = plan_shards(result_files(sources), shard_bytes)
+
+    workers = min(workers or os.cpu_count() or 1, max(len(shards), 1))
+    if workers == 1:
+        partials = [_aggregate_shard(shard, lookup) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(lookup,)) as pool:
+            partials = list(pool.map(_aggregate_shard, shards,
+                                     chunksize=max(1, len(shards) // (workers * 4))))
+    return reduce(ResultsAggregate.merge, partials, ResultsAggregate())
+
+
+def question_lookup(bank: Optional[QuestionBank]) -> Lookup:
+    """
+    Retourne la section et la difficulté de chaque question de la banque.
+
+    Args:
+        bank (Optional[QuestionBank]): Banque de questions
+
+    Returns:
+        Lookup: (section, difficulté) par ID de question
+    """
+    return {qid: (q.section, q.difficulty) for qid, q in questions_by_id(bank or []).items()}
+
+
+def aggregate_records(records: Iterable[dict], lookup: Lookup) -> ResultsAggregate:
+    """
+    Agrège des résumés sérialisés (dictionnaires to_dict, complets ou compacts).
+
+    Les réponses compactes sont comptées par question (en C, par
+    Counter.update), puis réparties par section et difficulté à la fin.
+
+    Args:
+        records (Iterable[dict]): Enregistrements (ex: results_log.iter_records)
+        lookup (Lookup): Table produite par question_lookup
+
+    Returns:
+        ResultsAggregate: Agrégat des enregistrements
+    """
+    return aggregate_records_by(records, lookup, lambda record: None).get(None, ResultsAggregate())
+
+
+def aggregate_records_by(records: Iterable[dict], lookup: Lookup,
+                         key: Callable[[dict], Hashable]) -> Dict[Hashable, ResultsAggregate]:
+    """
+    Agrège des résumés sérialisés en un agrégat par groupe, en un seul passage.
+
+    Args:
+        records (Iterable[dict]): Enregistrements (ex: results_log.iter_records)
+        lookup (Lookup): Table produite par question_lookup
+        key (Callable[[dict], Hashable]): Groupe d'un enregistrement (ex: son cohort)
+
+    Returns:
+        Dict[Hashable, ResultsAggregate]: Agrégat par groupe
+    """
+    groups: Dict[Hashable, Tuple[ResultsAggregate, Counter, Counter]] = {}
+    for record in records:
+        group = key(record)
+        state = groups.get(group)
+        if state is None:
+            state = groups[group] = (ResultsAggregate(), Counter(), Counter())
+        aggregate, answered, correct = state
+        if 'responses' in record:
+            responses = record['responses']
+            answered.update([r[0] for r in responses])
+            right = [r[0] for r in responses if r[2]]
+            correct.update(right)
+            aggregate.add_quiz(len(right), len(responses))
+        elif 'results' in record:
+            for result in record['results']:
+                qid = result['question_id']
+                section = lookup.get(qid, (UNKNOWN_SECTION,))[0]
+                aggregate.add_response(qid, section, result['difficulty'], bool(result['is_correct']))
+            aggregate.add_quiz(record['score'], record['total'])
+
+    for aggregate, answered, correct in groups.values():
+        for qid, total in answered.items():
+            section, difficulty = lookup.get(qid, (UNKNOWN_SECTION, ''))
+            aggregate.add_counts(qid, section, difficulty, correct[qid], total)
+    return {group: aggregate for group, (aggregate, _, _) in groups.items()}
+
+
+def _init_worker(lookup: Lookup) -> None:
+    """Installe la table des questions dans un processus du pool (une seule fois)."""
+    global _worker_lookup
+    _worker_lookup = lookup
+
+
+def _aggregate_shard(shard: Shard, lookup: Optional[Lookup] = None) -> ResultsAggregate:
+    """Agrège une tranche de fichier (phase map)."""
+    skipped: List[str] = []
+    aggregate = aggregate_records(_shard_records(shard, skipped), _worker_lookup if lookup is None else lookup)
+    aggregate.skipped_files = skipped
+    return aggregate
+
+
+def _shard_records(shard: Shard, skipped: List[str]) -> Iterator[dict]:
+    """
+    Décode les résumés de quiz d'une tranche de fichier.
+
+    Un document (ou une ligne) qui n'est pas un résumé est ignoré, et son
+    fichier ajouté une fois à skipped.
+    """
+    path, start, end = shard
+    if not path.endswith('.jsonl'):
+        try:
+            with open(path, encoding='utf-8') as f:
+                record = json.load(f)
+        except ValueError:  # JSON invalide ou texte mal encodé
+            record = None
+        if _is_summary(record):
+            yield record
+        else:
+            skipped.append(path)
+        return
+
+    with open(path, 'rb') as f:
+        if start:
+            # La ligne coupée par le début de la tranche appartient à la précédente
+            f.seek(start - 1)
+            if f.read(1) != b'\n':
+                f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if _is_summary(record):
+                yield record
+            elif not skipped:
+                skipped.append(path)
+
+
+def _is_summary(record) -> bool:
+    """
+    Indique si un document JSON décodé est un résumé de quiz (complet ou compact).
+
+    Les réponses sont vérifiées une à une : un document qui a la forme d'un
+    résumé mais dont une réponse n'a pas les champs lus à l'agrégation est
+    ignoré plutôt que d'interrompre l'agrégation de tous les fichiers.
+    """
+    if not isinstance(record, dict):
+        return False
+    responses = record.get('responses')
+    if isinstance(responses, list):
+        return all(isinstance(r, list) and len(r) >= 3 and _is_int(r[0]) for r in responses)
+    results = record.get('results')
+    return (isinstance(results, list) and _is_int(record.get('score')) and _is_int(record.get('total'))
+            and all(isinstance(r, dict) and _is_int(r.get('question_id')) and 'is_correct' in r
+                    and isinstance(r.get('difficulty'), str) for r in results))
+
+
+def _is_int(value) -> bool:
+    """Indique si une valeur JSON est un entier (et non un booléen)."""
+    return isinstance(value, int) and not isinstance(value, bool)
@@ -0,0 +1,257 @@
+"""
+Module de recalibrage empirique de la difficulté des questions.
+
+Ce module estime la difficulté de chaque question à partir des résultats
+(modèle de Rasch / 1PL : P(correct) = sigmoïde(aptitude - difficulté)),
+met les estimations à jour de façon incrémentale à partir des nouveaux
+enregistrements d'un journal, et propose de nouveaux libellés de
+difficulté ("Easy", "Medium", "Hard") pour la banque de questions.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import json
+import os
+
+import numpy as np
+
+from quizzmaker.item_analysis import ResponseMatrix
+from quizzmaker.models import Question, QuestionBank, questions_by_id
+from quizzmaker.results_log import LogCursor
+
+CALIBRATION_NAME = 'quizzmaker-calibration.json'
+
+
+@dataclass
+class LabelChange:
+    """
+    Changement de libellé de difficulté proposé pour une question.
+
+    Attributs:
+        question_id (int): ID de la question
+        current (str): Libellé actuel (choisi par l'auteur)
+        proposed (str): Libellé estimé à partir des résultats
+        difficulty (float): Difficulté estimée (logits, 0 = apprenant moyen)
+        responses (int): Nombre de réponses prises en compte
+    """
+    question_id: int
+    current: str
+    proposed: str
+    difficulty: float
+    responses: int
+
+
+class RaschCalibrator:
+    """
+    Estimation incrémentale des difficultés de Rasch (1PL).
+
+    Chaque mise à jour ajuste aptitudes et difficultés sur les seules
+    nouvelles réponses, par itérations de Newton vectorisées, avec pour a
+    priori les estimations précédentes (moyenne et précision). L'historique
+    n'est jamais relu : l'état (estimations et position dans le journal) est
+    sauvegardé dans un fichier JSON.
+
+    Example:
+        >>> calibrator = RaschCalibrator.load("quizzmaker-calibration.json")
+        >>> calibrator.update_from_log("results.jsonl", bank)
+        >>> calibrator.save()
+        >>> for change in calibrator.propose_labels(bank):
+        ...     print(change.question_id, change.current, "->", change.proposed)
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path] = CALIBRATION_NAME, prior_sd: float = 1.5,
+                 cutpoints: Tuple[float, float] = (-0.5, 0.5)):
+        """
+        Initialise un calibrage vide.
+
+        Args:
+            path (Union[str, Path]): Fichier d'état du calibrage
+            prior_sd (float): Écart-type a priori (logits) des aptitudes et
+                difficultés jamais observées
+            cutpoints (Tuple[float, float]): Difficultés séparant "Easy" de
+                "Medium" et "Medium" de "Hard"
+        """
+        self.path = Path(path)
+        self.prior_sd = prior_sd
+        self.cutpoints = cutpoints
+        # question_id -> [difficulté, précision, réponses]
+        self.items: Dict[int, list] = {}
+        # learner_id -> [aptitude, précision]
+        self.learners: Dict[str, list] = {}
+        self.cursor = LogCursor()
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = CALIBRATION_NAME, **options) -> 'RaschCalibrator':
+        """
+        Charge un état sauvegardé, ou crée un calibrage vide si le fichier n'existe pas.
+
+        Args:
+            path (Union[str, Path]): Fichier d'état du calibrage
+            **options: Options de __init__ (prior_sd, cutpoints)
+
+        Returns:
+            RaschCalibrator: Calibrage chargé
+        """
+        calibrator = cls(path, **options)
+        if calibrator.path.exists():
+            data = json.loads(calibrator.path.read_text(encoding='utf-8'))
+            if data.get('version') != cls.VERSION:
+                raise ValueError(f"Version d'état de calibrage non supportée dans {path}: {data.get('version')}")
+            calibrator.items = {int(qid): item for qid, item in data['items'].items()}
+            calibrator.learners = data['learners']
+            calibrator.cursor = LogCursor.from_dict(data['cursor'])
+        return calibrator
+
+    def save(self) -> None:
+        """Écrit l'état atomiquement (un arrêt brutal ne laisse pas de fichier tronqué)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': self.VERSION, 'items': self.items, 'learners': self.learners,
+                'cursor': self.cursor.to_dict()}
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+    def update_from_log(self, log_path: Union[str, Path], bank: Optional[QuestionBank] = None) -> int:
+        """
+        Met les estimations à jour avec les enregistrements ajoutés au journal
+        depuis la mise à jour précédente.
+
+        Args:
+            log_path (Union[str, Path]): Fichier actif du journal de résultats
+            bank (Optional[QuestionBank]): Banque (pour coder les enregistrements complets)
+
+        Returns:
+            int: Nombre de nouvelles réponses prises en compte
+        """
+        matrix = ResponseMatrix.from_records(self.cursor.read(log_path), bank)
+        self.update(matrix)
+        return len(matrix)
+
+    def update(self, matrix: ResponseMatrix, max_iter: int = 50, tol: float = 1e-6) -> None:
+        """
+        Ajuste aptitudes et difficultés sur un lot de réponses.
+
+        Maximise la vraisemblance a posteriori du lot : itérations de Newton
+        alternées sur les aptitudes puis les difficultés (hessiennes
+        diagonales calculées par np.bincount). La précision obtenue devient
+        l'a priori de la mise à jour suivante. Les apprenants anonymes sont
+        estimés dans le lot mais ne sont pas conservés.
+
+        Args:
+            matrix (ResponseMatrix): Nouvelles réponses
+            max_iter (int): Nombre maximal d'itérations
+            tol (float): Arrêt quand aucune estimation ne bouge de plus de tol
+        """
+        if not len(matrix):
+            return
+        rows, cols = matrix.learner_index, matrix.question_index
+        x = matrix.correct.astype(np.float64)
+        n_learners, n_questions = matrix.shape
+        new_precision = 1.0 / self.prior_sd ** 2
+
+        theta_prior = np.array([self.learners.get(lid, (0.0, new_precision)) if lid is not None
+                                else (0.0, new_precision)
+                                for lid in matrix.learner_ids]).reshape(-1, 2)
+        b_prior = np.array([self.items.get(qid, (0.0, new_precision))[:2]
+                            for qid in matrix.question_ids.tolist()]).reshape(-1, 2)
+        theta, b = theta_prior[:, 0].copy(), b_prior[:, 0].copy()
+
+        for _ in range(max_iter):
+            # Aptitudes : dérivées de la log-vraisemblance + a priori gaussien
+            p = _sigmoid(theta[rows] - b[cols])
+            gradient = (np.bincount(rows, weights=x - p, minlength=n_learners)
+                        - theta_prior[:, 1] * (theta - theta_prior[:, 0]))
+            theta_hessian = np.bincount(rows, weights=p * (1 - p), minlength=n_learners) + theta_prior[:, 1]
+            theta_step = gradient / theta_hessian
+            theta += theta_step
+
+            # Difficultés : même calcul, de signe opposé
+            p = _sigmoid(theta[rows] - b[cols])
+            gradient = (-np.bincount(cols, weights=x - p, minlength=n_questions)
+                        - b_prior[:, 1] * (b - b_prior[:, 0]))
+            b_hessian = np.bincount(cols, weights=p * (1 - p), minlength=n_questions) + b_prior[:, 1]
+            b_step = gradient / b_hessian
+            b += b_step
+
+            if max(np.abs(theta_step).max(), np.abs(b_step).max()) < tol:
+                break
+
+        responses = np.bincount(cols, minlength=n_questions)
+        for i, qid in enumerate(matrix.question_ids.tolist()):
+            previous = self.items.get(qid, (0.0, 0.0, 0))[2]
+            self.items[qid] = [float(b[i]), float(b_hessian[i]), previous + int(responses[i])]
+        for i, lid in enumerate(matrix.learner_ids):
+            if lid is not None:
+                self.learners[lid] = [float(theta[i]), float(theta_hessian[i])]
+
+    def difficulties(self) -> Dict[int, float]:
+        """
+        Retourne la difficulté estimée de chaque question observée.
+
+        Returns:
+            Dict[int, float]: Difficulté (logits) par ID de question
+        """
+        return {qid: item[0] for qid, item in self.items.items()}
+
+    def label(self, difficulty: float) -> str:
+        """
+        Convertit une difficulté estimée en libellé.
+
+        Args:
+            difficulty (float): Difficulté en logits
+
+        Returns:
+            str: "Easy", "Medium" ou "Hard"
+        """
+        low, high = self.cutpoints
+        if difficulty < low:
+            return 'Easy'
+        if difficulty > high:
+            return 'Hard'
+        return 'Medium'
+
+    def propose_labels(self, bank: QuestionBank, min_responses: int = 30) -> List[LabelChange]:
+        """
+        Propose les libellés de difficulté qui diffèrent de ceux de la banque.
+
+        Args:
+            bank (QuestionBank): Banque de questions
+            min_responses (int): Réponses minimales pour proposer un changement
+
+        Returns:
+            List[LabelChange]: Changements proposés, par ID de question
+        """
+        changes = []
+        for qid, question in sorted(questions_by_id(bank).items()):
+            item = self.items.get(qid)
+            if item is None or item[2] < min_responses:
+                continue
+            proposed = self.label(item[0])
+            if proposed != question.difficulty:
+                changes.append(LabelChange(qid, question.difficulty, proposed, item[0], item[2]))
+        return changes
+
+    def apply_labels(self, bank: QuestionBank, min_responses: int = 30) -> List[LabelChange]:
+        """
+        Applique les libellés proposés aux questions de la banque.
+
+        Args:
+            bank (QuestionBank): Banque de questions (modifiée sur place)
+            min_responses (int): Réponses minimales pour changer un libellé
+
+        Returns:
+            List[LabelChange]: Changements appliqués
+        """
+        by_id: Dict[int, Question] = questions_by_id(bank)
+        changes = self.propose_labels(by_id, min_responses)
+        for change in changes:
+            by_id[change.question_id].difficulty = change.proposed
+        return changes
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    """Fonction logistique, sans dépassement pour les grandes valeurs."""
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
@@ -0,0 +1,453 @@
+"""
+Interface en ligne de commande du système de quiz.
+
+Usage:
+    python -m quizzmaker reexport questions.csv --manifest site/quizzmaker-manifest.json
+    python -m quizzmaker site questions.csv site/ --per-page 10
+    python -m quizzmaker lms questions.csv moodle.gift
+    python -m quizzmaker items resultats.jsonl questions.csv -o rapport_items.csv
+    python -m quizzmaker calibrate resultats.jsonl questions.csv --apply
+    python -m quizzmaker aggregate resultats/ --bank questions.csv -o rapport.json
+    python -m quizzmaker similarity examen.jsonl --bank questions.csv -k 20 -o paires.csv
+    python -m quizzmaker dashboard resultats.jsonl questions.csv --views vues.sqlite3 -o tableau.html
+    python -m quizzmaker grade feuilles.jsonl questions.csv -o resultats.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+
+from quizzmaker.aggregation import aggregate_results
+from quizzmaker.calibration import CALIBRATION_NAME, RaschCalibrator
+from quizzmaker.dashboard_exporter import export_results_dashboard
+from quizzmaker.export_manifest import MANIFEST_NAME, ExportManifest
+from quizzmaker.grading import BatchGrader, iter_sheet_batches
+from quizzmaker.item_analysis import ResponseMatrix, analyze_log
+from quizzmaker.lms_export import iter_questions_from_csv, write_gift, write_qti
+from quizzmaker.question_generator import QuestionGenerator
+from quizzmaker.quiz_runner import QuizRunner
+from quizzmaker.results_log import ResultsLog
+from quizzmaker.results_views import ResultsViews
+from quizzmaker.similarity import find_similar_pairs, write_pairs_csv
+from quizzmaker.site_exporter import export_section_site
+
+
+def _reexport(args: argparse.Namespace) -> int:
+    """
+    Réexporte les fichiers HTML dont des questions ont changé.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande reexport
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    runner = QuizRunner()
+    if not runner.load_questions(args.bank):
+        return 1
+
+    manifest = ExportManifest.load(args.manifest)
+    stale = manifest.reexport(runner.questions, dry_run=args.dry_run)
+
+    action = "à réexporter" if args.dry_run else "réexporté(s)"
+    print(f"🔄 {len(stale)}/{len(manifest.files)} fichier(s) {action}")
+    for key in stale:
+        print(f"   - {key}")
+    return 0
+
+
+def _site(args: argparse.Namespace) -> int:
+    """
+    Génère (ou met à jour) le site statique d'une banque de questions.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande site
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    runner = QuizRunner()
+    if not runner.load_questions(args.bank):
+        return 1
+
+    report = export_section_site(
+        runner.questions, args.output_dir, args.per_page, title=args.title,
+        offline=not args.no_offline, workers=args.workers
+    )
+
+    print(f"🌐 Site généré dans {args.output_dir}: {report.rendered} quiz rendu(s), "
+          f"{len(report.written)} fichier(s) écrit(s), {len(report.unchanged)} inchangé(s), "
+          f"{len(report.removed)} supprimé(s)")
+    for stage, seconds in report.timings.items():
+        print(f"   ⏱️  {stage:<8} {seconds:8.3f} s")
+    print(f"   ⏱️  {'total':<8} {report.total_time:8.3f} s")
+    return 0
+
+
+def _lms(args: argparse.Namespace) -> int:
+    """
+    Exporte la banque vers un format LMS (GIFT ou QTI) en flux continu.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande lms
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    fmt = args.format or ('qti' if args.output.endswith('.xml') else 'gift')
+    writer = write_qti if fmt == 'qti' else write_gift
+
+    start = time.perf_counter()
+    try:
+        count = writer(iter_questions_from_csv(args.bank), args.output)
+    except FileNotFoundError:
+        print(f"❌ Fichier non trouvé: {args.bank}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ Exporté {count} questions au format {fmt.upper()} dans {args.output} ({elapsed:.2f} s)")
+    return 0
+
+
+def _items(args: argparse.Namespace) -> int:
+    """
+    Analyse les questions à partir d'un journal de résultats.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande items
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    runner = QuizRunner()
+    if not runner.load_questions(args.bank):
+        return 1
+
+    start = time.perf_counter()
+    stats = analyze_log(args.log, runner.questions, args.output)
+    elapsed = time.perf_counter() - start
+
+    flagged = sum(1 for i in range(len(stats.question_ids)) if stats.flags(i))
+    print(f"📊 {int(stats.responses.sum())} réponses analysées pour {len(stats.question_ids)} questions "
+          f"({elapsed:.2f} s)")
+    print(f"✅ Rapport écrit dans {args.output}: {flagged} question(s) signalée(s)")
+    return 0
+
+
+def _calibrate(args: argparse.Namespace) -> int:
+    """
+    Met à jour le calibrage des difficultés et propose (ou applique) les libellés.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande calibrate
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    generator = QuestionGenerator()
+    if not generator.load_from_csv(args.bank):
+        return 1
+
+    calibrator = RaschCalibrator.load(args.state)
+    start = time.perf_counter()
+    count = calibrator.update_from_log(args.log, generator.questions)
+    calibrator.save()
+    print(f"🔄 {count} nouvelle(s) réponse(s) prise(s) en compte "
+          f"({len(calibrator.items)} questions calibrées, {time.perf_counter() - start:.2f} s)")
+
+    if args.apply:
+        changes = calibrator.apply_labels(generator.questions, args.min_responses)
+    else:
+        changes = calibrator.propose_labels(generator.questions, args.min_responses)
+    for change in changes:
+        print(f"   - Question {change.question_id}: {change.current} -> {change.proposed} "
+              f"(difficulté {change.difficulty:+.2f}, {change.responses} réponses)")
+
+    print(f"✅ {len(changes)} changement(s) de difficulté {'appliqué(s)' if args.apply else 'proposé(s)'}")
+    if args.apply and changes and not generator.save_to_csv(args.bank):
+        return 1
+    return 0
+
+
+def _aggregate(args: argparse.Namespace) -> int:
+    """
+    Agrège les fichiers de résultats par section et par difficulté.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande aggregate
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    bank = None
+    if args.bank:
+        runner = QuizRunner()
+        if not runner.load_questions(args.bank):
+            return 1
+        bank = runner.questions
+
+    start = time.perf_counter()
+    aggregate = aggregate_results(args.sources, bank, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    report = aggregate.to_dict()
+
+    print(f"📊 {aggregate.quizzes} quiz agrégés ({elapsed:.2f} s)")
+    for path in aggregate.skipped_files:
+        print(f"⚠️  Ignoré (pas un fichier de résultats): {path}")
+    for title, key in (("Section", 'by_section'), ("Difficulté", 'by_difficulty')):
+        for name, stats in report[key].items():
+            print(f"   {title} {name or '?'}: {stats['correct']}/{stats['total']} ({stats['percentage']:.1f}%)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Rapport sauvegardé dans {args.output}")
+    return 0
+
+
+def _similarity(args: argparse.Namespace) -> int:
+    """
+    Signale les copies partageant le plus de mauvaises réponses.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande similarity
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    bank = None
+    if args.bank:
+        runner = QuizRunner()
+        if not runner.load_questions(args.bank):
+            return 1
+        bank = runner.questions
+
+    start = time.perf_counter()
+    matrix = ResponseMatrix.from_log(args.log, bank)
+    pairs = find_similar_pairs(matrix, top_k=args.top, min_shared_wrong=args.min_shared_wrong,
+                               workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"🔍 {matrix.shape[0]} copies comparées ({elapsed:.2f} s)")
+    for pair in pairs:
+        print(f"   ⚠️  {pair.learner_a} / {pair.learner_b}: {pair.shared_wrong} erreur(s) commune(s) "
+              f"({pair.shared_wrong_ratio:.0%}), {pair.identical}/{pair.common} réponses identiques")
+    if args.output:
+        write_pairs_csv(pairs, args.output)
+        print(f"💾 Paires sauvegardées dans {args.output}")
+    return 0
+
+
+def _dashboard(args: argparse.Namespace) -> int:
+    """
+    Génère le tableau de bord HTML des résultats par groupe.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande dashboard
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    runner = QuizRunner()
+    if not runner.load_questions(args.bank):
+        return 1
+
+    start = time.perf_counter()
+    with ResultsViews(args.views, runner.questions) as views:
+        applied = views.catch_up(args.log)
+        filename = export_results_dashboard(views, runner.questions, args.output, title=args.title,
+                                            top_questions=args.top, min_responses=args.min_responses)
+        quizzes = views.quizzes()
+    elapsed = time.perf_counter() - start
+
+    print(f"📊 {applied} nouveau(x) résultat(s) appliqué(s), {quizzes} quiz au total ({elapsed:.2f} s)")
+    print(f"💾 Tableau de bord sauvegardé dans {filename}")
+    return 0
+
+
+def _grade(args: argparse.Namespace) -> int:
+    """
+    Corrige un fichier de feuilles de réponses et enregistre les résultats.
+
+    Args:
+        args (argparse.Namespace): Arguments de la sous-commande grade
+
+    Returns:
+        int: Code de sortie (0 si succès)
+    """
+    runner = QuizRunner()
+    if not runner.load_questions(args.bank):
+        return 1
+
+    try:
+        exam = [int(qid) for qid in args.questions.split(',')] if args.questions else None
+        grader = BatchGrader(runner.questions, question_ids=exam)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    start = time.perf_counter()
+    sheets = rejected = correct = responses = 0
+    with ResultsLog(args.output, flush_every=args.batch) as log:
+        for batch in iter_sheet_batches(args.sheets, args.batch):
+            for line, summary in enumerate(grader.grade_records(batch), sheets + 1):
+                if summary is None:
+                    print(f"⚠️  Feuille {line} ignorée (réponses ou questions invalides)")
+                    rejected += 1
+                    continue
+                log.append(summary)
+                correct += summary.score
+                responses += summary.total
+            sheets += len(batch)
+    elapsed = time.perf_counter() - start
+
+    rate = correct / responses * 100 if responses else 0.0
+    print(f"✅ {sheets - rejected} feuille(s) corrigée(s) en {elapsed:.2f} s: "
+          f"{correct}/{responses} bonnes réponses ({rate:.1f}%)")
+    print(f"💾 Résultats ajoutés à {args.output}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée de la commande quizzmaker.
+
+    Args:
+        argv (Optional[List[str]]): Arguments (sys.argv[1:] si None)
+
+    Returns:
+        int: Code de sortie
+    """
+    parser = argparse.ArgumentParser(prog='quizzmaker', description="Système de Quiz Interactif")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    reexport = subparsers.add_parser(
+        'reexport',
+        help="Réexporte uniquement les quiz HTML contenant des questions modifiées"
+    )
+    reexport.add_argument('bank', help="Fichier CSV de la banque de questions")
+    reexport.add_argument('--manifest', default=MANIFEST_NAME,
+                          help=f"Manifeste d'export (défaut: {MANIFEST_NAME})")
+    reexport.add_argument('--dry-run', action='store_true',
+                          help="Affiche les fichiers concernés sans rien écrire")
+    reexport.set_defaults(handler=_reexport)
+
+    site = subparsers.add_parser(
+        'site',
+        help="Génère un site statique avec un quiz par section (reconstruction incrémentale)"
+    )
+    site.add_argument('bank', help="Fichier CSV de la banque de questions")
+    site.add_argument('output_dir', help="Dossier de sortie du site")
+    site.add_argument('--per-page', default='all',
+                      help="Nombre de questions par page, ou 'all' (défaut)")
+    site.add_argument('--title', default='Quiz Site', help="Titre du site")
+    site.add_argument('--workers', type=int, default=None,
+                      help="Nombre de processus de rendu (défaut: nombre de CPU)")
+    site.add_argument('--no-offline', action='store_true',
+                      help="Ne pas générer le service worker hors ligne")
+    site.set_defaults(handler=_site)
+
+    lms = subparsers.add_parser(
+        'lms',
+        help="Exporte la banque au format GIFT (Moodle) ou QTI 1.2, sans la charger en mémoire"
+    )
+    lms.add_argument('bank', help="Fichier CSV de la banque de questions")
+    lms.add_argument('output', help="Fichier de sortie (.gift ou .xml)")
+    lms.add_argument('--format', choices=['gift', 'qti'], default=None,
+                     help="Format de sortie (déduit de l'extension par défaut)")
+    lms.set_defaults(handler=_lms)
+
+    items = subparsers.add_parser(
+        'items',
+        help="Analyse les questions (difficulté, discrimination, distracteurs) d'un journal de résultats"
+    )
+    items.add_argument('log', help="Journal de résultats JSONL (ResultsLog)")
+    items.add_argument('bank', help="Fichier CSV de la banque de questions")
+    items.add_argument('-o', '--output', default='item_report.csv',
+                       help="Rapport CSV par question (défaut: item_report.csv)")
+    items.set_defaults(handler=_items)
+
+    calibrate = subparsers.add_parser(
+        'calibrate',
+        help="Recalibre la difficulté des questions à partir des nouveaux résultats (modèle de Rasch)"
+    )
+    calibrate.add_argument('log', help="Journal de résultats JSONL (ResultsLog)")
+    calibrate.add_argument('bank', help="Fichier CSV de la banque de questions")
+    calibrate.add_argument('--state', default=CALIBRATION_NAME,
+                           help=f"État du calibrage incrémental (défaut: {CALIBRATION_NAME})")
+    calibrate.add_argument('--min-responses', type=int, default=30,
+                           help="Réponses minimales pour changer un libellé (défaut: 30)")
+    calibrate.add_argument('--apply', action='store_true',
+                           help="Écrit les nouveaux libellés dans la banque")
+    calibrate.set_defaults(handler=_calibrate)
+
+    aggregate = subparsers.add_parser(
+        'aggregate',
+        help="Agrège les résultats (fichiers JSON et journaux JSONL) sur plusieurs processus"
+    )
+    aggregate.add_argument('sources', nargs='+', help="Fichiers ou dossiers de résultats")
+    aggregate.add_argument('--bank', default=None,
+                           help="Fichier CSV de la banque (sections et difficultés des questions)")
+    aggregate.add_argument('--workers', type=int, default=None,
+                           help="Nombre de processus (défaut: nombre de CPU, 1 pour un calcul en série)")
+    aggregate.add_argument('-o', '--output', default=None, help="Rapport JSON à écrire")
+    aggregate.set_defaults(handler=_aggregate)
+
+    similarity = subparsers.add_parser(
+        'similarity',
+        help="Détecte les copies aux réponses suspectes (mauvaises réponses communes)"
+    )
+    similarity.add_argument('log', help="Journal de résultats JSONL de l'examen (ResultsLog)")
+    similarity.add_argument('--bank', default=None,
+                            help="Fichier CSV de la banque (nécessaire pour les résultats non compacts)")
+    similarity.add_argument('-k', '--top', type=int, default=20,
+                            help="Nombre de paires signalées (défaut: 20)")
+    similarity.add_argument('--min-shared-wrong', type=int, default=1,
+                            help="Mauvaises réponses communes minimales d'une paire (défaut: 1)")
+    similarity.add_argument('--workers', type=int, default=1,
+                            help="Blocs de copies comparés en parallèle (défaut: 1)")
+    similarity.add_argument('-o', '--output', default=None, help="Fichier CSV des paires")
+    similarity.set_defaults(handler=_similarity)
+
+    dashboard = subparsers.add_parser(
+        'dashboard',
+        help="Génère le tableau de bord HTML des résultats par groupe (vues pré-agrégées)"
+    )
+    dashboard.add_argument('log', help="Journal de résultats JSONL (ResultsLog)")
+    dashboard.add_argument('bank', help="Fichier CSV de la banque de questions")
+    dashboard.add_argument('--views', default=':memory:',
+                           help="Base SQLite des vues, mise à jour de façon incrémentale "
+                                "(défaut: recalcul complet en mémoire)")
+    dashboard.add_argument('-o', '--output', default=None,
+                           help="Fichier HTML de sortie (défaut: dashboard_<date>.html)")
+    dashboard.add_argument('--title', default='Results Dashboard', help="Titre du tableau de bord")
+    dashboard.add_argument('-k', '--top', type=int, default=10,
+                           help="Questions les plus difficiles listées par groupe (défaut: 10)")
+    dashboard.add_argument('--min-responses', type=int, default=20,
+                           help="Réponses minimales d'une question listée (défaut: 20)")
+    dashboard.set_defaults(handler=_dashboard)
+
+    grade = subparsers.add_parser(
+        'grade',
+        help="Corrige en lot des feuilles de réponses (JSONL) et les ajoute à un journal de résultats"
+    )
+    grade.add_argument('sheets', help="Feuilles JSONL: {\"answers\": {id: réponse}, \"learner_id\", \"cohort\", "
+                                      "\"question_ids\"}")
+    grade.add_argument('bank', help="Fichier CSV de la banque de questions")
+    grade.add_argument('-o', '--output', default='results.jsonl',
+                       help="Journal de résultats JSONL à compléter (défaut: results.jsonl)")
+    grade.add_argument('--batch', type=int, default=10000,
+                       help="Feuilles corrigées par lot (défaut: 10000)")
+    grade.add_argument('--questions', default=None,
+                       help="IDs des questions de l'examen, séparés par des virgules (défaut: toute la banque ; "
+                            "une feuille peut donner les siennes dans \"question_ids\")")
+    grade.set_defaults(handler=_grade)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,411 @@
+"""Results Dashboard Exporter - Generates a cohort results dashboard from pre-aggregated views."""
+
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+import html
+
+from .html_utils import json_for_script, quiz_stylesheet, resolve_filename, section_key
+from .models import QuestionBank, questions_by_id
+from .results_views import ALL_COHORTS, ResultsViews
+
+# Questions longer than this are shortened in the hardest-questions table
+QUESTION_PREVIEW_CHARS = 140
+
+
+class ResultsDashboardExporter:
+    """
+    Exports a cohort results dashboard to a single HTML file.
+
+    The page is built from the counters kept by ResultsViews, never from raw
+    results: it embeds one small JSON block of summary arrays (a score
+    histogram, per-section and per-difficulty counts for every cohort, and
+    each cohort's hardest questions), so its size depends on the number of
+    cohorts and sections, not on the number of learners.
+    """
+
+    def __init__(self, views: ResultsViews, bank: Optional[QuestionBank] = None,
+                 title: str = 'Results Dashboard'):
+        """
+        Initialize the dashboard exporter.
+
+        Args:
+            views: Up-to-date ResultsViews (call catch_up first)
+            bank: Question bank giving the text of the hardest questions
+            title: Dashboard title
+        """
+        self.views = views
+        self.questions = questions_by_id(bank) if bank is not None else {}
+        self.title = title
+
+    def export(self, filename: str = None, top_questions: int = 10, min_responses: int = 20) -> str:
+        """
+        Export the dashboard to an HTML file.
+
+        Args:
+            filename: Output HTML filename. If None, auto-generates with timestamp
+            top_questions: Hardest questions listed per cohort
+            min_responses: Responses a question needs before it can be listed
+                as one of the hardest
+
+        Returns:
+            Path to the generated HTML file
+        """
+        filename = resolve_filename(filename, prefix='dashboard')
+        output_path = Path(filename)
+        output_path.write_text(self.render(top_questions, min_responses), encoding='utf-8')
+        return str(output_path.absolute())
+
+    def render(self, top_questions: int = 10, min_responses: int = 20) -> str:
+        """Return the dashboard HTML document (see export for the arguments)."""
+        esc = html.escape
+        data = self.dashboard_data(top_questions, min_responses)
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{esc(self.title)}</title>
+    <style>
+        {quiz_stylesheet()}
+        {self._get_css()}
+    </style>
+</head>
+<body>
+    <div class="container dashboard">
+        <header>
+            <h1>📊 {esc(self.title)}</h1>
+            <div id="quiz-info">
+                <label for="cohort-select">Cohort</label>
+                <select id="cohort-select"></select>
+            </div>
+        </header>
+
+        <div class="score-summary" id="dashboard-summary"></div>
+
+        <section class="dashboard-panel">
+            <h2>Score distribution</h2>
+            <div class="histogram" id="score-histogram"></div>
+        </section>
+
+        <section class="dashboard-panel">
+            <h2>Success rate by difficulty</h2>
+            <div id="difficulty-bars"></div>
+        </section>
+
+        <section class="dashboard-panel">
+            <h2>Success rate by section and cohort</h2>
+            <div class="heatmap-scroll" id="section-heatmap"></div>
+        </section>
+
+        <section class="dashboard-panel">
+            <h2>Hardest questions</h2>
+            <div id="hardest-questions"></div>
+        </section>
+    </div>
+
+    <script type="application/json" id="dashboard-data">{json_for_script(data)}</script>
+    <script>
+        {self._get_javascript()}
+    </script>
+</body>
+</html>"""
+
+    def dashboard_data(self, top_questions: int = 10, min_responses: int = 20) -> dict:
+        """
+        Return the summary arrays embedded in the dashboard.
+
+        Cohort-indexed lists share the order of 'cohorts' (the first entry,
+        null, is every cohort together); section- and difficulty-indexed lists share
+        the order of 'sections' and 'difficulties'. Counts are [correct, total]
+        pairs; 'histogram' holds quizzes per 10% score band.
+        """
+        scores = self.views.rates_by_cohort('score')
+        sections = self.views.rates_by_cohort('section')
+        difficulties = self.views.rates_by_cohort('difficulty')
+        questions = self.views.rates_by_cohort('question')
+        cohorts = [ALL_COHORTS] + sorted(cohort for cohort in scores if cohort is not ALL_COHORTS)
+
+        section_names = sorted(sections.get(ALL_COHORTS, {}), key=section_key)
+        difficulty_names = sorted(difficulties.get(ALL_COHORTS, {}), key=_difficulty_key)
+        hardest = [_hardest(questions.get(cohort, {}), top_questions, min_responses) for cohort in cohorts]
+        listed = sorted({qid for per_cohort in hardest for qid, _, _ in per_cohort})
+
+        return {
+            'cohorts': cohorts,
+            'histogram': [
+                [scores.get(cohort, {}).get(str(band * 10), (0, 0))[1] for band in range(11)]
+                for cohort in cohorts
+            ],
+            'sections': section_names,
+            'sectionCounts': [_counts(sections.get(cohort, {}), section_names) for cohort in cohorts],
+            'difficulties': difficulty_names,
+            'difficultyCounts': [_counts(difficulties.get(cohort, {}), difficulty_names) for cohort in cohorts],
+            'hardest': hardest,
+            'questions': {str(qid): self._question_info(qid) for qid in listed},
+        }
+
+    def _question_info(self, question_id: int) -> List[str]:
+        """Return [section, shortened text] of a question ('' when not in the bank)."""
+        question = self.questions.get(question_id)
+        if question is None:
+            return ['', '']
+        text = question.question
+        if len(text) > QUESTION_PREVIEW_CHARS:
+            text = text[:QUESTION_PREVIEW_CHARS - 1] + '…'
+        return [question.section, text]
+
+    def _get_css(self) -> str:
+        """Return CSS styles specific to the dashboard."""
+        return """
+        .dashboard {
+            max-width: 1100px;
+        }
+
+        #cohort-select {
+            margin-left: 10px;
+            padding: 6px 12px;
+            font-size: 1em;
+            border-radius: 8px;
+            border: 2px solid #667eea;
+        }
+
+        .score-summary {
+            display: flex;
+            justify-content: space-around;
+            flex-wrap: wrap;
+            gap: 20px;
+        }
+
+        .summary-value {
+            font-size: 2.5em;
+            font-weight: bold;
+        }
+
+        .dashboard-panel {
+            margin-bottom: 40px;
+        }
+
+        .dashboard-panel h2 {
+            color: #333;
+            margin-bottom: 15px;
+        }
+
+        .histogram {
+            display: flex;
+            align-items: flex-end;
+            gap: 6px;
+            height: 200px;
+            border-bottom: 2px solid #ddd;
+        }
+
+        .histogram-bar {
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            justify-content: flex-end;
+            height: 100%;
+            text-align: center;
+            font-size: 0.8em;
+            color: #666;
+        }
+
+        .histogram-fill {
+            background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
+            border-radius: 4px 4px 0 0;
+        }
+
+        .rate-row {
+            display: grid;
+            grid-template-columns: 120px 1fr 140px;
+            gap: 10px;
+            align-items: center;
+            margin-bottom: 8px;
+        }
+
+        .rate-track {
+            background: #e0e0e0;
+            border-radius: 10px;
+            height: 16px;
+            overflow: hidden;
+        }
+
+        .rate-fill {
+            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+            height: 100%;
+        }
+
+        .heatmap-scroll {
+            overflow-x: auto;
+        }
+
+        .dashboard table {
+            border-collapse: collapse;
+            width: 100%;
+            font-size: 0.9em;
+        }
+
+        .dashboard th, .dashboard td {
+            padding: 6px 10px;
+            border: 1px solid #eee;
+            text-align: center;
+            white-space: nowrap;
+        }
+
+        .dashboard td.question-text {
+            text-align: left;
+            white-space: normal;
+        }
+
+        .dashboard .selected-cohort {
+            outline: 3px solid #667eea;
+            outline-offset: -3px;
+        }
+        """
+
+    def _get_javascript(self) -> str:
+        """Return the JavaScript rendering the dashboard from its summary arrays."""
+        return """
+        const data = JSON.parse(document.getElementById('dashboard-data').textContent);
+
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, ch => ({
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+            })[ch]);
+        }
+
+        function cohortLabel(cohort) {
+            return cohort === null ? 'All cohorts' : (cohort === '' ? 'No cohort' : cohort);
+        }
+
+        function percent(correct, total) {
+            return total ? (100 * correct / total) : null;
+        }
+
+        function heatColor(rate) {
+            // Red (0%) through yellow to green (100%)
+            return rate === null ? '#f8f9fa' : `hsl(${Math.round(rate * 1.2)}, 70%, 80%)`;
+        }
+
+        function renderSummary(c) {
+            const histogram = data.histogram[c];
+            const quizzes = histogram.reduce((a, b) => a + b, 0);
+            let correct = 0, total = 0;
+            data.sectionCounts[c].forEach(([right, all]) => { correct += right; total += all; });
+            const rate = percent(correct, total);
+            const passed = histogram.slice(5).reduce((a, b) => a + b, 0);
+            document.getElementById('dashboard-summary').innerHTML = [
+                ['Quizzes', quizzes.toLocaleString()],
+                ['Responses', total.toLocaleString()],
+                ['Correct answers', rate === null ? '–' : rate.toFixed(1) + '%'],
+                ['Scores ≥ 50%', quizzes ? (100 * passed / quizzes).toFixed(1) + '%' : '–']
+            ].map(([label, value]) => `<div><div class="summary-value">${value}</div>${label}</div>`).join('');
+        }
+
+        function renderHistogram(c) {
+            const histogram = data.histogram[c];
+            const highest = Math.max(1, ...histogram);
+            document.getElementById('score-histogram').innerHTML = histogram.map((count, band) => {
+                const label = band === 10 ? '100%' : `${band * 10}–${band * 10 + 9}%`;
+                return `<div class="histogram-bar" title="${label}: ${count}">${count || ''}` +
+                    `<div class="histogram-fill" style="height: ${100 * count / highest}%"></div>${label}</div>`;
+            }).join('');
+        }
+
+        function renderDifficulties(c) {
+            document.getElementById('difficulty-bars').innerHTML = data.difficulties.map((name, d) => {
+                const [correct, total] = data.difficultyCounts[c][d];
+                const rate = percent(correct, total);
+                return `<div class="rate-row"><strong>${escapeHtml(name || '?')}</strong>` +
+                    `<div class="rate-track"><div class="rate-fill" style="width: ${rate || 0}%"></div></div>` +
+                    `<span>${rate === null ? '–' : rate.toFixed(1) + '%'} (${correct}/${total})</span></div>`;
+            }).join('');
+        }
+
+        function renderHeatmap(c) {
+            const head = data.cohorts.map((cohort, i) =>
+                `<th class="${i === c ? 'selected-cohort' : ''}">${escapeHtml(cohortLabel(cohort))}</th>`).join('');
+            const rows = data.sections.map((section, s) => {
+                const cells = data.cohorts.map((_, i) => {
+                    const [correct, total] = data.sectionCounts[i][s];
+                    const rate = percent(correct, total);
+                    return `<td class="${i === c ? 'selected-cohort' : ''}" ` +
+                        `style="background: ${heatColor(rate)}" title="${correct}/${total}">` +
+                        `${rate === null ? '' : Math.round(rate) + '%'}</td>`;
+                }).join('');
+                return `<tr><th>${escapeHtml(section || '?')}</th>${cells}</tr>`;
+            }).join('');
+            document.getElementById('section-heatmap').innerHTML =
+                `<table><thead><tr><th>Section</th>${head}</tr></thead><tbody>${rows}</tbody></table>`;
+        }
+
+        function renderHardest(c) {
+            const hardest = data.hardest[c];
+            if (!hardest.length) {
+                document.getElementById('hardest-questions').innerHTML = '<p>Not enough responses yet.</p>';
+                return;
+            }
+            const rows = hardest.map(([id, correct, total]) => {
+                const [section, text] = data.questions[id];
+                return `<tr><td>${id}</td><td>${escapeHtml(section)}</td>` +
+                    `<td class="question-text">${escapeHtml(text)}</td>` +
+                    `<td style="background: ${heatColor(percent(correct, total))}">` +
+                    `${percent(correct, total).toFixed(1)}%</td><td>${total}</td></tr>`;
+            }).join('');
+            document.getElementById('hardest-questions').innerHTML =
+                '<table><thead><tr><th>ID</th><th>Section</th><th>Question</th><th>Correct</th>' +
+                `<th>Responses</th></tr></thead><tbody>${rows}</tbody></table>`;
+        }
+
+        function render(c) {
+            renderSummary(c);
+            renderHistogram(c);
+            renderDifficulties(c);
+            renderHeatmap(c);
+            renderHardest(c);
+        }
+
+        const select = document.getElementById('cohort-select');
+        select.innerHTML = data.cohorts.map((cohort, i) =>
+            `<option value="${i}">${escapeHtml(cohortLabel(cohort))}</option>`).join('');
+        select.onchange = () => render(Number(select.value));
+        render(0);
+        """
+
+
+def _counts(rates: Dict[str, Tuple[int, int]], keys: List[str]) -> List[List[int]]:
+    """Return the [correct, total] pair of every key, [0, 0] when missing."""
+    return [list(rates.get(key, (0, 0))) for key in keys]
+
+
+def _hardest(rates: Dict[str, Tuple[int, int]], count: int, min_responses: int) -> List[List[int]]:
+    """Return [question_id, correct, total] of the lowest success rates (most responses first on ties)."""
+    answered = [(correct / total, -total, int(key), correct, total)
+                for key, (correct, total) in rates.items() if total >= max(min_responses, 1)]
+    answered.sort()
+    return [[qid, correct, total] for _, _, qid, correct, total in answered[:count]]
+
+
+def _difficulty_key(difficulty: str) -> tuple:
+    """Sort key ordering the usual difficulty labels from easiest to hardest."""
+    order = ('Easy', 'Medium', 'Hard')
+    return (order.index(difficulty), '') if difficulty in order else (len(order), difficulty)
+
+
+def export_results_dashboard(views: ResultsViews, bank: Optional[QuestionBank] = None,
+                             filename: str = None, title: str = 'Results Dashboard', **options) -> str:
+    """
+    Convenience function to export a cohort results dashboard to HTML.
+
+    Args:
+        views: Up-to-date ResultsViews (call catch_up first)
+        bank: Question bank giving the text of the hardest questions
+        filename: Output filename (auto-generated if None)
+        title: Dashboard title
+        **options: Extra export options forwarded to ResultsDashboardExporter.export
+            (e.g. top_questions=20)
+
+    Returns:
+        Path to the generated HTML file
+    """
+    exporter = ResultsDashboardExporter(views, bank, title)
+    return exporter.export(filename, **options)
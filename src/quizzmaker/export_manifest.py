@@ -0,0 +1,150 @@
+"""Export Manifest - Records which questions every exported quiz file contains."""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+import json
+import os
+
+from .html_exporter import HTMLQuizExporter
+from .models import Question
+
+MANIFEST_NAME = 'quizzmaker-manifest.json'
+
+
+class ExportManifest:
+    """
+    Maps exported quiz files to the ids and content hashes of their questions.
+
+    Pass a manifest to HTMLQuizExporter.export (or QuizRunner.export_html_quiz)
+    to record each file. After the question bank changes, stale_files lists
+    the files holding an edited or deleted question, and reexport rewrites
+    only those, with the options they were exported with.
+
+    Example:
+        >>> with ExportManifest.load('site/quizzmaker-manifest.json') as manifest:
+        ...     export_quiz_to_html(questions, 'site/quiz1.html', manifest=manifest)
+        >>> ExportManifest.load('site/quizzmaker-manifest.json').reexport(bank)
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path] = MANIFEST_NAME):
+        """
+        Initialize an empty manifest.
+
+        Args:
+            path: Location of the manifest file. Recorded files inside its
+                directory are stored with relative paths
+        """
+        self.path = Path(path)
+        self.files: Dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = MANIFEST_NAME) -> 'ExportManifest':
+        """Load a manifest from disk, or start an empty one if the file does not exist."""
+        manifest = cls(path)
+        if manifest.path.exists():
+            data = json.loads(manifest.path.read_text(encoding='utf-8'))
+            if data.get('version') != cls.VERSION:
+                raise ValueError(f"Unsupported manifest version in {path}: {data.get('version')}")
+            manifest.files = data['files']
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically (a crash never leaves a truncated file)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': self.VERSION, 'files': self.files}
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, indent=1, sort_keys=True, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+    def __enter__(self) -> 'ExportManifest':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.save()
+
+    def record(self, output_path: Union[str, Path], questions: List[Question], options: dict,
+               generator: str = 'html', **extra) -> None:
+        """
+        Record an exported file.
+
+        Args:
+            output_path: Path of the written file
+            questions: Questions the file contains, in order
+            options: Export options the file was written with (JSON-serializable)
+            generator: What wrote the file: 'html' for HTMLQuizExporter.export
+                (the files reexport handles), 'site' for a site export
+            **extra: Additional JSON-serializable fields (e.g. revision)
+        """
+        self.files[self._key(output_path)] = {
+            'questions': [[q.id, q.content_hash()] for q in questions],
+            'options': options,
+            'generator': generator,
+            **extra,
+        }
+
+    def stale_files(self, bank: Iterable[Question]) -> List[str]:
+        """
+        Return the recorded files whose questions changed in the bank.
+
+        A file is stale when one of its questions was edited (different
+        content hash) or no longer exists in the bank. Only files written by
+        HTMLQuizExporter.export are considered; site exports are brought up
+        to date by exporting the site again.
+
+        Args:
+            bank: Current questions
+
+        Returns:
+            Manifest keys of the stale files, in sorted order
+        """
+        hashes = {q.id: q.content_hash() for q in bank}
+        return sorted(
+            key for key, entry in self.files.items()
+            if entry.get('generator', 'html') == 'html'
+            and any(hashes.get(qid) != digest for qid, digest in entry['questions'])
+        )
+
+    def reexport(self, bank: Iterable[Question], dry_run: bool = False) -> List[str]:
+        """
+        Rewrite the stale files from the bank and save the manifest.
+
+        Questions deleted from the bank are dropped from their files. A file
+        left without any question is not rewritten; it is only removed from
+        the manifest.
+
+        Args:
+            bank: Current questions
+            dry_run: Only report the stale files, write nothing
+
+        Returns:
+            Manifest keys of the stale files
+        """
+        bank = list(bank)
+        stale = self.stale_files(bank)
+        if dry_run:
+            return stale
+
+        by_id = {q.id: q for q in bank}
+        for key in stale:
+            entry = self.files[key]
+            questions = [by_id[qid] for qid, _ in entry['questions'] if qid in by_id]
+            if not questions:
+                del self.files[key]
+                continue
+            HTMLQuizExporter(questions).export(str(self.resolve(key)), manifest=self, **entry['options'])
+        self.save()
+        return stale
+
+    def resolve(self, key: str) -> Path:
+        """Return the path of a recorded file from its manifest key."""
+        return self.path.parent / key
+
+    def _key(self, output_path: Union[str, Path]) -> str:
+        """Return the manifest key of a file: relative to the manifest when possible."""
+        output_path = Path(output_path).absolute()
+        try:
+            return output_path.relative_to(self.path.parent.absolute()).as_posix()
+        except ValueError:
+            return output_path.as_posix()
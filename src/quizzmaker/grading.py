@@ -0,0 +1,369 @@
+"""
+Module de correction en lot des feuilles de réponses.
+
+Ce module corrige hors ligne de grands lots de feuilles de réponses
+collectées (ID de question → réponse), sans passer par QuizRunner.
+Chaque feuille est corrigée sur les questions de son examen : une
+question de l'examen sans réponse est fausse. Seule la lecture des
+réponses dans les feuilles se fait en Python ; tout le reste est calculé
+pour le lot entier avec NumPy : la normalisation des textes, leur codage
+par l'indice de l'option choisie (recherche dichotomique dans la table
+triée des réponses acceptées de chaque question), la jointure avec la
+banque, la comparaison au corrigé, les codes de difficulté et de section
+et les bitsets des bonnes réponses.
+
+Les feuilles corrigées sont des CompactQuizSummary déjà classés : score,
+pourcentage, performances par difficulté et par section, to_dict pour un
+ResultsLog, et resolve(bank) pour obtenir un QuizSummary complet.
+"""
+
+from array import array
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+import json
+
+import numpy as np
+
+from quizzmaker.models import (
+    DIFFICULTIES, UNKNOWN_CODE, CompactQuizSummary, QuestionBank, questions_by_id
+)
+
+Answer = Union[str, int, None]
+# Réponses Vrai/Faux acceptées (en plus de 'True' et 'False'), comme dans QuizRunner
+_TRUE_FALSE = {'true': 0, 't': 0, 'a': 0, 'vrai': 0, 'v': 0,
+               'false': 1, 'f': 1, 'b': 1, 'faux': 1}
+# Les IDs de question sont enregistrés en entiers 32 bits (array 'i')
+_ID_RANGE = range(-2 ** 31, 2 ** 31)
+# Les codes de section sont enregistrés en entiers 16 bits non signés (array 'H')
+_MAX_SECTIONS = 2 ** 16
+# Types de réponse codés par _grade
+_TEXT, _BOOL, _INDEX = 1, 2, 3
+_ANSWER_KINDS = {str: _TEXT, bool: _BOOL, int: _INDEX}
+
+
+class BatchGrader:
+    """
+    Correcteur de feuilles de réponses par lots, à partir d'une banque.
+
+    Réponses acceptées (casse et espaces ignorés) :
+        - Choix multiples : texte de l'option, lettre de l'option dans
+          l'ordre de la banque ("B"), format de QuizRunner ("C) texte",
+          la lettre affichée étant ignorée) ou indice entier de l'option
+        - Vrai/Faux : True/False, T/F, A/B, Vrai/Faux, booléen ou 0/1
+        - Réponse courte : comparaison exacte avec la réponse attendue
+          (le code de réponse enregistré vaut toujours -1)
+
+    Chaque feuille est corrigée sur les questions de son examen (celles
+    du correcteur, par défaut toute la banque dans l'ordre des IDs) : une
+    question de l'examen sans réponse, ou dont la réponse est vide,
+    inconnue ou d'un autre type, est fausse (code -1). Les réponses à des
+    questions hors de l'examen sont ignorées.
+
+    Example:
+        >>> grader = BatchGrader(bank, question_ids=[1, 2])
+        >>> summaries = grader.grade([{1: "Paris", 2: "B"}, {1: "Lyon"}], learner_ids=["ana", "leo"])
+        >>> summaries[0].score, summaries[1].total
+        (2, 2)
+    """
+
+    def __init__(self, bank: QuestionBank, question_ids: Optional[Sequence[int]] = None):
+        """
+        Indexe la banque de questions.
+
+        Args:
+            bank (QuestionBank): Questions (liste ou dictionnaire par ID)
+            question_ids (Optional[Sequence[int]]): Questions de l'examen, dans
+                l'ordre (défaut: toute la banque)
+
+        Raises:
+            ValueError: Si la banque est vide, si un ID n'est pas un entier
+                32 bits, si la banque a plus de 65 536 sections ou si
+                l'examen est invalide (voir grade)
+        """
+        by_id = questions_by_id(bank)
+        if not by_id:
+            raise ValueError("Banque de questions vide")
+        invalid = [qid for qid in by_id if qid.__class__ is not int or qid not in _ID_RANGE]
+        if invalid:
+            raise ValueError(f"ID de question invalide (entier 32 bits attendu): {invalid[0]!r}")
+        ids = sorted(by_id)
+        sections = sorted({by_id[qid].section for qid in ids})
+        if len(sections) > _MAX_SECTIONS:
+            raise ValueError(f"Trop de sections ({len(sections)}, au plus {_MAX_SECTIONS})")
+        self.sections = tuple(sections)
+        section_index = {section: i for i, section in enumerate(sections)}
+
+        self._ids = np.array(ids, dtype=np.int64)
+        self._keys = np.empty(len(ids), dtype=np.int16)
+        self._short_answer = np.zeros(len(ids), dtype=bool)
+        self._difficulty = np.empty(len(ids), dtype=np.uint8)
+        self._section = np.empty(len(ids), dtype=np.uint16)
+        self._choice_counts = np.empty(len(ids), dtype=np.int64)
+        self._known = frozenset(ids)
+
+        accepted = []
+        for i, qid in enumerate(ids):
+            question = by_id[qid]
+            table, self._keys[i] = _answer_table(question)
+            accepted.extend((i, text, code) for text, code in table.items())
+            self._choice_counts[i] = len(question.choices())
+            self._short_answer[i] = question.type == 'Short Answer'
+            self._difficulty[i] = (DIFFICULTIES.index(question.difficulty)
+                                   if question.difficulty in DIFFICULTIES else UNKNOWN_CODE)
+            self._section[i] = section_index[question.section]
+
+        # Réponses acceptées de toutes les questions en une table triée : clé
+        # position de la question × taille du vocabulaire + indice du texte
+        positions, texts, codes = zip(*accepted) if accepted else ((), (), ())
+        self._vocabulary = np.unique(np.array(texts, dtype=str))
+        keys = (np.array(positions, dtype=np.int64) * len(self._vocabulary)
+                + np.searchsorted(self._vocabulary, np.array(texts, dtype=str)))
+        order = np.argsort(keys)
+        self._table_keys = keys[order]
+        self._table_codes = np.array(codes, dtype=np.int16)[order]
+        self.question_ids = self._exam(question_ids) if question_ids is not None else tuple(ids)
+
+    def grade(self, sheets: Iterable[Mapping[int, Answer]], learner_ids: Optional[Iterable[str]] = None,
+              cohort: Optional[str] = None,
+              question_ids: Optional[Sequence[int]] = None) -> List[CompactQuizSummary]:
+        """
+        Corrige un lot de feuilles de réponses d'un même examen.
+
+        Args:
+            sheets (Iterable[Mapping[int, Answer]]): Feuilles (ID de question → réponse)
+            learner_ids (Optional[Iterable[str]]): Apprenant de chaque feuille (optionnel)
+            cohort (Optional[str]): Groupe de toutes les feuilles (optionnel)
+            question_ids (Optional[Sequence[int]]): Questions de l'examen, dans
+                l'ordre (défaut: celles du correcteur)
+
+        Returns:
+            List[CompactQuizSummary]: Résumé classé de chaque feuille, dans l'ordre
+
+        Raises:
+            ValueError: Si l'examen est vide, contient un doublon ou une question hors de la banque
+        """
+        exam = self._exam(question_ids) if question_ids is not None else self.question_ids
+        sheets = list(sheets)
+        learners = list(learner_ids) if learner_ids is not None else [None] * len(sheets)
+        return self._grade(sheets, [exam] * len(sheets), learners, [cohort] * len(sheets))
+
+    def grade_records(self, records: Iterable[dict]) -> List[Optional[CompactQuizSummary]]:
+        """
+        Corrige des feuilles au format JSON {"answers": {id: réponse}, "learner_id", "cohort"}.
+
+        Les IDs de question peuvent être des chaînes (clés JSON). Une
+        feuille peut donner les questions de son examen dans
+        "question_ids" ; sinon l'examen est celui du correcteur. Une feuille
+        invalide (IDs non entiers, examen hors de la banque...) est ignorée
+        sans interrompre le lot : son résumé vaut None.
+
+        Args:
+            records (Iterable[dict]): Feuilles décodées (ex: une ligne JSONL chacune)
+
+        Returns:
+            List[Optional[CompactQuizSummary]]: Résumé classé de chaque feuille
+                (None si elle est invalide), dans l'ordre
+        """
+        sheets, exams, learners, cohorts, valid = [], [], [], [], []
+        for record in records:
+            try:
+                sheet = {_question_id(qid): answer for qid, answer in record['answers'].items()}
+                exam = (self._exam(record['question_ids']) if record.get('question_ids') is not None
+                        else self.question_ids)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                valid.append(False)
+                continue
+            valid.append(True)
+            sheets.append(sheet)
+            exams.append(exam)
+            learners.append(record.get('learner_id'))
+            cohorts.append(record.get('cohort'))
+
+        graded = iter(self._grade(sheets, exams, learners, cohorts))
+        return [next(graded) if ok else None for ok in valid]
+
+    def _exam(self, question_ids: Sequence[int]) -> tuple:
+        """Valide les questions d'un examen."""
+        exam = tuple(question_ids)
+        if not exam:
+            raise ValueError("Examen sans question")
+        unknown = [qid for qid in exam if qid.__class__ is not int or qid not in self._known]
+        if unknown:
+            raise ValueError(f"Question de l'examen absente de la banque: {unknown[0]!r}")
+        if len(set(exam)) != len(exam):
+            raise ValueError("Question en double dans l'examen")
+        return exam
+
+    def _grade(self, sheets: List[Mapping[int, Answer]], exams: List[tuple],
+               learner_ids: List[Optional[str]], cohorts: List[Optional[str]]) -> List[CompactQuizSummary]:
+        """Corrige des feuilles, chacune sur les questions (déjà validées) de son examen."""
+        # Seule étape par réponse en Python : la lire dans sa feuille
+        answers = np.empty(sum(map(len, exams)), dtype=object)
+        answers[:] = [sheet.get(qid) for sheet, exam in zip(sheets, exams) for qid in exam]
+        ids = np.array([qid for exam in exams for qid in exam], dtype=np.int32)
+        lengths = [len(exam) for exam in exams]
+        # Jointure avec la banque par l'index trié des IDs (les examens sont validés)
+        position = np.searchsorted(self._ids, ids)
+
+        kinds = np.fromiter(map(_ANSWER_KINDS.get, map(type, answers), repeat(0)), dtype=np.int8,
+                            count=len(answers))
+        codes = np.full(len(answers), -1, dtype=np.int16)
+
+        cells = np.flatnonzero(kinds == _TEXT)
+        codes[cells] = self._code_texts(position[cells], answers[cells])
+
+        # Booléens JSON d'une question Vrai/Faux
+        cells = np.flatnonzero(kinds == _BOOL)
+        words = self._words(np.array(['false', 'true']))
+        codes[cells] = self._lookup(position[cells], words[answers[cells].astype(np.intp)])
+
+        # Indices entiers d'option (comparés en objets : un entier JSON peut dépasser 64 bits)
+        cells = np.flatnonzero(kinds == _INDEX)
+        values = answers[cells]
+        in_range = (values >= 0) & (values < self._choice_counts[position[cells]])
+        codes[cells[in_range]] = values[in_range].astype(np.int64)
+
+        correct = (codes >= 0) & (codes == self._keys[position])
+        codes[self._short_answer[position]] = -1
+        difficulty = self._difficulty[position]
+        section = self._section[position]
+
+        # Bitsets de toutes les feuilles en un seul appel : chaque feuille commence sur un octet
+        lengths = np.array(lengths, dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(lengths)))
+        byte_starts = np.concatenate(([0], np.cumsum((lengths + 7) // 8)))
+        local = np.arange(len(ids)) - np.repeat(starts[:-1], lengths)
+        bits = np.zeros(int(byte_starts[-1]) * 8, dtype=bool)
+        bits[np.repeat(byte_starts[:-1] * 8, lengths) + local] = correct
+        packed = np.packbits(bits, bitorder='little').tobytes()
+
+        ids_bytes = ids.tobytes()
+        answer_bytes = codes.tobytes()
+        difficulty_bytes = difficulty.tobytes()
+        section_bytes = section.tobytes()
+        summaries = []
+        for sheet in range(len(lengths)):
+            start, end = int(starts[sheet]), int(starts[sheet + 1])
+            summaries.append(CompactQuizSummary.from_arrays(
+                array('i', ids_bytes[4 * start:4 * end]),
+                array('h', answer_bytes[2 * start:2 * end]),
+                packed[byte_starts[sheet]:byte_starts[sheet + 1]],
+                learner_id=learner_ids[sheet],
+                cohort=cohorts[sheet],
+                difficulty_codes=difficulty_bytes[start:end],
+                section_codes=array('H', section_bytes[2 * start:2 * end]),
+                sections=self.sections
+            ))
+        return summaries
+
+    def _code_texts(self, position: np.ndarray, answers: np.ndarray) -> np.ndarray:
+        """
+        Code des réponses textuelles (casse et espaces ignorés).
+
+        Chaque texte distinct du lot n'est normalisé et cherché dans le
+        vocabulaire qu'une fois ; les feuilles n'en gardent que l'indice.
+
+        Args:
+            position (np.ndarray): Position de chaque question dans la banque
+            answers (np.ndarray): Réponse (str) à chaque question
+
+        Returns:
+            np.ndarray: Indice de l'option choisie, -1 si la réponse n'est pas acceptée
+        """
+        if not len(answers):
+            return np.full(0, -1, dtype=np.int16)
+        distinct = {text: i for i, text in enumerate(dict.fromkeys(answers.tolist()))}
+        inverse = np.fromiter(map(distinct.__getitem__, answers), dtype=np.intp, count=len(answers))
+        texts = np.char.lower(np.char.strip(np.array(list(distinct), dtype=str)))
+        codes = self._lookup(position, self._words(texts)[inverse])
+
+        # Format "lettre) option" de QuizRunner : la lettre suivait l'ordre mélangé
+        options = np.char.strip(np.char.partition(texts, ') ')[:, 2])
+        retry_words = np.where(np.char.find(texts, ') ') >= 0, self._words(options), -1)[inverse]
+        retry = (codes < 0) & (retry_words >= 0)
+        codes[retry] = self._lookup(position[retry], retry_words[retry])
+        return codes
+
+    def _words(self, texts: np.ndarray) -> np.ndarray:
+        """Retourne l'indice de chaque texte normalisé dans le vocabulaire (-1 si absent)."""
+        vocabulary = self._vocabulary
+        if not len(vocabulary):
+            return np.full(len(texts), -1, dtype=np.int64)
+        word = np.minimum(np.searchsorted(vocabulary, texts), len(vocabulary) - 1)
+        return np.where(vocabulary[word] == texts, word, -1)
+
+    def _lookup(self, position: np.ndarray, words: np.ndarray) -> np.ndarray:
+        """
+        Code des réponses dans les tables des questions.
+
+        Args:
+            position (np.ndarray): Position de chaque question dans la banque
+            words (np.ndarray): Indice de chaque réponse dans le vocabulaire (-1 si absente)
+
+        Returns:
+            np.ndarray: Indice de l'option choisie, -1 si la réponse n'est pas acceptée
+        """
+        table = self._table_keys
+        if not len(words) or not len(table):
+            return np.full(len(words), -1, dtype=np.int16)
+        keys = position.astype(np.int64) * len(self._vocabulary) + words
+        entry = np.minimum(np.searchsorted(table, keys), len(table) - 1)
+        found = (words >= 0) & (table[entry] == keys)
+        return np.where(found, self._table_codes[entry], -1).astype(np.int16)
+
+
+def iter_sheet_batches(path: Union[str, Path], batch_size: int = 10000) -> Iterator[List[dict]]:
+    """
+    Lit un fichier JSONL de feuilles de réponses par lots.
+
+    Args:
+        path (Union[str, Path]): Fichier JSONL (une feuille par ligne, voir grade_records)
+        batch_size (int): Feuilles par lot
+
+    Yields:
+        List[dict]: Lot de feuilles décodées
+    """
+    batch = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                batch.append(json.loads(line))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+def _question_id(key: Union[str, int]) -> int:
+    """Convertit une clé de feuille JSON ("12" ou 12) en ID de question entier."""
+    if key.__class__ is int:
+        return key
+    if key.__class__ is not str or not key.strip().lstrip('-').isdigit():
+        raise ValueError(f"ID de question invalide: {key!r}")
+    return int(key)
+
+
+def _answer_table(question) -> tuple:
+    """
+    Retourne les réponses acceptées d'une question et le code du corrigé.
+
+    Les réponses acceptées associent un texte normalisé (minuscules, sans
+    espaces autour) au code de l'option.
+
+    Le code du corrigé vaut -2 (jamais atteint) si la réponse attendue
+    n'est pas une des options.
+    """
+    if question.type == 'Short Answer':
+        return {question.answer.strip().lower(): 0}, 0
+    choices = question.choices()
+    table: Dict[str, int] = {}
+    if question.type == 'True/False':
+        table.update(_TRUE_FALSE)
+    for i, choice in enumerate(choices):
+        table.setdefault(choice.strip().lower(), i)
+    for i in range(len(choices)):
+        table.setdefault(chr(ord('a') + i), i)
+    key = choices.index(question.answer) if question.answer in choices else -2
+    return table, key
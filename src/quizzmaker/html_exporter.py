@@ -1,10 +1,14 @@
 """HTML Quiz Exporter - Generates interactive HTML quiz pages."""
 
-from datetime import datetime
-from typing import List, Union
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
 from pathlib import Path
+import hashlib
+import html
 import json
+import posixpath
 
+from .html_utils import json_for_script, quiz_stylesheet, resolve_filename
 from .models import Question
 
 
@@ -20,45 +24,197 @@ class HTMLQuizExporter:
         """
         self.questions = questions
 
-    def export(self, filename: str = None, questions_per_page: Union[int, str] = 'all') -> str:
+    def export(self, filename: str = None, questions_per_page: Union[int, str] = 'all',
+               lazy_pages: bool = False, virtualize_threshold: int = 300,
+               prerender: bool = False, persist_answers: bool = True, manifest=None) -> str:
         """
         Export quiz to an interactive HTML file.
 
         Args:
             filename: Output HTML filename. If None, auto-generates with timestamp
             questions_per_page: Number of questions per page, or 'all' for single page
+            lazy_pages: Store each page as its own inert JSON block, decoded only
+                when the page (or the one before it) is displayed
+            virtualize_threshold: Pages holding more questions than this are
+                rendered with virtual scrolling (only cards near the viewport
+                are kept in the DOM)
+            prerender: Render every question card to static HTML at export
+                time; the script then only attaches behaviour. The page is
+                readable before any JavaScript runs. Disables virtual scrolling
+            persist_answers: Save submitted answers to localStorage (keyed by
+                the quiz content hash) so a reload resumes where the student was
+            manifest: ExportManifest recording the file, its questions and
+                these options, so it can be re-exported when questions change
 
         Returns:
             Path to the generated HTML file
         """
-        # Generate filename if not provided
-        if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'quiz_{timestamp}.html'
+        filename = resolve_filename(filename)
 
-        # Ensure .html extension
-        if not filename.endswith('.html'):
-            filename += '.html'
+        # Generate HTML content
+        html_content = self.render(questions_per_page, lazy_pages, virtualize_threshold, prerender,
+                                   persist_answers)
+
+        # Write to file
+        output_path = Path(filename)
+        output_path.write_text(html_content, encoding='utf-8')
+
+        if manifest is not None:
+            manifest.record(output_path, self.questions, {
+                'questions_per_page': questions_per_page,
+                'lazy_pages': lazy_pages,
+                'virtualize_threshold': virtualize_threshold,
+                'prerender': prerender,
+                'persist_answers': persist_answers,
+            })
+
+        return str(output_path.absolute())
+
+    def render(self, questions_per_page: Union[int, str] = 'all', lazy_pages: bool = False,
+               virtualize_threshold: int = 300, prerender: bool = False, persist_answers: bool = True,
+               asset_urls: Dict[str, str] = None, service_worker: str = None) -> str:
+        """
+        Return the quiz HTML document without writing it.
 
+        Takes the same options as export, plus:
+
+        Args:
+            asset_urls: URLs of the shared stylesheet and script ('css' and
+                'js' keys, see shared_assets). When given, the page links them
+                instead of inlining its own copy
+            service_worker: URL of a service worker the page registers (when
+                served over HTTP), used by offline quiz sites
+
+        Returns:
+            The HTML document as a string
+        """
         # Convert questions_per_page to int if 'all'
         if questions_per_page == 'all':
             questions_per_page = len(self.questions)
         else:
             questions_per_page = int(questions_per_page)
 
-        # Generate HTML content
-        html_content = self._generate_html(questions_per_page)
+        virtual_scroll = questions_per_page > virtualize_threshold and not prerender
+        return self._generate_html(questions_per_page, lazy_pages, virtual_scroll, prerender,
+                                   persist_answers, asset_urls, service_worker)
 
-        # Write to file
-        output_path = Path(filename)
-        output_path.write_text(html_content, encoding='utf-8')
+    def export_pages(self, output_dir: Union[str, Path], questions_per_page: int = 50,
+                     virtualize_threshold: int = 300, persist_answers: bool = True) -> List[str]:
+        """
+        Export the quiz as one lightweight HTML file per page, for very large exams.
 
-        return str(output_path.absolute())
+        Each page-N.html holds only its own questions and links the shared
+        stylesheet and script (written once under assets/), so a page load
+        only parses one page. Answers are kept in localStorage across pages,
+        and every page prefetches the next one. results.html holds the whole
+        quiz (as lazily decoded page blocks) and shows the review.
 
-    def _generate_html(self, questions_per_page: int) -> str:
-        """Generate the complete HTML document."""
-        questions_json = self._questions_to_json()
+        Args:
+            output_dir: Directory receiving the files (created if needed)
+            questions_per_page: Number of questions per page file
+            virtualize_threshold: Pages holding more questions than this are
+                rendered with virtual scrolling
+            persist_answers: Must stay True for answers to survive page
+                changes; False makes every page an independent quiz
+
+        Returns:
+            Paths of the written files: the pages in order, results.html,
+            then the shared stylesheet and script
+
+        Raises:
+            ValueError: If the quiz has no questions (there is no page to write)
+        """
+        if not self.questions:
+            raise ValueError("Cannot export an empty quiz as page files")
+        output_dir = Path(output_dir)
+        questions_per_page = max(int(questions_per_page), 1)
         total_pages = (len(self.questions) + questions_per_page - 1) // questions_per_page
+        page_files = [f'page-{page}.html' for page in range(1, total_pages + 1)]
+        virtual_scroll = questions_per_page > virtualize_threshold
+
+        assets = self.shared_asset_files()
+        asset_urls = {kind: path for kind, (path, _) in assets.items()}
+        files = []
+        for page, page_file in enumerate(page_files, 1):
+            multi_file = {'pages': page_files, 'resultsFile': 'results.html', 'page': page, 'results': False}
+            files.append((page_file, self._generate_html(questions_per_page, True, virtual_scroll, False,
+                                                         persist_answers, asset_urls, multi_file=multi_file)))
+        multi_file = {'pages': page_files, 'resultsFile': 'results.html', 'page': 1, 'results': True}
+        files.append(('results.html', self._generate_html(questions_per_page, True, virtual_scroll, False,
+                                                          persist_answers, asset_urls, multi_file=multi_file)))
+        files.extend(assets[kind] for kind in ('css', 'js'))
+
+        written = []
+        for relative_path, content in files:
+            path = output_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding='utf-8')
+            written.append(str(path.absolute()))
+        return written
+
+    def shared_assets(self) -> Dict[str, str]:
+        """Return the stylesheet and script every quiz page uses ('css' and 'js' keys)."""
+        return {'css': quiz_stylesheet(), 'js': self._get_javascript()}
+
+    def shared_asset_files(self, assets_dir: str = 'assets') -> Dict[str, Tuple[str, str]]:
+        """
+        Return the shared assets with content-hashed file names.
+
+        Returns:
+            { 'css' | 'js': (path such as assets/quizzmaker.<hash>.css, content) }
+        """
+        files = {}
+        for kind, content in self.shared_assets().items():
+            digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:10]
+            files[kind] = (f'{assets_dir}/quizzmaker.{digest}.{kind}', content)
+        return files
+
+    def _generate_html(self, questions_per_page: int, lazy_pages: bool = False,
+                       virtual_scroll: bool = False, prerender: bool = False,
+                       persist_answers: bool = False, asset_urls: Dict[str, str] = None,
+                       service_worker: str = None, multi_file: dict = None) -> str:
+        """
+        Generate the complete HTML document.
+
+        multi_file describes a page of a multi-file export (see export_pages):
+        the page files, the results file, this page's number and whether this
+        is the results file. Page files only embed their own page block.
+        """
+        total_pages = (len(self.questions) + questions_per_page - 1) // questions_per_page
+        if prerender:
+            container_attrs = ' class="prerendered"'
+            cards = self._render_cards(questions_per_page)
+        else:
+            container_attrs = ''
+            cards = '<!-- Questions will be rendered here -->'
+
+        # Inline the stylesheet and script, or link the shared copies
+        if asset_urls:
+            styles = f'<link rel="stylesheet" href="{html.escape(asset_urls["css"])}">'
+            script = f'</script>\n    <script src="{html.escape(asset_urls["js"])}"></script>'
+        else:
+            styles = f"""<style>
+        {quiz_stylesheet()}
+    </style>"""
+            script = f"""
+        {self._get_javascript()}
+    </script>"""
+        if service_worker:
+            styles += f"""
+    <link rel="manifest" href="{html.escape(posixpath.join(posixpath.dirname(service_worker), 'manifest.webmanifest'))}">
+    <script>
+        if ('serviceWorker' in navigator && location.protocol !== 'file:') {{
+            navigator.serviceWorker.register({json.dumps(service_worker)});
+        }}
+    </script>"""
+
+        payload_page = None
+        if multi_file is not None and not multi_file['results']:
+            payload_page = multi_file['page']
+            # Fetch the next file in the background so following it is instant
+            following = (multi_file['pages'][payload_page]
+                         if payload_page < len(multi_file['pages']) else multi_file['resultsFile'])
+            styles += f'\n    <link rel="prefetch" href="{html.escape(following)}">'
 
         return f"""<!DOCTYPE html>
 <html lang="en">
@@ -66,9 +222,7 @@ class HTMLQuizExporter:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Interactive Quiz</title>
-    <style>
-        {self._get_css()}
-    </style>
+    {styles}
 </head>
 <body>
     <div class="container">
@@ -77,8 +231,32 @@ class HTMLQuizExporter:
             <div id="quiz-info"></div>
         </header>
 
-        <div id="quiz-container">
-            <!-- Questions will be rendered here -->
+        {self._quiz_view_html(container_attrs, cards)}
+    </div>
+
+    {self._payload_blocks(questions_per_page, lazy_pages, payload_page)}
+    <script>
+        // Quiz data (parsed from the inert JSON block(s) above)
+        const questionsPerPage = {questions_per_page};
+        const totalPages = {total_pages};
+        const totalQuestions = {len(self.questions)};
+        const lazyPages = {'true' if lazy_pages else 'false'};
+        const virtualScroll = {'true' if virtual_scroll else 'false'};
+        const prerendered = {'true' if prerender else 'false'};
+        const persistAnswers = {'true' if persist_answers else 'false'};
+        const storageKey = {json.dumps('quizzmaker:' + self.content_hash())};
+        const bundleMode = false;
+        const multiFile = {json_for_script(multi_file) if multi_file else 'null'};
+        const questions = lazyPages ? null : JSON.parse(document.getElementById('quiz-data').textContent);
+    {script}
+</body>
+</html>"""
+
+    @staticmethod
+    def _quiz_view_html(container_attrs: str = '', cards: str = '') -> str:
+        """Return the markup of the quiz area: cards, navigation and results."""
+        return f"""<div id="quiz-container"{container_attrs}>
+            {cards}
         </div>
 
         <div id="navigation">
@@ -93,24 +271,56 @@ class HTMLQuizExporter:
         <div id="results-container" style="display: none;">
             <h2>🎯 Quiz Results</h2>
             <div id="results-content"></div>
-        </div>
-    </div>
-
-    <script>
-        // Quiz data
-        const questions = {questions_json};
-        const questionsPerPage = {questions_per_page};
-        const totalPages = {total_pages};
+        </div>"""
+
+    def content_hash(self) -> str:
+        """Return a hash of the quiz content (questions and their order)."""
+        digest = hashlib.sha1()
+        for question in self.questions:
+            digest.update(question.content_hash().encode('ascii'))
+        return digest.hexdigest()
+
+    def _render_cards(self, questions_per_page: int) -> str:
+        """Render every question card as static HTML (cards after page 1 hidden)."""
+        total = len(self.questions)
+        cards = []
+        for index, question in enumerate(self.questions):
+            head, tail = self._card_fragment(question)
+            hidden = ' hidden' if index >= questions_per_page else ''
+            cards.append(f'<div class="question-card{hidden}"{head}Question {index + 1}/{total}{tail}')
+        return '\n            '.join(cards)
+
+    @staticmethod
+    def _card_fragment(question: Question) -> Tuple[str, str]:
+        """
+        Return the escaped markup of a question card, split around its number.
 
-        {self._get_javascript()}
-    </script>
-</body>
-</html>"""
+        The markup mirrors the skeleton built by createQuestionCard in the
+        script, so the same code attaches behaviour to both.
+        """
+        return _card_markup(question.id, question.type, tuple(question.options), question.section,
+                            question.section_title, question.difficulty, question.question)
+
+    def _payload_blocks(self, questions_per_page: int, lazy_pages: bool, only_page: int = None) -> str:
+        """Return the inert JSON script block(s) holding the question payload."""
+        if not lazy_pages:
+            return f'<script type="application/json" id="quiz-data">{self._questions_to_json()}</script>'
+
+        blocks = []
+        for page, start in enumerate(range(0, len(self.questions), questions_per_page), 1):
+            if only_page is not None and page != only_page:
+                continue
+            page_json = self._questions_to_json(self.questions[start:start + questions_per_page])
+            blocks.append(f'<script type="application/json" id="quiz-page-{page}">{page_json}</script>')
+        return '\n    '.join(blocks)
+
+    def _questions_to_json(self, questions: List[Question] = None) -> str:
+        """Convert questions to JSON text safe to embed in a JSON script block."""
+        if questions is None:
+            questions = self.questions
 
-    def _questions_to_json(self) -> str:
-        """Convert questions to JSON format for JavaScript."""
         questions_data = []
-        for q in self.questions:
+        for q in questions:
             questions_data.append({
                 'id': q.id,
                 'section': q.section,
@@ -122,624 +332,565 @@ class HTMLQuizExporter:
                 'answer': q.answer,
                 'explanation': q.explanation
             })
-        return json.dumps(questions_data, ensure_ascii=False)
+        return json_for_script(questions_data)
 
-    def _get_css(self) -> str:
-        """Return CSS styles for the HTML quiz."""
+    def _get_javascript(self) -> str:
+        """Return JavaScript code for quiz interactivity."""
         return """
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-            line-height: 1.6;
-        }
-
-        .container {
-            max-width: 900px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 16px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            padding: 40px;
-        }
-
-        header {
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 3px solid #667eea;
-        }
-
-        h1 {
-            color: #333;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }
-
-        #quiz-info {
-            color: #666;
-            font-size: 1.1em;
-            margin-top: 10px;
-        }
-
-        .progress-bar {
-            background: #e0e0e0;
-            border-radius: 10px;
-            height: 20px;
-            margin-top: 15px;
-            overflow: hidden;
-        }
-
-        .progress-fill {
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            height: 100%;
-            transition: width 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 0.85em;
-            font-weight: 600;
-        }
-
-        .question-card {
-            background: #f8f9fa;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 30px;
-            border-left: 6px solid #667eea;
-            transition: all 0.3s ease;
-        }
-
-        .question-card.answered-correct {
-            background: #d4edda;
-            border-left-color: #28a745;
-        }
-
-        .question-card.answered-incorrect {
-            background: #f8d7da;
-            border-left-color: #dc3545;
-        }
-
-        .question-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }
-
-        .question-meta {
-            display: flex;
-            gap: 15px;
-            font-size: 0.9em;
-        }
-
-        .badge {
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-weight: 600;
-            font-size: 0.85em;
-        }
-
-        .badge-section {
-            background: #e3f2fd;
-            color: #1976d2;
-        }
-
-        .badge-easy {
-            background: #d4edda;
-            color: #155724;
-        }
-
-        .badge-medium {
-            background: #fff3cd;
-            color: #856404;
-        }
-
-        .badge-hard {
-            background: #f8d7da;
-            color: #721c24;
-        }
-
-        .question-text {
-            font-size: 1.2em;
-            color: #333;
-            margin-bottom: 20px;
-            font-weight: 500;
-        }
-
-        .options {
-            margin-bottom: 20px;
-        }
-
-        .option {
-            background: white;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 10px;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            display: flex;
-            align-items: center;
-        }
-
-        .option:hover:not(.disabled) {
-            border-color: #667eea;
-            background: #f0f4ff;
-            transform: translateX(5px);
-        }
-
-        .option input[type="radio"] {
-            margin-right: 12px;
-            cursor: pointer;
-            width: 20px;
-            height: 20px;
-        }
-
-        .option.disabled {
-            cursor: not-allowed;
-            opacity: 0.7;
-        }
-
-        .option.correct {
-            background: #d4edda;
-            border-color: #28a745;
-        }
-
-        .option.incorrect {
-            background: #f8d7da;
-            border-color: #dc3545;
-        }
-
-        .short-answer-input {
-            width: 100%;
-            padding: 15px;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            font-size: 1em;
-            margin-bottom: 20px;
-        }
-
-        .short-answer-input:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-
-        .submit-btn {
-            background: #667eea;
-            color: white;
-            border: none;
-            padding: 12px 30px;
-            border-radius: 8px;
-            font-size: 1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-
-        .submit-btn:hover:not(:disabled) {
-            background: #5568d3;
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }
+        // State management
+        let currentPage = 1;
+        let userAnswers = {}; // { questionId: { answer, isCorrect, submitted } }
+        let answeredCount = 0; // kept up to date by submitAnswer
+        let correctCount = 0;
+        const pageCache = new Map(); // { page: [questions] }, current and next page only
+        const questionIndex = new Map(); // { questionId: question } for decoded questions
+        let cardPrototype = null; // empty question card, cloned for new cards
+        let shownCards = null; // pre-rendered cards of the current page (null: as exported)
+        const staleCards = new Set(); // pre-rendered cards whose markup lags userAnswers
+        const SAVE_DELAY_MS = 800; // answers submitted within this window share one write
+        let saveTimer = null;
+        const REVIEW_BATCH_SIZE = 100; // review items rendered per batch on the results screen
+        let reviewRendered = 0;
+        let reviewObserver = null;
+
+        // Virtual scrolling state (pages larger than the export threshold)
+        const VIRTUAL_BUFFER = 5; // cards kept above and below the viewport
+        const ESTIMATED_CARD_HEIGHT = 360;
+        const CARD_MARGIN = 30; // .question-card margin-bottom
+        const virtualState = {
+            questions: [],
+            startIdx: 0,
+            heights: [],
+            offsets: null,
+            cards: new Map(), // { index: card element }
+            pool: [], // detached cards ready to be re-filled
+            first: -1,
+            last: -1,
+            frame: null
+        };
 
-        .submit-btn:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-        }
+        // Initialize quiz
+        document.addEventListener('DOMContentLoaded', function() {
+            // Bundles start on their quiz index instead (see openBundledQuiz)
+            if (!bundleMode) {
+                initializeQuiz();
+                if (multiFile && multiFile.results) {
+                    showResults();
+                } else {
+                    renderCurrentPage();
+                }
+            }
 
-        .feedback {
-            margin-top: 20px;
-            padding: 20px;
-            border-radius: 8px;
-            display: none;
-        }
+            // Keep unsubmitted choices in userAnswers so re-created cards restore them
+            const container = document.getElementById('quiz-container');
+            container.addEventListener('click', handleQuizClick);
+            container.addEventListener('change', rememberDraftAnswer);
+            container.addEventListener('input', rememberDraftAnswer);
+            window.addEventListener('scroll', scheduleVirtualUpdate, { passive: true });
+            window.addEventListener('resize', scheduleVirtualUpdate);
+
+            // Write any pending answers before the page goes away
+            window.addEventListener('pagehide', saveAnswers);
+            document.addEventListener('visibilitychange', () => {
+                if (document.visibilityState === 'hidden') saveAnswers();
+            });
+        });
 
-        .feedback.show {
-            display: block;
-        }
+        function initializeQuiz() {
+            // Each file of a multi-file export shows a single page
+            if (multiFile) currentPage = multiFile.page;
 
-        .feedback.correct {
-            background: #d4edda;
-            border: 2px solid #28a745;
-        }
+            // Answer states are created on first access (see getAnswerState)
+            // Build the id -> question index once (lazy pages add their own)
+            if (!lazyPages) {
+                indexQuestions(questions);
+            }
 
-        .feedback.incorrect {
-            background: #f8d7da;
-            border: 2px solid #dc3545;
-        }
+            // Resume a previous session of this exact quiz
+            restoreAnswers();
 
-        .feedback-header {
-            font-size: 1.2em;
-            font-weight: 600;
-            margin-bottom: 10px;
+            // Update quiz info with progress bar
+            updateQuizInfo();
+            checkQuizCompletion();
         }
 
-        .feedback.correct .feedback-header {
-            color: #155724;
+        function restoreAnswers() {
+            if (!persistAnswers) return;
+            let saved = null;
+            try {
+                saved = JSON.parse(localStorage.getItem(storageKey));
+            } catch (e) {
+                saved = null; // storage disabled or corrupted entry
+            }
+            if (!saved || !Array.isArray(saved.answers)) return;
+
+            // Only the states are restored; cards pick them up when rendered
+            saved.answers.forEach(([id, answer, isCorrect]) => {
+                if (userAnswers[id]) return; // duplicated entry: count it once
+                userAnswers[id] = { answer, isCorrect, submitted: true };
+                answeredCount++;
+                if (isCorrect) correctCount++;
+                if (prerendered) staleCards.add(id);
+            });
+            if (!multiFile && saved.page >= 1 && saved.page <= totalPages) {
+                currentPage = saved.page;
+            }
         }
 
-        .feedback.incorrect .feedback-header {
-            color: #721c24;
+        function scheduleSave() {
+            // Debounce: rapid submissions are batched into a single write
+            if (!persistAnswers || saveTimer !== null) return;
+            saveTimer = setTimeout(saveAnswers, SAVE_DELAY_MS);
         }
 
-        .explanation {
-            color: #333;
-            font-size: 1em;
-            line-height: 1.6;
-        }
+        function saveAnswers() {
+            if (saveTimer !== null) {
+                clearTimeout(saveTimer);
+                saveTimer = null;
+            }
+            if (!persistAnswers || !storageKey) return;
 
-        #navigation {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #e0e0e0;
-            flex-wrap: wrap;
-            gap: 15px;
+            // Compact form: [[questionId, answer, isCorrect], ...] for submitted answers
+            const answers = [];
+            for (const [id, state] of Object.entries(userAnswers)) {
+                if (state.submitted) answers.push([Number(id), state.answer, state.isCorrect]);
+            }
+            try {
+                localStorage.setItem(storageKey, JSON.stringify({ page: currentPage, answers }));
+            } catch (e) {
+                // Storage full or unavailable: the quiz keeps working without resume
+            }
         }
 
-        #page-navigation {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 20px;
-            flex: 1;
+        function clearSavedAnswers() {
+            if (saveTimer !== null) {
+                clearTimeout(saveTimer);
+                saveTimer = null;
+            }
+            if (!persistAnswers) return;
+            try {
+                localStorage.removeItem(storageKey);
+            } catch (e) {
+                // Storage unavailable: nothing to clear
+            }
         }
 
-        #navigation button {
-            background: #667eea;
-            color: white;
-            border: none;
-            padding: 12px 25px;
-            border-radius: 8px;
-            font-size: 1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
+        function indexQuestions(list) {
+            list.forEach(q => questionIndex.set(q.id, q));
         }
 
-        #navigation button:hover:not(:disabled) {
-            background: #5568d3;
-            transform: translateY(-2px);
+        function getAnswerState(questionId) {
+            if (!userAnswers[questionId]) {
+                userAnswers[questionId] = {
+                    answer: null,
+                    isCorrect: false,
+                    submitted: false
+                };
+            }
+            return userAnswers[questionId];
         }
 
-        #navigation button:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-            transform: none;
+        function decodePage(page) {
+            if (!lazyPages) {
+                const start = (page - 1) * questionsPerPage;
+                return questions.slice(start, start + questionsPerPage);
+            }
+            // Lazy mode: each page is an inert JSON block, parsed on demand
+            return JSON.parse(document.getElementById(`quiz-page-${page}`).textContent);
         }
 
-        #page-info {
-            color: #666;
-            font-weight: 600;
+        function getPageQuestions(page) {
+            if (!pageCache.has(page)) {
+                const pageQuestions = decodePage(page);
+                pageCache.set(page, pageQuestions);
+                if (lazyPages) indexQuestions(pageQuestions);
+            }
+            return pageCache.get(page);
         }
 
-        #results-container {
-            margin-top: 40px;
-        }
+        function retainPages(page) {
+            // Keep only the current page and the next one decoded
+            for (const cachedPage of Array.from(pageCache.keys())) {
+                if (cachedPage !== page && cachedPage !== page + 1) {
+                    if (lazyPages) {
+                        pageCache.get(cachedPage).forEach(q => questionIndex.delete(q.id));
+                    }
+                    pageCache.delete(cachedPage);
+                }
+            }
 
-        #results-container h2 {
-            color: #333;
-            margin-bottom: 30px;
-            text-align: center;
-            font-size: 2em;
+            // Decode the next page in the background so "Next" is instant
+            // (multi-file pages prefetch the next file with a <link> instead)
+            if (lazyPages && !multiFile && page < totalPages && !pageCache.has(page + 1)) {
+                setTimeout(() => {
+                    if (currentPage === page) getPageQuestions(page + 1);
+                }, 0);
+            }
         }
 
-        .score-summary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 12px;
-            text-align: center;
-            margin-bottom: 30px;
+        function forEachQuestion(callback, start = 0, end = totalQuestions) {
+            // Visit questions [start, end) in order without keeping lazy pages decoded
+            if (!lazyPages) {
+                for (let i = start; i < end; i++) callback(questions[i], i);
+                return;
+            }
+            for (let page = Math.floor(start / questionsPerPage) + 1; (page - 1) * questionsPerPage < end; page++) {
+                const pageStart = (page - 1) * questionsPerPage;
+                const pageQuestions = pageCache.has(page) ? pageCache.get(page) : decodePage(page);
+                pageQuestions.forEach((q, k) => {
+                    const i = pageStart + k;
+                    if (i >= start && i < end) callback(q, i);
+                });
+            }
         }
 
-        .score-summary .score {
-            font-size: 4em;
-            font-weight: bold;
-            margin: 20px 0;
+        function findQuestion(questionId) {
+            // Only questions of decoded pages can be on screen, and those are indexed
+            return questionIndex.get(questionId);
         }
 
-        .score-summary .percentage {
-            font-size: 2em;
+        function updateQuizInfo() {
+            const answered = answeredCount;
+            const total = totalQuestions;
+            const percentage = total > 0 ? (answered / total * 100).toFixed(0) : 0;
+            const info = document.getElementById('quiz-info');
+
+            // Build the progress bar once, then only update its text and width
+            if (!info.querySelector('.progress-fill')) {
+                info.innerHTML = `
+                    <div class="quiz-info-text"></div>
+                    <div class="progress-bar">
+                        <div class="progress-fill"></div>
+                    </div>
+                `;
+            }
+            info.querySelector('.quiz-info-text').textContent =
+                `Total Questions: ${total} | Pages: ${totalPages} | Answered: ${answered}/${total}`;
+            const fill = info.querySelector('.progress-fill');
+            fill.style.width = `${percentage}%`;
+            fill.textContent = `${percentage}%`;
         }
 
-        .performance-breakdown {
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 12px;
-            margin-bottom: 30px;
-        }
+        function renderCurrentPage() {
+            const startIdx = (currentPage - 1) * questionsPerPage;
+            const pageQuestions = getPageQuestions(currentPage);
+            retainPages(currentPage);
 
-        .performance-breakdown h3 {
-            color: #333;
-            margin-bottom: 20px;
-            text-align: center;
-        }
+            if (virtualScroll) {
+                renderVirtualPage(pageQuestions, startIdx);
+                updateNavigation();
+                return;
+            }
 
-        .difficulty-stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }
+            if (prerendered) {
+                showPrerenderedPage(pageQuestions);
+                updateNavigation();
+                return;
+            }
 
-        .stat-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            border-left: 4px solid #667eea;
-            text-align: center;
-        }
+            // Reuse the cards already on screen; only create or drop the difference
+            const container = document.getElementById('quiz-container');
+            const cards = Array.from(container.children);
+            if (cards.some(el => !el.classList.contains('question-card'))) {
+                container.innerHTML = '';
+                cards.length = 0;
+            }
 
-        .stat-card h4 {
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-            text-transform: uppercase;
-        }
+            pageQuestions.forEach((q, idx) => {
+                const questionNum = startIdx + idx + 1;
+                if (idx < cards.length) {
+                    fillQuestionCard(cards[idx], q, questionNum);
+                } else {
+                    container.appendChild(createQuestionCard(q, questionNum));
+                }
+            });
+            cards.slice(pageQuestions.length).forEach(card => card.remove());
 
-        .stat-card .stat-value {
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #333;
+            updateNavigation();
         }
 
-        .question-review {
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 12px;
+        function showPrerenderedPage(pageQuestions) {
+            // Cards are already in the markup: swap which page is visible
+            if (shownCards === null) {
+                // First render: page 1 is visible as exported
+                shownCards = Array.from(document.querySelectorAll('#quiz-container > .question-card:not(.hidden)'));
+            }
+            shownCards.forEach(card => card.classList.add('hidden'));
+            shownCards = pageQuestions.map(q => {
+                const card = document.getElementById(`question-${q.id}`);
+                card.classList.remove('hidden');
+                // Only cards whose state changed since export need touching
+                if (staleCards.has(q.id)) {
+                    fillQuestionInput(card.querySelector('.question-input'), q);
+                    applyCardState(card, q);
+                    staleCards.delete(q.id);
+                }
+                return card;
+            });
         }
 
-        .question-review h3 {
-            color: #333;
-            margin-bottom: 20px;
-            text-align: center;
-        }
+        function renderVirtualPage(pageQuestions, startIdx) {
+            const container = document.getElementById('quiz-container');
+            container.innerHTML = `
+                <div class="virtual-spacer"></div>
+                <div class="virtual-window"></div>
+                <div class="virtual-spacer"></div>
+            `;
 
-        .review-item {
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            border-left: 4px solid #e0e0e0;
+            virtualState.questions = pageQuestions;
+            virtualState.startIdx = startIdx;
+            virtualState.heights = new Array(pageQuestions.length).fill(ESTIMATED_CARD_HEIGHT);
+            virtualState.offsets = null;
+            virtualState.cards = new Map();
+            virtualState.pool = [];
+            virtualState.first = -1;
+            virtualState.last = -1;
+            updateVirtualWindow();
+        }
+
+        function getVirtualOffsets() {
+            // offsets[i] is the top of card i, offsets[n] the total height
+            if (!virtualState.offsets) {
+                const heights = virtualState.heights;
+                const offsets = new Float64Array(heights.length + 1);
+                for (let i = 0; i < heights.length; i++) {
+                    offsets[i + 1] = offsets[i] + heights[i];
+                }
+                virtualState.offsets = offsets;
+            }
+            return virtualState.offsets;
         }
 
-        .review-item.correct {
-            border-left-color: #28a745;
+        function findCardAt(offsets, y) {
+            // Binary search for the card covering vertical position y
+            let low = 0;
+            let high = offsets.length - 2;
+            while (low < high) {
+                const mid = (low + high + 1) >> 1;
+                if (offsets[mid] <= y) low = mid;
+                else high = mid - 1;
+            }
+            return low;
         }
 
-        .review-item.incorrect {
-            border-left-color: #dc3545;
+        function scheduleVirtualUpdate() {
+            if (!virtualScroll || virtualState.frame !== null) return;
+            virtualState.frame = requestAnimationFrame(updateVirtualWindow);
         }
 
-        .review-question {
-            font-weight: 600;
-            color: #333;
-            margin-bottom: 8px;
-        }
+        function updateVirtualWindow() {
+            virtualState.frame = null;
+            const container = document.getElementById('quiz-container');
+            const count = virtualState.questions.length;
+            if (count === 0 || container.classList.contains('hidden')) return;
+
+            const [topSpacer, windowEl, bottomSpacer] = container.children;
+            const offsets = getVirtualOffsets();
+            const viewTop = -container.getBoundingClientRect().top;
+            const first = Math.max(findCardAt(offsets, viewTop) - VIRTUAL_BUFFER, 0);
+            const last = Math.min(findCardAt(offsets, viewTop + window.innerHeight) + VIRTUAL_BUFFER, count - 1);
+
+            if (first !== virtualState.first || last !== virtualState.last) {
+                // Drop cards that left the window; their state lives in userAnswers
+                for (const [index, card] of Array.from(virtualState.cards)) {
+                    if (index < first || index > last) {
+                        card.remove();
+                        virtualState.cards.delete(index);
+                        virtualState.pool.push(card);
+                    }
+                }
 
-        .review-answer {
-            color: #666;
-            font-size: 0.95em;
-        }
+                // Create the missing cards above and below the ones kept
+                const kept = Array.from(virtualState.cards.keys());
+                const keptFirst = kept.length ? Math.min(...kept) : last + 1;
+                const keptLast = kept.length ? Math.max(...kept) : last;
+                const above = document.createDocumentFragment();
+                for (let i = first; i < keptFirst; i++) {
+                    above.appendChild(createVirtualCard(i));
+                }
+                windowEl.insertBefore(above, windowEl.firstChild);
+                const below = document.createDocumentFragment();
+                for (let i = keptLast + 1; i <= last; i++) {
+                    below.appendChild(createVirtualCard(i));
+                }
+                windowEl.appendChild(below);
 
-        .hidden {
-            display: none !important;
-        }
+                virtualState.first = first;
+                virtualState.last = last;
+            }
 
-        .submit-all-btn {
-            background: #28a745 !important;
-            margin-left: 20px;
+            // Measure the rendered cards so the spacers track real heights
+            for (const [index, card] of virtualState.cards) {
+                const height = card.offsetHeight + CARD_MARGIN;
+                if (height > CARD_MARGIN && height !== virtualState.heights[index]) {
+                    virtualState.heights[index] = height;
+                    virtualState.offsets = null;
+                }
+            }
+            const measured = getVirtualOffsets();
+            topSpacer.style.height = `${measured[first]}px`;
+            bottomSpacer.style.height = `${measured[count] - measured[last + 1]}px`;
         }
 
-        .submit-all-btn:hover:not(:disabled) {
-            background: #218838 !important;
+        function createVirtualCard(index) {
+            const question = virtualState.questions[index];
+            const questionNum = virtualState.startIdx + index + 1;
+            const recycled = virtualState.pool.pop();
+            const card = recycled ? fillQuestionCard(recycled, question, questionNum) : createQuestionCard(question, questionNum);
+            virtualState.cards.set(index, card);
+            return card;
         }
 
-        .restart-btn {
-            background: #667eea;
-            color: white;
-            border: none;
-            padding: 15px 40px;
-            border-radius: 8px;
-            font-size: 1.1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            margin-top: 30px;
-            display: block;
-            margin-left: auto;
-            margin-right: auto;
+        function rememberDraftAnswer(event) {
+            const card = event.target.closest('.question-card');
+            if (!card) return;
+            const state = getAnswerState(Number(card.dataset.questionId));
+            if (!state.submitted) {
+                state.answer = event.target.value;
+            }
         }
 
-        .restart-btn:hover {
-            background: #5568d3;
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+        function createQuestionCard(question, questionNum) {
+            // Cards share one skeleton, cloned instead of re-parsed
+            if (!cardPrototype) {
+                cardPrototype = document.createElement('div');
+                cardPrototype.className = 'question-card';
+                cardPrototype.innerHTML = `
+                    <div class="question-header">
+                        <div class="question-meta">
+                            <span class="badge badge-section"></span>
+                            <span class="badge badge-difficulty"></span>
+                        </div>
+                        <span class="question-number" style="color: #999; font-weight: 600;"></span>
+                    </div>
+                    <div class="question-text"></div>
+                    <div class="question-input"></div>
+                    <button class="submit-btn" data-action="submit"></button>
+                    <div class="feedback">
+                        <div class="feedback-header"></div>
+                        <div class="explanation"><strong>Explanation:</strong> <span class="explanation-text"></span></div>
+                    </div>
+                `;
+            }
+            return fillQuestionCard(cardPrototype.cloneNode(true), question, questionNum);
         }
-        """
 
-    def _get_javascript(self) -> str:
-        """Return JavaScript code for quiz interactivity."""
-        return """
-        // State management
-        let currentPage = 1;
-        let userAnswers = {}; // { questionId: { answer, isCorrect, submitted } }
-
-        // Initialize quiz
-        document.addEventListener('DOMContentLoaded', function() {
-            initializeQuiz();
-            renderCurrentPage();
-        });
+        function fillQuestionCard(card, question, questionNum) {
+            // (Re)bind a card to a question, updating its existing nodes in place
+            card.id = `question-${question.id}`;
+            card.dataset.questionId = question.id;
 
-        function initializeQuiz() {
-            // Initialize answer state for all questions
-            questions.forEach(q => {
-                userAnswers[q.id] = {
-                    answer: null,
-                    isCorrect: false,
-                    submitted: false
-                };
-            });
+            card.querySelector('.badge-section').textContent = `${question.section}: ${question.section_title}`;
+            const difficultyBadge = card.querySelector('.badge-difficulty');
+            difficultyBadge.className = `badge badge-difficulty badge-${question.difficulty.toLowerCase()}`;
+            difficultyBadge.textContent = question.difficulty;
+            card.querySelector('.question-number').textContent = `Question ${questionNum}/${totalQuestions}`;
+            card.querySelector('.question-text').textContent = question.question;
 
-            // Update quiz info with progress bar
-            updateQuizInfo();
+            fillQuestionInput(card.querySelector('.question-input'), question);
+            applyCardState(card, question);
+            return card;
         }
 
-        function updateQuizInfo() {
-            const answered = Object.values(userAnswers).filter(state => state.submitted).length;
-            const total = questions.length;
-            const percentage = total > 0 ? (answered / total * 100).toFixed(0) : 0;
+        function fillQuestionInput(wrapper, question) {
+            const state = getAnswerState(question.id);
+            let options = null;
+            if (question.type === 'Multiple Choice') options = question.options;
+            else if (question.type === 'True/False') options = ['True', 'False'];
 
-            document.getElementById('quiz-info').innerHTML = `
-                <div>Total Questions: ${total} | Pages: ${totalPages} | Answered: ${answered}/${total}</div>
-                <div class="progress-bar">
-                    <div class="progress-fill" style="width: ${percentage}%">
-                        ${percentage}%
-                    </div>
-                </div>
-            `;
-        }
+            if (!options) { // Short Answer
+                let input = wrapper.querySelector('.short-answer-input');
+                if (!input) {
+                    wrapper.innerHTML = '<input type="text" class="short-answer-input" placeholder="Type your answer here...">';
+                    input = wrapper.firstElementChild;
+                }
+                input.id = `input-${question.id}`;
+                input.value = state.answer || '';
+                return;
+            }
 
-        function renderCurrentPage() {
-            const startIdx = (currentPage - 1) * questionsPerPage;
-            const endIdx = Math.min(startIdx + questionsPerPage, questions.length);
-            const pageQuestions = questions.slice(startIdx, endIdx);
+            let list = wrapper.querySelector('.options');
+            if (!list) {
+                wrapper.innerHTML = '<div class="options"></div>';
+                list = wrapper.firstElementChild;
+            }
 
-            const container = document.getElementById('quiz-container');
-            container.innerHTML = '';
+            // Only add or drop rows when the number of options differs
+            while (list.children.length < options.length) {
+                const label = document.createElement('label');
+                label.className = 'option';
+                label.innerHTML = '<input type="radio"><span></span>';
+                list.appendChild(label);
+            }
+            while (list.children.length > options.length) {
+                list.lastElementChild.remove();
+            }
 
-            pageQuestions.forEach((q, idx) => {
-                const questionNum = startIdx + idx + 1;
-                container.appendChild(createQuestionCard(q, questionNum));
+            options.forEach((opt, idx) => {
+                const label = list.children[idx];
+                const input = label.querySelector('input');
+                input.name = `q${question.id}`;
+                input.id = `q${question.id}_opt${idx}`;
+                input.value = opt;
+                input.checked = state.answer === opt;
+                label.querySelector('span').textContent = `${String.fromCharCode(65 + idx)}) ${opt}`;
             });
-
-            updateNavigation();
         }
 
-        function createQuestionCard(question, questionNum) {
-            const card = document.createElement('div');
-            card.className = 'question-card';
-            card.id = `question-${question.id}`;
+        function applyCardState(card, question) {
+            // Reflect the answer state: classes, disabled inputs, button and feedback
+            const state = getAnswerState(question.id);
 
-            // Check if already answered
-            const state = userAnswers[question.id];
+            card.classList.remove('answered-correct', 'answered-incorrect');
             if (state.submitted) {
                 card.classList.add(state.isCorrect ? 'answered-correct' : 'answered-incorrect');
             }
 
-            // Difficulty badge class
-            const difficultyClass = `badge-${question.difficulty.toLowerCase()}`;
+            card.querySelectorAll('input').forEach(input => {
+                input.disabled = state.submitted;
+            });
 
-            card.innerHTML = `
-                <div class="question-header">
-                    <div class="question-meta">
-                        <span class="badge badge-section">${question.section}: ${question.section_title}</span>
-                        <span class="badge ${difficultyClass}">${question.difficulty}</span>
-                    </div>
-                    <span style="color: #999; font-weight: 600;">Question ${questionNum}/${questions.length}</span>
-                </div>
-                <div class="question-text">${question.question}</div>
-                ${renderQuestionInput(question)}
-                <button class="submit-btn" onclick="submitAnswer(${question.id})"
-                    ${state.submitted ? 'disabled' : ''}>
-                    ${state.submitted ? '✓ Submitted' : 'Submit Answer'}
-                </button>
-                <div class="feedback" id="feedback-${question.id}">
-                    <div class="feedback-header"></div>
-                    <div class="explanation"></div>
-                </div>
-            `;
+            // Option styling for MC/TF
+            card.querySelectorAll('.option').forEach(label => {
+                const value = label.querySelector('input').value;
+                label.className = 'option';
+                if (state.submitted) {
+                    label.classList.add('disabled');
+                    if (value === question.answer) {
+                        label.classList.add('correct');
+                    } else if (value === state.answer) {
+                        label.classList.add('incorrect');
+                    }
+                }
+            });
 
-            return card;
-        }
+            const btn = card.querySelector('.submit-btn');
+            btn.disabled = state.submitted;
+            btn.textContent = state.submitted ? '✓ Submitted' : 'Submit Answer';
 
-        function renderQuestionInput(question) {
-            const state = userAnswers[question.id];
-
-            if (question.type === 'Multiple Choice') {
-                return `
-                    <div class="options">
-                        ${question.options.map((opt, idx) => {
-                            const letter = String.fromCharCode(65 + idx);
-                            const optionId = `q${question.id}_opt${idx}`;
-                            const isUserAnswer = state.answer === opt;
-                            const isCorrect = opt === question.answer;
-
-                            let optionClass = 'option';
-                            if (state.submitted) {
-                                optionClass += ' disabled';
-                                if (isUserAnswer && isCorrect) optionClass += ' correct';
-                                if (isUserAnswer && !isCorrect) optionClass += ' incorrect';
-                                if (!isUserAnswer && isCorrect) optionClass += ' correct';
-                            }
-
-                            return `
-                                <label class="${optionClass}">
-                                    <input type="radio" name="q${question.id}" value="${opt}"
-                                        id="${optionId}" ${state.submitted ? 'disabled' : ''}
-                                        ${isUserAnswer ? 'checked' : ''}>
-                                    <span>${letter}) ${opt}</span>
-                                </label>
-                            `;
-                        }).join('')}
-                    </div>
-                `;
-            } else if (question.type === 'True/False') {
-                const options = ['True', 'False'];
-                return `
-                    <div class="options">
-                        ${options.map((opt, idx) => {
-                            const letter = String.fromCharCode(65 + idx);
-                            const optionId = `q${question.id}_opt${idx}`;
-                            const isUserAnswer = state.answer === opt;
-                            const isCorrect = opt === question.answer;
-
-                            let optionClass = 'option';
-                            if (state.submitted) {
-                                optionClass += ' disabled';
-                                if (isUserAnswer && isCorrect) optionClass += ' correct';
-                                if (isUserAnswer && !isCorrect) optionClass += ' incorrect';
-                                if (!isUserAnswer && isCorrect) optionClass += ' correct';
-                            }
-
-                            return `
-                                <label class="${optionClass}">
-                                    <input type="radio" name="q${question.id}" value="${opt}"
-                                        id="${optionId}" ${state.submitted ? 'disabled' : ''}
-                                        ${isUserAnswer ? 'checked' : ''}>
-                                    <span>${letter}) ${opt}</span>
-                                </label>
-                            `;
-                        }).join('')}
-                    </div>
-                `;
-            } else { // Short Answer
-                return `
-                    <input type="text" class="short-answer-input" id="input-${question.id}"
-                        placeholder="Type your answer here..."
-                        ${state.submitted ? 'disabled' : ''}
-                        value="${state.answer || ''}">
-                `;
+            const feedback = card.querySelector('.feedback');
+            feedback.className = 'feedback';
+            if (state.submitted) {
+                feedback.classList.add('show', state.isCorrect ? 'correct' : 'incorrect');
+                feedback.querySelector('.feedback-header').textContent = state.isCorrect
+                    ? '✓ Correct!'
+                    : `✗ Incorrect. The correct answer is: ${question.answer}`;
+                feedback.querySelector('.explanation-text').textContent = question.explanation;
             }
         }
 
+        function handleQuizClick(event) {
+            // Single delegated handler for every card's submit button
+            const button = event.target.closest('[data-action="submit"]');
+            if (!button) return;
+            const card = button.closest('.question-card');
+            submitAnswer(Number(card.dataset.questionId));
+        }
+
         function submitAnswer(questionId) {
-            const question = questions.find(q => q.id === questionId);
-            const state = userAnswers[questionId];
+            const question = findQuestion(questionId);
+            const state = getAnswerState(questionId);
+            const card = document.getElementById(`question-${questionId}`);
 
             // Prevent double submission
             if (state.submitted) return;
@@ -747,9 +898,9 @@ class HTMLQuizExporter:
             // Get user answer
             let userAnswer;
             if (question.type === 'Short Answer') {
-                userAnswer = document.getElementById(`input-${questionId}`).value.trim();
+                userAnswer = card.querySelector('.short-answer-input').value.trim();
             } else {
-                const selected = document.querySelector(`input[name="q${questionId}"]:checked`);
+                const selected = card.querySelector(`input[name="q${questionId}"]:checked`);
                 if (!selected) {
                     alert('Please select an answer before submitting.');
                     return;
@@ -769,63 +920,25 @@ class HTMLQuizExporter:
             state.answer = userAnswer;
             state.isCorrect = isCorrect;
             state.submitted = true;
+            answeredCount++;
+            if (isCorrect) correctCount++;
 
-            // Show feedback
-            displayFeedback(questionId, isCorrect, question.answer, question.explanation);
-
-            // Update UI
-            const card = document.getElementById(`question-${questionId}`);
-            card.classList.add(isCorrect ? 'answered-correct' : 'answered-incorrect');
-
-            // Disable submit button
-            const btn = card.querySelector('.submit-btn');
-            btn.disabled = true;
-            btn.textContent = '✓ Submitted';
-
-            // Disable inputs
-            if (question.type === 'Short Answer') {
-                document.getElementById(`input-${questionId}`).disabled = true;
-            } else {
-                document.querySelectorAll(`input[name="q${questionId}"]`).forEach(input => {
-                    input.disabled = true;
-                });
-            }
-
-            // Update option styling for MC/TF
-            if (question.type !== 'Short Answer') {
-                document.querySelectorAll(`input[name="q${questionId}"]`).forEach(input => {
-                    const label = input.parentElement;
-                    label.classList.add('disabled');
-
-                    if (input.value === question.answer) {
-                        label.classList.add('correct');
-                    } else if (input.checked && input.value !== question.answer) {
-                        label.classList.add('incorrect');
-                    }
-                });
-            }
+            // Update UI: feedback, card colour, disabled inputs and button
+            applyCardState(card, question);
 
             // Update progress indicator
             updateQuizInfo();
+            scheduleSave();
+
+            // The card grew with its feedback: re-measure the virtual window
+            scheduleVirtualUpdate();
 
             // Check if all questions answered
             checkQuizCompletion();
         }
 
-        function displayFeedback(questionId, isCorrect, correctAnswer, explanation) {
-            const feedback = document.getElementById(`feedback-${questionId}`);
-            const header = feedback.querySelector('.feedback-header');
-            const explanationDiv = feedback.querySelector('.explanation');
-
-            feedback.classList.add('show');
-            feedback.classList.add(isCorrect ? 'correct' : 'incorrect');
-
-            header.textContent = isCorrect ? '✓ Correct!' : `✗ Incorrect. The correct answer is: ${correctAnswer}`;
-            explanationDiv.innerHTML = `<strong>Explanation:</strong> ${explanation}`;
-        }
-
         function checkQuizCompletion() {
-            const allAnswered = Object.values(userAnswers).every(state => state.submitted);
+            const allAnswered = answeredCount === totalQuestions;
 
             if (allAnswered) {
                 // Add "Show Results" button to navigation
@@ -842,52 +955,27 @@ class HTMLQuizExporter:
         }
 
         function showResults() {
-            // Calculate score
-            const totalQuestions = questions.length;
-            const answeredQuestions = Object.values(userAnswers).filter(state => state.submitted).length;
+            // Multi-file export: the review lives in its own file
+            if (multiFile && !multiFile.results) {
+                goToFile(multiFile.resultsFile);
+                return;
+            }
+
+            // Score from the running counters
+            const answeredQuestions = answeredCount;
             const unansweredQuestions = totalQuestions - answeredQuestions;
-            const correctAnswers = Object.values(userAnswers).filter(state => state.isCorrect).length;
+            const correctAnswers = correctCount;
             const incorrectAnswers = answeredQuestions - correctAnswers;
             const percentage = answeredQuestions > 0 ? ((correctAnswers / answeredQuestions) * 100).toFixed(1) : 0;
-            const overallPercentage = ((correctAnswers / totalQuestions) * 100).toFixed(1);
 
-            // Calculate performance by difficulty
+            // Performance by difficulty and by section, in a single pass
             const byDifficulty = {};
-            questions.forEach(q => {
-                if (!byDifficulty[q.difficulty]) {
-                    byDifficulty[q.difficulty] = { correct: 0, incorrect: 0, unanswered: 0, total: 0 };
-                }
-                byDifficulty[q.difficulty].total++;
-                const state = userAnswers[q.id];
-                if (state.submitted) {
-                    if (state.isCorrect) {
-                        byDifficulty[q.difficulty].correct++;
-                    } else {
-                        byDifficulty[q.difficulty].incorrect++;
-                    }
-                } else {
-                    byDifficulty[q.difficulty].unanswered++;
-                }
-            });
-
-            // Calculate performance by section
             const bySection = {};
-            questions.forEach(q => {
-                const sectionKey = `${q.section}: ${q.section_title}`;
-                if (!bySection[sectionKey]) {
-                    bySection[sectionKey] = { correct: 0, incorrect: 0, unanswered: 0, total: 0 };
-                }
-                bySection[sectionKey].total++;
+            forEachQuestion(q => {
                 const state = userAnswers[q.id];
-                if (state.submitted) {
-                    if (state.isCorrect) {
-                        bySection[sectionKey].correct++;
-                    } else {
-                        bySection[sectionKey].incorrect++;
-                    }
-                } else {
-                    bySection[sectionKey].unanswered++;
-                }
+                const outcome = !state || !state.submitted ? 'unanswered' : (state.isCorrect ? 'correct' : 'incorrect');
+                tallyOutcome(byDifficulty, q.difficulty, outcome);
+                tallyOutcome(bySection, `${q.section}: ${q.section_title}`, outcome);
             });
 
             // Performance rating
@@ -898,8 +986,8 @@ class HTMLQuizExporter:
             else if (percentage >= 60) rating = 'Passable 📚';
             else rating = 'Keep Studying! 💪';
 
-            // Generate results HTML
-            let resultsHTML = `
+            // Summary blocks are small (one card per difficulty/section): build them as one string
+            const parts = [`
                 <div class="score-summary">
                     <h3>Your Score</h3>
                     <div class="score">${correctAnswers} / ${answeredQuestions}</div>
@@ -934,100 +1022,145 @@ class HTMLQuizExporter:
                 <div class="performance-breakdown">
                     <h3>📊 Performance by Difficulty</h3>
                     <div class="difficulty-stats">
-            `;
-
+            `];
             Object.keys(byDifficulty).sort().forEach(difficulty => {
-                const stats = byDifficulty[difficulty];
-                const answered = stats.correct + stats.incorrect;
-                const percent = answered > 0 ? ((stats.correct / answered) * 100).toFixed(0) : 0;
-                resultsHTML += `
-                    <div class="stat-card">
-                        <h4>${difficulty}</h4>
-                        <div class="stat-value">${stats.correct}/${answered}</div>
-                        <p style="color: #666; margin-top: 5px;">${percent}% correct</p>
-                        ${stats.unanswered > 0 ? `<p style="color: #ffc107; font-size: 0.9em;">${stats.unanswered} unanswered</p>` : ''}
-                    </div>
-                `;
+                parts.push(renderStatCard(difficulty, byDifficulty[difficulty]));
             });
-
-            resultsHTML += `
+            parts.push(`
                     </div>
                 </div>
 
                 <div class="performance-breakdown">
                     <h3>📚 Performance by Section</h3>
                     <div class="difficulty-stats">
-            `;
-
+            `);
             Object.keys(bySection).forEach(section => {
-                const stats = bySection[section];
-                const answered = stats.correct + stats.incorrect;
-                const percent = answered > 0 ? ((stats.correct / answered) * 100).toFixed(0) : 0;
-                resultsHTML += `
-                    <div class="stat-card">
-                        <h4>${section}</h4>
-                        <div class="stat-value">${stats.correct}/${answered}</div>
-                        <p style="color: #666; margin-top: 5px;">${percent}% correct</p>
-                        ${stats.unanswered > 0 ? `<p style="color: #ffc107; font-size: 0.9em;">${stats.unanswered} unanswered</p>` : ''}
-                    </div>
-                `;
+                parts.push(renderStatCard(section, bySection[section]));
             });
-
-            resultsHTML += `
+            parts.push(`
                     </div>
                 </div>
 
                 <div class="question-review">
                     <h3>📝 Question Review</h3>
-            `;
-
-            questions.forEach((q, idx) => {
-                const state = userAnswers[q.id];
-                let resultClass, icon, statusText;
-
-                if (!state.submitted) {
-                    resultClass = '';
-                    icon = '-';
-                    statusText = 'Not answered';
-                } else if (state.isCorrect) {
-                    resultClass = 'correct';
-                    icon = '✓';
-                    statusText = '';
-                } else {
-                    resultClass = 'incorrect';
-                    icon = '✗';
-                    statusText = '';
-                }
-
-                resultsHTML += `
-                    <div class="review-item ${resultClass}">
-                        <div class="review-question">${icon} Question ${idx + 1}: ${q.question}</div>
-                        ${state.submitted ? `
-                            <div class="review-answer">Your answer: <strong>${state.answer}</strong></div>
-                            ${!state.isCorrect ? `<div class="review-answer">Correct answer: <strong>${q.answer}</strong></div>` : ''}
-                        ` : `
-                            <div class="review-answer" style="color: #ffc107;"><strong>${statusText}</strong></div>
-                            <div class="review-answer">Correct answer: <strong>${q.answer}</strong></div>
-                        `}
-                    </div>
-                `;
-            });
-
-            resultsHTML += `
+                    <div id="review-list"></div>
+                    <button id="review-more-btn" class="submit-btn" onclick="renderReviewBatch()"></button>
                 </div>
                 <button class="restart-btn" onclick="restartQuiz()">🔄 Restart Quiz</button>
-            `;
+            `);
 
             // Hide quiz, show results
             document.getElementById('quiz-container').classList.add('hidden');
             document.getElementById('navigation').classList.add('hidden');
             document.getElementById('results-container').style.display = 'block';
-            document.getElementById('results-content').innerHTML = resultsHTML;
+            document.getElementById('results-content').innerHTML = parts.join('');
+
+            // The review list is rendered in batches as the student scrolls
+            reviewRendered = 0;
+            renderReviewBatch();
+            observeReviewEnd();
 
             // Scroll to top
             window.scrollTo({ top: 0, behavior: 'smooth' });
         }
 
+        function tallyOutcome(groups, key, outcome) {
+            if (!groups[key]) {
+                groups[key] = { correct: 0, incorrect: 0, unanswered: 0, total: 0 };
+            }
+            groups[key].total++;
+            groups[key][outcome]++;
+        }
+
+        function escapeHtml(text) {
+            const entities = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+            return String(text).replace(/[&<>"']/g, c => entities[c]);
+        }
+
+        function renderStatCard(title, stats) {
+            const answered = stats.correct + stats.incorrect;
+            const percent = answered > 0 ? ((stats.correct / answered) * 100).toFixed(0) : 0;
+            // Titles are section and difficulty names from the question bank
+            return `
+                    <div class="stat-card">
+                        <h4>${escapeHtml(title)}</h4>
+                        <div class="stat-value">${stats.correct}/${answered}</div>
+                        <p style="color: #666; margin-top: 5px;">${percent}% correct</p>
+                        ${stats.unanswered > 0 ? `<p style="color: #ffc107; font-size: 0.9em;">${stats.unanswered} unanswered</p>` : ''}
+                    </div>
+                `;
+        }
+
+        function renderReviewBatch() {
+            const list = document.getElementById('review-list');
+            const moreBtn = document.getElementById('review-more-btn');
+            if (!list) return;
+
+            // Build the batch off-document, then insert it in one operation
+            const end = Math.min(reviewRendered + REVIEW_BATCH_SIZE, totalQuestions);
+            const fragment = document.createDocumentFragment();
+            forEachQuestion((q, idx) => fragment.appendChild(createReviewItem(q, idx)), reviewRendered, end);
+            list.appendChild(fragment);
+            reviewRendered = end;
+
+            const remaining = totalQuestions - reviewRendered;
+            moreBtn.textContent = `Show more (${remaining} remaining)`;
+            moreBtn.classList.toggle('hidden', remaining === 0);
+        }
+
+        function observeReviewEnd() {
+            // Load the next batch automatically when the "Show more" button comes into view
+            if (!('IntersectionObserver' in window)) return;
+            if (reviewObserver) reviewObserver.disconnect();
+            reviewObserver = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting) && reviewRendered < totalQuestions) {
+                    renderReviewBatch();
+                }
+            }, { rootMargin: '600px' });
+            reviewObserver.observe(document.getElementById('review-more-btn'));
+        }
+
+        function createReviewItem(q, idx) {
+            const state = userAnswers[q.id];
+            const submitted = Boolean(state && state.submitted);
+            const item = document.createElement('div');
+
+            let icon = '-';
+            item.className = 'review-item';
+            if (submitted) {
+                icon = state.isCorrect ? '✓' : '✗';
+                item.classList.add(state.isCorrect ? 'correct' : 'incorrect');
+            }
+
+            const title = document.createElement('div');
+            title.className = 'review-question';
+            title.textContent = `${icon} Question ${idx + 1}: ${q.question}`;
+            item.appendChild(title);
+
+            if (submitted) {
+                item.appendChild(createReviewLine('Your answer: ', state.answer));
+                if (!state.isCorrect) {
+                    item.appendChild(createReviewLine('Correct answer: ', q.answer));
+                }
+            } else {
+                const status = createReviewLine('', 'Not answered');
+                status.style.color = '#ffc107';
+                item.appendChild(status);
+                item.appendChild(createReviewLine('Correct answer: ', q.answer));
+            }
+            return item;
+        }
+
+        function createReviewLine(label, value) {
+            const line = document.createElement('div');
+            line.className = 'review-answer';
+            line.appendChild(document.createTextNode(label));
+            const strong = document.createElement('strong');
+            strong.textContent = value;
+            line.appendChild(strong);
+            return line;
+        }
+
         function updateNavigation() {
             const prevBtn = document.getElementById('prev-btn');
             const nextBtn = document.getElementById('next-btn');
@@ -1046,34 +1179,61 @@ class HTMLQuizExporter:
             }
         }
 
+        function goToFile(file) {
+            // Multi-file export: answers travel through localStorage
+            saveAnswers();
+            window.location.href = file;
+        }
+
         function nextPage() {
-            if (currentPage < totalPages) {
+            if (multiFile && currentPage < totalPages) {
+                goToFile(multiFile.pages[currentPage]);
+            } else if (currentPage < totalPages) {
                 currentPage++;
                 renderCurrentPage();
+                scheduleSave();
                 window.scrollTo({ top: 0, behavior: 'smooth' });
             }
         }
 
         function previousPage() {
-            if (currentPage > 1) {
+            if (multiFile && currentPage > 1) {
+                goToFile(multiFile.pages[currentPage - 2]);
+            } else if (currentPage > 1) {
                 currentPage--;
                 renderCurrentPage();
+                scheduleSave();
                 window.scrollTo({ top: 0, behavior: 'smooth' });
             }
         }
 
         function restartQuiz() {
-            // Reset all answers
-            questions.forEach(q => {
-                userAnswers[q.id] = {
-                    answer: null,
-                    isCorrect: false,
-                    submitted: false
-                };
-            });
+            if (multiFile) {
+                clearSavedAnswers();
+                window.location.href = multiFile.pages[0];
+                return;
+            }
+            resetQuizState();
+            clearSavedAnswers();
+
+            // Re-render
+            updateQuizInfo();
+            renderCurrentPage();
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+        }
+
+        function resetQuizState() {
+            // Reset all answers (pre-rendered cards are refreshed when next shown)
+            if (prerendered) {
+                Object.keys(userAnswers).forEach(id => staleCards.add(Number(id)));
+            }
+            userAnswers = {};
+            answeredCount = 0;
+            correctCount = 0;
 
             // Reset UI
             currentPage = 1;
+            if (reviewObserver) reviewObserver.disconnect();
             document.getElementById('results-container').style.display = 'none';
             document.getElementById('quiz-container').classList.remove('hidden');
             document.getElementById('navigation').classList.remove('hidden');
@@ -1083,17 +1243,313 @@ class HTMLQuizExporter:
             if (showResultsBtn) {
                 showResultsBtn.remove();
             }
+        }
+        """
 
-            // Re-render
-            updateQuizInfo();
+
+class HTMLQuizBundleExporter:
+    """
+    Exports several quizzes to a single HTML file sharing one copy of the CSS/JS.
+
+    The page opens on an index of the quizzes. Questions are stored once in a
+    deduplicated pool of inert JSON blocks; each quiz only lists pool indices,
+    and a pool block is parsed the first time a quiz that uses it is opened.
+
+    The stylesheet, script and question payloads are those of a single
+    quiz, rendered by an HTMLQuizExporter the bundle holds (a bundle is not
+    a quiz: it has no single-page render or multi-file export).
+    """
+
+    # Questions per pool block: opening a quiz decodes only the blocks it uses
+    POOL_CHUNK_SIZE = 200
+
+    def __init__(self, quizzes: Dict[str, List[Question]]):
+        """
+        Initialize the bundle exporter.
+
+        Args:
+            quizzes: Mapping of quiz title to its list of Question objects, in
+                the order the quizzes should appear in the index
+        """
+        self.quizzes = quizzes
+        self._quiz_exporter = HTMLQuizExporter([q for questions in quizzes.values() for q in questions])
+
+    def export(self, filename: str = None, questions_per_page: Union[int, str] = 'all',
+               virtualize_threshold: int = 300, persist_answers: bool = True) -> str:
+        """
+        Export the bundle to an interactive HTML file.
+
+        Args:
+            filename: Output HTML filename. If None, auto-generates with timestamp
+            questions_per_page: Number of questions per page for every quiz, or
+                'all' for one page per quiz
+            virtualize_threshold: Pages holding more questions than this are
+                rendered with virtual scrolling
+            persist_answers: Save submitted answers to localStorage, per quiz
+
+        Returns:
+            Path to the generated HTML file
+        """
+        filename = resolve_filename(filename, prefix='quiz_bundle')
+        html_content = self._generate_bundle_html(questions_per_page, virtualize_threshold, persist_answers)
+
+        output_path = Path(filename)
+        output_path.write_text(html_content, encoding='utf-8')
+
+        return str(output_path.absolute())
+
+    def _build_pool(self) -> Tuple[List[Question], List[List[int]]]:
+        """Return the deduplicated question pool and each quiz's pool indices."""
+        pool = []
+        positions = {}
+        quiz_items = []
+        for questions in self.quizzes.values():
+            items = []
+            for question in questions:
+                key = question.content_hash()
+                if key not in positions:
+                    positions[key] = len(pool)
+                    pool.append(question)
+                items.append(positions[key])
+            quiz_items.append(items)
+        return pool, quiz_items
+
+    def _generate_bundle_html(self, questions_per_page: Union[int, str], virtualize_threshold: int,
+                              persist_answers: bool) -> str:
+        """Generate the complete bundle HTML document."""
+        pool, quiz_items = self._build_pool()
+
+        blocks = []
+        for chunk, start in enumerate(range(0, len(pool), self.POOL_CHUNK_SIZE)):
+            chunk_json = self._quiz_exporter._questions_to_json(pool[start:start + self.POOL_CHUNK_SIZE])
+            blocks.append(f'<script type="application/json" id="quiz-pool-{chunk}">{chunk_json}</script>')
+
+        index_items = []
+        for i, (title, questions) in enumerate(self.quizzes.items()):
+            per_page = len(questions) if questions_per_page == 'all' else int(questions_per_page)
+            per_page = max(per_page, 1)
+            meta = {
+                'title': title,
+                'items': quiz_items[i],
+                'questionsPerPage': per_page,
+                'virtualScroll': per_page > virtualize_threshold,
+                'storageKey': 'quizzmaker:' + HTMLQuizExporter(questions).content_hash(),
+            }
+            blocks.append(f'<script type="application/json" id="quiz-bundle-{i}">{json_for_script(meta)}</script>')
+            index_items.append(
+                f'<button class="bundle-item" data-quiz-index="{i}">'
+                f'<span class="bundle-title">{html.escape(title)}</span>'
+                f'<span class="bundle-count">{len(questions)} questions</span></button>'
+            )
+        payload = '\n    '.join(blocks)
+
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Quiz Bundle</title>
+    <style>
+        {quiz_stylesheet()}
+        {self._get_bundle_css()}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>📚 Quiz Bundle</h1>
+            <div id="quiz-info"></div>
+        </header>
+
+        <div id="bundle-index" class="bundle-list">
+            {''.join(index_items)}
+        </div>
+
+        <div id="quiz-view" class="hidden">
+            <div class="bundle-bar">
+                <button id="back-to-index" onclick="showBundleIndex()">← All Quizzes</button>
+                <h2 id="quiz-title"></h2>
+            </div>
+            {self._quiz_exporter._quiz_view_html()}
+        </div>
+    </div>
+
+    {payload}
+    <script>
+        // The open quiz's settings, set by openBundledQuiz
+        let questionsPerPage = 1;
+        let totalPages = 0;
+        let totalQuestions = 0;
+        let virtualScroll = false;
+        let storageKey = null;
+        let questions = [];
+        const lazyPages = false;
+        const prerendered = false;
+        const persistAnswers = {'true' if persist_answers else 'false'};
+        const bundleMode = true;
+        const multiFile = null;
+        const POOL_CHUNK_SIZE = {self.POOL_CHUNK_SIZE};
+
+        {self._quiz_exporter._get_javascript()}
+        {self._get_bundle_javascript()}
+    </script>
+</body>
+</html>"""
+
+    def _get_bundle_css(self) -> str:
+        """Return the extra CSS styles of the bundle index."""
+        return """
+        .bundle-list {
+            display: grid;
+            gap: 15px;
+        }
+
+        .bundle-item {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            background: #f8f9fa;
+            border: 2px solid #e0e0e0;
+            border-left: 6px solid #667eea;
+            border-radius: 12px;
+            padding: 20px 25px;
+            font-size: 1.1em;
+            cursor: pointer;
+            text-align: left;
+            transition: all 0.3s ease;
+        }
+
+        .bundle-item:hover {
+            border-color: #667eea;
+            background: #f0f3ff;
+        }
+
+        .bundle-title {
+            color: #333;
+            font-weight: 600;
+        }
+
+        .bundle-count {
+            color: #999;
+            font-size: 0.9em;
+        }
+
+        .bundle-bar {
+            display: flex;
+            align-items: center;
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+
+        .bundle-bar h2 {
+            color: #333;
+        }
+        """
+
+    def _get_bundle_javascript(self) -> str:
+        """Return the JavaScript switching between the index and the quizzes."""
+        return """
+        // Bundle state
+        const poolChunks = new Map(); // { chunk: [questions] } for decoded pool blocks
+
+        document.addEventListener('DOMContentLoaded', function() {
+            document.getElementById('bundle-index').addEventListener('click', event => {
+                const item = event.target.closest('[data-quiz-index]');
+                if (item) openBundledQuiz(Number(item.dataset.quizIndex));
+            });
+        });
+
+        function getPoolQuestion(poolIndex) {
+            // Pool blocks are parsed on first use and shared by every quiz
+            const chunk = Math.floor(poolIndex / POOL_CHUNK_SIZE);
+            if (!poolChunks.has(chunk)) {
+                poolChunks.set(chunk, JSON.parse(document.getElementById(`quiz-pool-${chunk}`).textContent));
+            }
+            return poolChunks.get(chunk)[poolIndex % POOL_CHUNK_SIZE];
+        }
+
+        function openBundledQuiz(index) {
+            const meta = JSON.parse(document.getElementById(`quiz-bundle-${index}`).textContent);
+
+            // Drop the previous quiz's state before switching settings
+            resetQuizState();
+            pageCache.clear();
+            questionIndex.clear();
+
+            questions = meta.items.map(getPoolQuestion);
+            questionsPerPage = meta.questionsPerPage;
+            totalQuestions = questions.length;
+            totalPages = Math.ceil(totalQuestions / questionsPerPage);
+            virtualScroll = meta.virtualScroll;
+            storageKey = meta.storageKey;
+
+            document.getElementById('quiz-title').textContent = meta.title;
+            document.getElementById('bundle-index').classList.add('hidden');
+            document.getElementById('quiz-view').classList.remove('hidden');
+
+            initializeQuiz();
             renderCurrentPage();
-            window.scrollTo({ top: 0, behavior: 'smooth' });
+            window.scrollTo({ top: 0 });
+        }
+
+        function showBundleIndex() {
+            saveAnswers();
+            virtualState.questions = []; // stops virtual scrolling updates
+            document.getElementById('quiz-view').classList.add('hidden');
+            document.getElementById('bundle-index').classList.remove('hidden');
+            document.getElementById('quiz-info').innerHTML = '';
+            window.scrollTo({ top: 0 });
         }
         """
 
 
+@lru_cache(maxsize=20000)
+def _card_markup(qid: Union[int, str], qtype: str, options: Tuple[str, ...], section: str, section_title: str,
+                 difficulty: str, text: str) -> Tuple[str, str]:
+    """
+    Render the card fragments of a question from the fields they show.
+
+    Keyed on those fields, the bounded cache is shared by all exporters so
+    bulk exports render each distinct card once, and an edited question
+    never reuses a stale card.
+    """
+    esc = html.escape
+    qid = esc(str(qid))
+    if qtype == 'Short Answer':
+        question_input = (f'<input type="text" class="short-answer-input" id="input-{qid}" '
+                          f'placeholder="Type your answer here...">')
+    else:
+        options = options if qtype == 'Multiple Choice' else ['True', 'False']
+        rows = []
+        for idx, opt in enumerate(options):
+            rows.append(
+                f'<label class="option"><input type="radio" name="q{qid}" id="q{qid}_opt{idx}" '
+                f'value="{esc(opt)}"><span>{chr(65 + idx)}) {esc(opt)}</span></label>'
+            )
+        question_input = f'<div class="options">{"".join(rows)}</div>'
+
+    head = (
+        f' id="question-{qid}" data-question-id="{qid}">'
+        f'<div class="question-header"><div class="question-meta">'
+        f'<span class="badge badge-section">{esc(section)}: {esc(section_title)}</span>'
+        f'<span class="badge badge-difficulty badge-{esc(difficulty.lower())}">'
+        f'{esc(difficulty)}</span></div>'
+        f'<span class="question-number" style="color: #999; font-weight: 600;">'
+    )
+    tail = (
+        f'</span></div>'
+        f'<div class="question-text">{esc(text)}</div>'
+        f'<div class="question-input">{question_input}</div>'
+        f'<button class="submit-btn" data-action="submit">Submit Answer</button>'
+        f'<div class="feedback"><div class="feedback-header"></div>'
+        f'<div class="explanation"><strong>Explanation:</strong> <span class="explanation-text"></span></div>'
+        f'</div></div>'
+    )
+    return head, tail
+
+
 def export_quiz_to_html(questions: List[Question], filename: str = None,
-                        questions_per_page: Union[int, str] = 'all') -> str:
+                        questions_per_page: Union[int, str] = 'all', **options) -> str:
     """
     Convenience function to export a quiz to HTML.
 
@@ -1101,9 +1557,29 @@ def export_quiz_to_html(questions: List[Question], filename: str = None,
         questions: List of Question objects
         filename: Output filename (auto-generated if None)
         questions_per_page: Number of questions per page or 'all'
+        **options: Extra export options forwarded to HTMLQuizExporter.export
+            (e.g. lazy_pages=True)
 
     Returns:
         Path to the generated HTML file
     """
     exporter = HTMLQuizExporter(questions)
-    return exporter.export(filename, questions_per_page)
+    return exporter.export(filename, questions_per_page, **options)
+
+
+def export_quiz_bundle_to_html(quizzes: Dict[str, List[Question]], filename: str = None,
+                               questions_per_page: Union[int, str] = 'all', **options) -> str:
+    """
+    Convenience function to export several quizzes to a single HTML file.
+
+    Args:
+        quizzes: Mapping of quiz title to its list of Question objects
+        filename: Output filename (auto-generated if None)
+        questions_per_page: Number of questions per page or 'all'
+        **options: Extra export options forwarded to HTMLQuizBundleExporter.export
+
+    Returns:
+        Path to the generated HTML file
+    """
+    exporter = HTMLQuizBundleExporter(quizzes)
+    return exporter.export(filename, questions_per_page, **options)
@@ -0,0 +1,332 @@
+"""
+Module d'analyse des items (questions) à partir des résultats accumulés.
+
+Ce module charge les résultats d'un journal (voir results_log) dans une
+matrice de réponses apprenant × question creuse (format COO en tableaux
+NumPy) et calcule de façon vectorisée, pour chaque question :
+
+    - la difficulté classique (p-value : proportion de bonnes réponses)
+    - la discrimination (corrélation point-bisériale avec le score du reste)
+    - la fréquence de choix de chaque option (analyse des distracteurs)
+"""
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+import csv
+
+import numpy as np
+
+from quizzmaker.models import CompactQuizSummary, QuestionBank, QuizSummary, questions_by_id
+from quizzmaker.results_log import iter_records
+
+# Seuils des signalements du rapport
+TOO_EASY = 0.95
+TOO_HARD = 0.20
+LOW_DISCRIMINATION = 0.20
+
+
+@dataclass
+class ItemStatistics:
+    """
+    Statistiques par question, en tableaux alignés sur question_ids.
+
+    Attributs:
+        question_ids (np.ndarray): IDs des questions, triés
+        responses (np.ndarray): Nombre de réponses par question
+        p_values (np.ndarray): Proportion de bonnes réponses (NaN sans réponse)
+        point_biserial (np.ndarray): Corrélation entre la réussite à la question
+            et le score de l'apprenant aux autres questions (NaN si indéfinie)
+        option_counts (np.ndarray): Choix par option, de forme
+            (questions, options + 1) ; la colonne 0 compte les réponses non
+            codables (code -1 : réponse courte), la colonne k l'option k - 1
+    """
+    question_ids: np.ndarray
+    responses: np.ndarray
+    p_values: np.ndarray
+    point_biserial: np.ndarray
+    option_counts: np.ndarray
+
+    def flags(self, index: int) -> List[str]:
+        """
+        Retourne les signalements d'une question (trop facile, peu discriminante...).
+
+        Args:
+            index (int): Position de la question dans question_ids
+
+        Returns:
+            List[str]: Signalements, liste vide si la question est saine
+        """
+        flags = []
+        p, r = self.p_values[index], self.point_biserial[index]
+        if p > TOO_EASY:
+            flags.append('too_easy')
+        elif p < TOO_HARD:
+            flags.append('too_hard')
+        if r < 0:
+            flags.append('negative_discrimination')
+        elif r < LOW_DISCRIMINATION:
+            flags.append('low_discrimination')
+        return flags
+
+    def write_csv(self, filename: Union[str, Path], bank: Optional[QuestionBank] = None) -> None:
+        """
+        Écrit le rapport par question au format CSV.
+
+        Colonnes : question_id, section, difficulty, type, responses, p_value,
+        point_biserial, key (option correcte), option_A, option_B, ...
+        (proportion de choix de chaque option), free_text, flags.
+
+        Args:
+            filename (Union[str, Path]): Fichier CSV de destination
+            bank (Optional[QuestionBank]): Banque pour les colonnes descriptives
+        """
+        by_id = questions_by_id(bank) if bank is not None else {}
+        n_options = self.option_counts.shape[1] - 1
+        letters = [_option_letter(k) for k in range(n_options)]
+        shares = self.option_counts / np.maximum(self.responses, 1)[:, None]
+
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(['question_id', 'section', 'difficulty', 'type', 'responses',
+                             'p_value', 'point_biserial', 'key']
+                            + [f'option_{letter}' for letter in letters] + ['free_text', 'flags'])
+            for i, qid in enumerate(self.question_ids.tolist()):
+                question = by_id.get(qid)
+                key = question.answer_code(question.answer) if question else -1
+                writer.writerow(
+                    [qid,
+                     question.section if question else '',
+                     question.difficulty if question else '',
+                     question.type if question else '',
+                     int(self.responses[i]),
+                     _fmt(self.p_values[i]),
+                     _fmt(self.point_biserial[i]),
+                     letters[key] if 0 <= key < n_options else '']
+                    + [_fmt(share) for share in shares[i, 1:]]
+                    + [_fmt(shares[i, 0]), ' '.join(self.flags(i))]
+                )
+
+
+class ResponseMatrix:
+    """
+    Matrice de réponses apprenant × question, creuse (COO).
+
+    Chaque réponse est une entrée (apprenant, question, code de réponse,
+    correction) stockée dans quatre tableaux NumPy parallèles ; les
+    statistiques sont calculées par np.bincount, sans boucle Python.
+
+    Example:
+        >>> matrix = ResponseMatrix.from_log("results.jsonl", bank)
+        >>> stats = matrix.item_statistics()
+        >>> stats.write_csv("item_report.csv", bank)
+    """
+
+    def __init__(self, learner_index: np.ndarray, question_index: np.ndarray,
+                 answers: np.ndarray, correct: np.ndarray,
+                 learner_ids: List, question_ids: np.ndarray):
+        """
+        Initialise la matrice à partir de ses tableaux COO.
+
+        Args:
+            learner_index (np.ndarray): Ligne (apprenant) de chaque réponse
+            question_index (np.ndarray): Colonne (position dans question_ids)
+            answers (np.ndarray): Code de réponse (Question.answer_code)
+            correct (np.ndarray): Correction de chaque réponse (booléens)
+            learner_ids (List): Identifiant de chaque ligne
+            question_ids (np.ndarray): ID de question de chaque colonne
+        """
+        self.learner_index = np.asarray(learner_index, dtype=np.int64)
+        self.question_index = np.asarray(question_index, dtype=np.int64)
+        self.answers = np.asarray(answers, dtype=np.int64)
+        self.correct = np.asarray(correct, dtype=bool)
+        self.learner_ids = learner_ids
+        self.question_ids = np.asarray(question_ids, dtype=np.int64)
+
+    @property
+    def shape(self) -> tuple:
+        """Dimensions (apprenants, questions) de la matrice."""
+        return len(self.learner_ids), len(self.question_ids)
+
+    def __len__(self) -> int:
+        """Nombre de réponses (entrées non vides)."""
+        return len(self.correct)
+
+    @classmethod
+    def from_arrays(cls, learners: Iterable, question_ids: Iterable[int],
+                    answers: Iterable[int], correct: Iterable[bool]) -> 'ResponseMatrix':
+        """
+        Construit la matrice à partir de réponses en tableaux parallèles.
+
+        Args:
+            learners (Iterable): Identifiant d'apprenant de chaque réponse
+            question_ids (Iterable[int]): ID de question de chaque réponse
+            answers (Iterable[int]): Code de réponse de chaque réponse
+            correct (Iterable[bool]): Correction de chaque réponse
+
+        Returns:
+            ResponseMatrix: Matrice construite
+        """
+        learner_ids, learner_index = np.unique(np.asarray(learners), return_inverse=True)
+        ids, question_index = np.unique(np.asarray(question_ids, dtype=np.int64), return_inverse=True)
+        return cls(learner_index.ravel(), question_index.ravel(), answers, correct,
+                   learner_ids.tolist(), ids)
+
+    @classmethod
+    def from_summaries(cls, summaries: Iterable[Union[QuizSummary, CompactQuizSummary]],
+                       bank: Optional[QuestionBank] = None) -> 'ResponseMatrix':
+        """
+        Construit la matrice à partir de résumés de quiz.
+
+        Les quiz d'un même learner_id forment une seule ligne ; un quiz
+        sans learner_id forme sa propre ligne (apprenant anonyme).
+
+        Args:
+            summaries (Iterable): Résumés complets ou compacts
+            bank (Optional[QuestionBank]): Banque pour coder les réponses des
+                résumés complets (sans banque, leurs codes valent -1)
+
+        Returns:
+            ResponseMatrix: Matrice construite
+        """
+        return cls.from_records((s.to_dict() for s in summaries), bank)
+
+    @classmethod
+    def from_log(cls, path: Union[str, Path], bank: Optional[QuestionBank] = None) -> 'ResponseMatrix':
+        """
+        Construit la matrice en lisant un journal de résultats en flux.
+
+        Les lignes sont décodées directement (sans créer d'objets résumé),
+        et les réponses accumulées dans des tableaux compacts.
+
+        Args:
+            path (Union[str, Path]): Fichier actif du journal (ResultsLog)
+            bank (Optional[QuestionBank]): Banque pour coder les réponses des
+                enregistrements complets
+
+        Returns:
+            ResponseMatrix: Matrice construite
+        """
+        return cls.from_records(iter_records(path), bank)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], bank: Optional[QuestionBank] = None) -> 'ResponseMatrix':
+        """
+        Construit la matrice à partir d'enregistrements bruts (dictionnaires to_dict).
+
+        Args:
+            records (Iterable[dict]): Résumés complets ou compacts sérialisés
+                (ex: results_log.iter_records ou LogCursor.read)
+            bank (Optional[QuestionBank]): Banque pour coder les réponses des
+                enregistrements complets
+
+        Returns:
+            ResponseMatrix: Matrice construite
+        """
+        by_id = questions_by_id(bank) if bank is not None else {}
+        learner_rows: Dict[str, int] = {}
+        learner_ids: List = []
+        learners, questions, answers, correct = array('q'), array('q'), array('q'), array('b')
+
+        for record in records:
+            learner_id = record.get('learner_id')
+            if learner_id is None:
+                row = len(learner_ids)
+                learner_ids.append(None)
+            else:
+                row = learner_rows.get(learner_id)
+                if row is None:
+                    row = learner_rows[learner_id] = len(learner_ids)
+                    learner_ids.append(learner_id)
+
+            if 'responses' in record:
+                for qid, code, is_correct, _ in record['responses']:
+                    questions.append(qid)
+                    answers.append(code)
+                    correct.append(is_correct)
+                count = len(record['responses'])
+            else:
+                for result in record['results']:
+                    question = by_id.get(result['question_id'])
+                    questions.append(result['question_id'])
+                    answers.append(question.answer_code(result['user_answer']) if question else -1)
+                    correct.append(result['is_correct'])
+                count = len(record['results'])
+            learners.extend([row] * count)
+
+        ids, question_index = np.unique(np.frombuffer(questions, dtype=np.int64), return_inverse=True)
+        return cls(np.frombuffer(learners, dtype=np.int64), question_index.ravel(),
+                   np.frombuffer(answers, dtype=np.int64), np.frombuffer(correct, dtype=np.int8),
+                   learner_ids, ids)
+
+    def item_statistics(self) -> ItemStatistics:
+        """
+        Calcule difficulté, discrimination et choix des options par question.
+
+        La discrimination est la corrélation point-bisériale entre la réussite
+        à la question et le score de l'apprenant sur ses autres réponses
+        (score du reste, pour ne pas compter la question deux fois) ; les
+        apprenants n'ayant répondu qu'à cette question sont ignorés.
+
+        Returns:
+            ItemStatistics: Statistiques par question
+        """
+        n_learners, n_questions = self.shape
+        rows, cols = self.learner_index, self.question_index
+        x = self.correct.astype(np.float64)
+
+        responses = np.bincount(cols, minlength=n_questions)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            p_values = np.bincount(cols, weights=x, minlength=n_questions) / responses
+
+            # Score du reste de chaque réponse : réussite de l'apprenant ailleurs
+            learner_count = np.bincount(rows, minlength=n_learners)[rows] - 1
+            learner_score = np.bincount(rows, weights=x, minlength=n_learners)[rows] - x
+            w = (learner_count > 0).astype(np.float64)
+            y = np.where(learner_count > 0, learner_score / np.maximum(learner_count, 1), 0.0)
+
+            # Corrélation de Pearson par question à partir de sommes pondérées
+            n = np.bincount(cols, weights=w, minlength=n_questions)
+            sx = np.bincount(cols, weights=x * w, minlength=n_questions)
+            sy = np.bincount(cols, weights=y * w, minlength=n_questions)
+            syy = np.bincount(cols, weights=y * y * w, minlength=n_questions)
+            sxy = np.bincount(cols, weights=x * y * w, minlength=n_questions)
+            denominator = np.sqrt((n * sx - sx * sx) * (n * syy - sy * sy))
+            point_biserial = np.where(denominator > 0, (n * sxy - sx * sy) / denominator, np.nan)
+
+        width = int(self.answers.max(initial=-1)) + 2
+        option_counts = np.bincount(cols * width + (self.answers + 1),
+                                    minlength=n_questions * width).reshape(n_questions, width)
+
+        return ItemStatistics(self.question_ids, responses, p_values, point_biserial, option_counts)
+
+
+def analyze_log(path: Union[str, Path], bank: QuestionBank,
+                report: Optional[Union[str, Path]] = None) -> ItemStatistics:
+    """
+    Fonction utilitaire : analyse un journal et écrit le rapport par question.
+
+    Args:
+        path (Union[str, Path]): Fichier actif du journal de résultats
+        bank (QuestionBank): Banque de questions
+        report (Optional[Union[str, Path]]): Rapport CSV à écrire (optionnel)
+
+    Returns:
+        ItemStatistics: Statistiques par question
+    """
+    by_id = questions_by_id(bank)
+    stats = ResponseMatrix.from_log(path, by_id).item_statistics()
+    if report is not None:
+        stats.write_csv(report, by_id)
+    return stats
+
+
+def _option_letter(index: int) -> str:
+    """Lettre d'une option : A, B, ..., Z, puis 27, 28..."""
+    return chr(ord('A') + index) if index < 26 else str(index + 1)
+
+
+def _fmt(value: float) -> str:
+    """Formate une statistique pour le CSV (vide si indéfinie)."""
+    return '' if np.isnan(value) else f'{value:.4f}'
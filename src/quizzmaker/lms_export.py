@@ -0,0 +1,230 @@
+"""LMS Export - Streams questions to Moodle GIFT and IMS QTI 1.2 files."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Union
+from xml.sax.saxutils import escape, quoteattr
+import csv
+import re
+import sys
+
+from .models import Question
+
+Target = Union[str, Path, IO[str]]
+
+# Characters with a meaning in GIFT syntax are escaped with a backslash;
+# newlines would end the question, so they are written as \n
+# (chained str.replace: much faster than str.translate with string values)
+_GIFT_ESCAPES = [('\\', '\\\\')] + [(c, '\\' + c) for c in '~=#{}:'] + [('\r\n', '\n'), ('\n', '\\n')]
+# Characters XML 1.0 does not allow, even escaped
+_XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def iter_questions_from_csv(filename: Union[str, Path]) -> Iterator[Question]:
+    """
+    Yield the questions of a CSV bank one row at a time.
+
+    Unlike QuestionGenerator.load_from_csv, the bank is never loaded
+    whole, so memory stays bounded whatever its size.
+
+    Args:
+        filename: CSV file written by QuestionGenerator.save_to_csv
+
+    Yields:
+        Question objects, in file order
+    """
+    # Explanations and questions may be long: lift the default field limit
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    with open(filename, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield Question.from_dict(row)
+
+
+def write_gift(questions: Iterable[Question], target: Target, category: str = 'quizzmaker') -> int:
+    """
+    Write questions in Moodle GIFT format, one question at a time.
+
+    Each section becomes a question category (``<category>/<section> <title>``),
+    switched whenever the section changes, so a bank sorted by section
+    produces one category block per section.
+
+    Args:
+        questions: Any iterable of questions (a list, or a generator such as
+            iter_questions_from_csv for bounded memory)
+        target: Output path, or a text file object opened for writing
+        category: Top-level category of the imported questions
+
+    Returns:
+        Number of questions written
+    """
+    count = 0
+    section = None
+    with _open_target(target) as out:
+        for question in questions:
+            if question.section != section:
+                section = question.section
+                title = f'{section} {question.section_title}'.replace('/', '-')
+                out.write(f'$CATEGORY: {_single_line(category)}/{_single_line(title)}\n\n')
+            out.write(_gift_question(question))
+            count += 1
+    return count
+
+
+def write_qti(questions: Iterable[Question], target: Target, title: str = 'Quiz') -> int:
+    """
+    Write questions as an IMS QTI 1.2 assessment, one item at a time.
+
+    Multiple Choice and True/False questions become single-choice items
+    (response_lid); Short Answer questions become fill-in-the-blank items
+    (response_str) matched case-insensitively. Explanations are attached as
+    item feedback.
+
+    Args:
+        questions: Any iterable of questions
+        target: Output path, or a text file object opened for writing
+        title: Title of the assessment
+
+    Returns:
+        Number of questions written
+    """
+    count = 0
+    with _open_target(target) as out:
+        out.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<questestinterop xmlns="http://www.imsglobal.org/xsd/ims_qtiasiv1p2">\n'
+            f'  <assessment ident="quizzmaker" title={_xml_attr(title)}>\n'
+            '    <section ident="root_section">\n'
+        )
+        for question in questions:
+            out.write(_qti_item(question))
+            count += 1
+        out.write('    </section>\n  </assessment>\n</questestinterop>\n')
+    return count
+
+
+def _gift_question(question: Question) -> str:
+    """Return the GIFT text of one question."""
+    esc = _gift_escape
+    feedback = f'####{esc(question.explanation)}' if question.explanation else ''
+    if question.type == 'True/False':
+        answers = ('TRUE' if question.answer == 'True' else 'FALSE') + feedback
+    elif question.type == 'Short Answer':
+        answers = f'={esc(question.answer)}{feedback}'
+    else:
+        choices = [('=' if option == question.answer else '~') + esc(option) for option in question.options]
+        answers = '\n\t' + '\n\t'.join(choices) + (f'\n\t{feedback}' if feedback else '') + '\n'
+
+    return (
+        f'// id:{question.id} difficulty:{_single_line(question.difficulty)}\n'
+        f'::Q{question.id}::[plain]{esc(question.question)}{{{answers}}}\n\n'
+    )
+
+
+def _gift_escape(text: str) -> str:
+    """Escape GIFT special characters; newlines are written as \\n."""
+    text = str(text)
+    for char, escaped in _GIFT_ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
+
+
+def _single_line(text: str) -> str:
+    """Collapse a value onto one line (for comments and category names)."""
+    return ' '.join(str(text).split())
+
+
+def _qti_item(question: Question) -> str:
+    """Return the QTI <item> element of one question."""
+    text = _xml_text
+    ident = f'q{question.id}'
+    metadata = (
+        '        <itemmetadata><qtimetadata>\n'
+        f'          <qtimetadatafield><fieldlabel>question_type</fieldlabel>'
+        f'<fieldentry>{_QTI_TYPES.get(question.type, "multiple_choice_question")}</fieldentry></qtimetadatafield>\n'
+        f'          <qtimetadatafield><fieldlabel>difficulty</fieldlabel>'
+        f'<fieldentry>{text(question.difficulty)}</fieldentry></qtimetadatafield>\n'
+        f'          <qtimetadatafield><fieldlabel>section</fieldlabel>'
+        f'<fieldentry>{text(question.section)}</fieldentry></qtimetadatafield>\n'
+        '        </qtimetadata></itemmetadata>\n'
+    )
+
+    if question.type == 'Short Answer':
+        response = (
+            '          <response_str ident="response1" rcardinality="Single">\n'
+            '            <render_fib><response_label ident="answer1" rshuffle="No"/></render_fib>\n'
+            '          </response_str>\n'
+        )
+        condition = f'<varequal respident="response1" case="No">{text(question.answer)}</varequal>'
+    else:
+        options = question.options if question.type == 'Multiple Choice' else ['True', 'False']
+        labels = ''.join(
+            f'              <response_label ident="{ident}_{index}"><material>'
+            f'<mattext texttype="text/plain">{text(option)}</mattext></material></response_label>\n'
+            for index, option in enumerate(options)
+        )
+        response = (
+            '          <response_lid ident="response1" rcardinality="Single">\n'
+            '            <render_choice>\n'
+            f'{labels}'
+            '            </render_choice>\n'
+            '          </response_lid>\n'
+        )
+        correct = options.index(question.answer) if question.answer in options else 0
+        condition = f'<varequal respident="response1">{ident}_{correct}</varequal>'
+
+    feedback = display_feedback = ''
+    if question.explanation:
+        feedback = (
+            '        <itemfeedback ident="general_fb"><flow_mat><material>'
+            f'<mattext texttype="text/plain">{text(question.explanation)}</mattext>'
+            '</material></flow_mat></itemfeedback>\n'
+        )
+        display_feedback = '            <displayfeedback feedbacktype="Response" linkrefid="general_fb"/>\n'
+
+    return (
+        f'      <item ident="{ident}" title={_xml_attr(f"Question {question.id}")}>\n'
+        f'{metadata}'
+        '        <presentation>\n'
+        f'          <material><mattext texttype="text/plain">{text(question.question)}</mattext></material>\n'
+        f'{response}'
+        '        </presentation>\n'
+        '        <resprocessing>\n'
+        '          <outcomes><decvar maxvalue="100" minvalue="0" varname="SCORE" vartype="Decimal"/></outcomes>\n'
+        '          <respcondition continue="No">\n'
+        f'            <conditionvar>{condition}</conditionvar>\n'
+        '            <setvar action="Set" varname="SCORE">100</setvar>\n'
+        f'{display_feedback}'
+        '          </respcondition>\n'
+        '        </resprocessing>\n'
+        f'{feedback}'
+        '      </item>\n'
+    )
+
+
+_QTI_TYPES = {
+    'Multiple Choice': 'multiple_choice_question',
+    'True/False': 'true_false_question',
+    'Short Answer': 'short_answer_question',
+}
+
+
+def _xml_text(text: str) -> str:
+    """Escape text for XML content, dropping characters XML cannot carry."""
+    return escape(_XML_INVALID.sub('', str(text)))
+
+
+def _xml_attr(text: str) -> str:
+    """Return text as a quoted XML attribute value."""
+    return quoteattr(_XML_INVALID.sub('', str(text)))
+
+
+@contextmanager
+def _open_target(target: Target):
+    """Yield a writable text stream for a path or an already open file object."""
+    if hasattr(target, 'write'):
+        yield target
+    else:
+        # Large buffer: many small writes, few system calls
+        with open(target, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as f:
+            yield f
@@ -5,9 +5,12 @@ Ce module contient les classes de données représentant les questions
 et les résultats de quiz.
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+import hashlib
 import json
+import math
 
 
 @dataclass
@@ -78,6 +81,74 @@ class Question:
             explanation=str(data['explanation'])
         )
     
+    def content_hash(self) -> str:
+        """
+        Calcule une empreinte stable du contenu de la question.
+
+        Deux questions aux champs identiques ont la même empreinte, ce qui
+        permet de détecter les modifications et de réutiliser des rendus.
+
+        Returns:
+            str: Empreinte SHA-1 hexadécimale
+        """
+        payload = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def choices(self) -> List[str]:
+        """
+        Retourne les réponses possibles d'une question à choix.
+
+        Returns:
+            List[str]: Options (Multiple Choice), ['True', 'False'] (True/False),
+            liste vide (Short Answer)
+        """
+        if self.type == 'Multiple Choice':
+            return self.options
+        if self.type == 'True/False':
+            return ['True', 'False']
+        return []
+
+    def answer_code(self, user_answer: str) -> int:
+        """
+        Code une réponse utilisateur par l'indice de l'option choisie.
+
+        Accepte le format de QuizRunner pour les choix multiples ("B) texte")
+        comme le texte seul de l'option.
+
+        Args:
+            user_answer (str): Réponse enregistrée dans un QuizResult
+
+        Returns:
+            int: Indice dans choices(), -1 si la réponse n'est pas une option
+            (Short Answer, réponse inconnue)
+        """
+        choices = self.choices()
+        if user_answer in choices:
+            return choices.index(user_answer)
+        # Format "lettre) option" : la lettre dépend de l'ordre mélangé à l'affichage
+        _, sep, text = user_answer.partition(') ')
+        if sep and text in choices:
+            return choices.index(text)
+        return -1
+
+    def answer_text(self, code: int, is_correct: bool) -> str:
+        """
+        Retrouve le texte d'une réponse codée par answer_code.
+
+        Args:
+            code (int): Code de la réponse
+            is_correct (bool): Si la réponse est correcte (Short Answer auto-évaluée)
+
+        Returns:
+            str: Texte de l'option choisie, ou verdict d'auto-évaluation
+        """
+        choices = self.choices()
+        if 0 <= code < len(choices):
+            return choices[code]
+        if self.type == 'Short Answer':
+            return "Auto-évalué: Correct" if is_correct else "Auto-évalué: Incorrect"
+        return ""
+
     def is_valid(self) -> tuple[bool, Optional[str]]:
         """
         Vérifie si la question est valide.
@@ -120,6 +191,7 @@ class QuizResult:
         correct_answer (str): Réponse correcte
         is_correct (bool): Si la réponse est correcte
         difficulty (str): Difficulté de la question
+        timestamp (Optional[float]): Heure de la réponse (secondes epoch, optionnel)
     """
     question_id: int
     question: str
@@ -127,10 +199,11 @@ class QuizResult:
     correct_answer: str
     is_correct: bool
     difficulty: str
+    timestamp: Optional[float] = None
     
     def to_dict(self) -> dict:
         """Convertit le résultat en dictionnaire."""
-        return {
+        data = {
             'question_id': self.question_id,
             'question': self.question,
             'user_answer': self.user_answer,
@@ -138,6 +211,30 @@ class QuizResult:
             'is_correct': self.is_correct,
             'difficulty': self.difficulty
         }
+        if self.timestamp is not None:
+            data['timestamp'] = self.timestamp
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuizResult':
+        """
+        Crée un QuizResult à partir d'un dictionnaire (lecture JSON).
+
+        Args:
+            data (dict): Dictionnaire produit par to_dict
+
+        Returns:
+            QuizResult: Instance de QuizResult créée
+        """
+        return cls(
+            question_id=data['question_id'],
+            question=data['question'],
+            user_answer=data['user_answer'],
+            correct_answer=data['correct_answer'],
+            is_correct=data['is_correct'],
+            difficulty=data['difficulty'],
+            timestamp=data.get('timestamp')
+        )
 
 
 @dataclass
@@ -150,20 +247,50 @@ class QuizSummary:
         total (int): Nombre total de questions
         percentage (float): Pourcentage de réussite
         results (List[QuizResult]): Liste des résultats par question
+        learner_id (Optional[str]): Identifiant de l'apprenant (optionnel)
+        cohort (Optional[str]): Groupe de l'apprenant, ex: classe ou session (optionnel)
     """
     score: int
     total: int
     percentage: float
     results: List[QuizResult]
+    learner_id: Optional[str] = None
+    cohort: Optional[str] = None
     
     def to_dict(self) -> dict:
         """Convertit le résumé en dictionnaire pour sauvegarde JSON."""
-        return {
+        data = {
             'score': self.score,
             'total': self.total,
             'percentage': self.percentage,
             'results': [r.to_dict() for r in self.results]
         }
+        # Champs optionnels : absents des sauvegardes sans apprenant ni groupe
+        if self.learner_id is not None:
+            data['learner_id'] = self.learner_id
+        if self.cohort is not None:
+            data['cohort'] = self.cohort
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuizSummary':
+        """
+        Crée un QuizSummary à partir d'un dictionnaire (lecture JSON).
+
+        Args:
+            data (dict): Dictionnaire produit par to_dict
+
+        Returns:
+            QuizSummary: Instance de QuizSummary créée
+        """
+        return cls(
+            score=data['score'],
+            total=data['total'],
+            percentage=data['percentage'],
+            results=[QuizResult.from_dict(r) for r in data['results']],
+            learner_id=data.get('learner_id'),
+            cohort=data.get('cohort')
+        )
     
     def get_performance_by_difficulty(self) -> dict:
         """
@@ -182,3 +309,372 @@ class QuizSummary:
                 difficulty_stats[diff]['correct'] += 1
         
         return difficulty_stats
+
+
+class CompactResult(NamedTuple):
+    """
+    Résultat d'une question, sans copie du texte de la question.
+
+    Un tuple de quatre valeurs : le texte, la bonne réponse et la difficulté
+    sont retrouvés dans la banque de questions (voir CompactQuizSummary.resolve).
+
+    Attributs:
+        question_id (int): ID de la question
+        answer (int): Code de la réponse (Question.answer_code, -1 si non codable)
+        is_correct (bool): Si la réponse est correcte
+        timestamp (Optional[float]): Heure de la réponse (secondes epoch)
+    """
+    question_id: int
+    answer: int
+    is_correct: bool
+    timestamp: Optional[float] = None
+
+
+QuestionBank = Union[Dict[int, Question], Iterable[Question]]
+
+
+def questions_by_id(bank: QuestionBank) -> Dict[int, Question]:
+    """Indexe une banque de questions par ID (un dictionnaire est utilisé tel quel)."""
+    return bank if isinstance(bank, dict) else {q.id: q for q in bank}
+
+
+# Codes de difficulté des résumés compacts (UNKNOWN_CODE : question hors banque)
+DIFFICULTIES = ('Easy', 'Medium', 'Hard')
+UNKNOWN_CODE = 255
+_DIFFICULTY_NAMES = {**dict(enumerate(DIFFICULTIES)), UNKNOWN_CODE: ''}
+
+
+class CompactQuizSummary:
+    """
+    Résumé de quiz normalisé : les questions sont référencées par ID.
+
+    Les résultats sont stockés dans des tableaux compacts plutôt qu'en
+    objets : IDs des questions (array 'i', ou 'q' si un ID dépasse 32
+    bits), codes de réponse (array 'h'), bonnes réponses en bitset (bit i
+    de l'octet i // 8), heures (array 'd', NaN si absente) et, une fois le
+    résumé classé d'après la banque, codes de difficulté et de section (un
+    octet ou deux par réponse). Un résumé
+    de 50 réponses occupe près de quatre fois moins de mémoire qu'une liste
+    de CompactResult.
+
+    Sérialisé par to_dict en une liste de tableaux [id, code, 0/1, heure],
+    environ dix fois plus petit que QuizSummary.to_dict. Le score est
+    calculé à la construction ; les performances par difficulté et par
+    section sont calculées au premier appel puis mises en cache (un résumé
+    n'est pas modifié après sa construction).
+
+    Attributs:
+        question_ids (array): ID de la question de chaque réponse
+        answers (array): Code de chaque réponse (Question.answer_code, -1 si non codable)
+        correct (bytes): Bitset des bonnes réponses
+        timestamps (Optional[array]): Heure de chaque réponse (None si aucune)
+        difficulty_codes (Optional[bytes]): Index dans DIFFICULTIES (None si non classé)
+        section_codes (Optional[array]): Index dans sections (None si non classé)
+        sections (Tuple[str, ...]): Sections référencées par section_codes (la
+            même table peut être partagée par plusieurs résumés)
+        learner_id (Optional[str]): Identifiant de l'apprenant (optionnel)
+        cohort (Optional[str]): Groupe de l'apprenant (optionnel)
+    """
+
+    __slots__ = ('question_ids', 'answers', 'correct', 'timestamps', 'difficulty_codes',
+                 'section_codes', 'sections', 'learner_id', 'cohort', 'score',
+                 '_by_difficulty', '_by_section')
+
+    def __init__(self, results: Iterable[CompactResult] = (), learner_id: Optional[str] = None,
+                 cohort: Optional[str] = None):
+        """
+        Crée un résumé compact à partir de résultats par question.
+
+        Args:
+            results (Iterable[CompactResult]): Résultats par question
+            learner_id (Optional[str]): Identifiant de l'apprenant (optionnel)
+            cohort (Optional[str]): Groupe de l'apprenant (optionnel)
+        """
+        results = list(results)
+        timestamps = [r.timestamp for r in results]
+        self._pack(
+            _id_array([r.question_id for r in results]),
+            array('h', [r.answer for r in results]),
+            _pack_bits([r.is_correct for r in results]),
+            _pack_timestamps(timestamps),
+            learner_id, cohort
+        )
+
+    @classmethod
+    def from_arrays(cls, question_ids: array, answers: array, correct: bytes,
+                    timestamps: Optional[array] = None, learner_id: Optional[str] = None,
+                    cohort: Optional[str] = None, difficulty_codes: Optional[bytes] = None,
+                    section_codes: Optional[array] = None, sections: Tuple[str, ...] = ()) -> 'CompactQuizSummary':
+        """
+        Crée un résumé compact directement à partir de tableaux (sans copie).
+
+        Args:
+            question_ids (array): IDs des questions (array 'i' ou 'q')
+            answers (array): Codes de réponse (array 'h')
+            correct (bytes): Bitset des bonnes réponses
+            timestamps (Optional[array]): Heures des réponses (array 'd', optionnel)
+            learner_id (Optional[str]): Identifiant de l'apprenant (optionnel)
+            cohort (Optional[str]): Groupe de l'apprenant (optionnel)
+            difficulty_codes (Optional[bytes]): Codes de difficulté (résumé déjà classé)
+            section_codes (Optional[array]): Codes de section (array 'H', résumé déjà classé)
+            sections (Tuple[str, ...]): Sections référencées par section_codes
+
+        Returns:
+            CompactQuizSummary: Instance créée
+        """
+        summary = cls.__new__(cls)
+        summary._pack(question_ids, answers, bytes(correct), timestamps, learner_id, cohort)
+        summary.difficulty_codes = difficulty_codes
+        summary.section_codes = section_codes
+        summary.sections = sections
+        return summary
+
+    def _pack(self, question_ids: array, answers: array, correct: bytes, timestamps: Optional[array],
+              learner_id: Optional[str], cohort: Optional[str]) -> None:
+        """Initialise les champs d'un résumé non classé."""
+        self.question_ids = question_ids
+        self.answers = answers
+        self.correct = correct
+        self.timestamps = timestamps
+        self.difficulty_codes = None
+        self.section_codes = None
+        self.sections = ()
+        self.learner_id = learner_id
+        self.cohort = cohort
+        self.score = bin(int.from_bytes(correct, 'little')).count('1')
+        self._by_difficulty = None
+        self._by_section = None
+
+    @property
+    def total(self) -> int:
+        """Nombre total de questions."""
+        return len(self.question_ids)
+
+    @property
+    def percentage(self) -> float:
+        """Pourcentage de réussite."""
+        return (self.score / self.total) * 100 if self.total else 0.0
+
+    @property
+    def results(self) -> List[CompactResult]:
+        """Résultats par question (reconstruits à chaque appel)."""
+        return [CompactResult(qid, code, bool(self.correct[i >> 3] >> (i & 7) & 1), timestamp)
+                for i, (qid, code, timestamp) in enumerate(zip(self.question_ids, self.answers,
+                                                               self._timestamp_values()))]
+
+    def is_correct(self, index: int) -> bool:
+        """Indique si la réponse numéro index est correcte."""
+        if not 0 <= index < self.total:
+            raise IndexError(index)
+        return bool(self.correct[index >> 3] >> (index & 7) & 1)
+
+    def classify(self, bank: QuestionBank) -> 'CompactQuizSummary':
+        """
+        Enregistre la difficulté et la section de chaque réponse d'après la banque.
+
+        Nécessaire aux performances par difficulté et par section d'un
+        résumé relu depuis un journal (to_dict ne contient que les IDs).
+
+        Args:
+            bank (QuestionBank): Questions (liste ou dictionnaire par ID)
+
+        Returns:
+            CompactQuizSummary: Ce résumé (classé)
+        """
+        by_id = questions_by_id(bank)
+        sections: Dict[str, int] = {}
+        difficulty_codes = bytearray()
+        section_codes = array('H')
+        for qid in self.question_ids:
+            question = by_id.get(qid)
+            if question is None:
+                difficulty_codes.append(UNKNOWN_CODE)
+                section = ''
+            else:
+                difficulty = question.difficulty
+                difficulty_codes.append(DIFFICULTIES.index(difficulty)
+                                        if difficulty in DIFFICULTIES else UNKNOWN_CODE)
+                section = question.section
+            section_codes.append(sections.setdefault(section, len(sections)))
+        self.difficulty_codes = bytes(difficulty_codes)
+        self.section_codes = section_codes
+        self.sections = tuple(sections)
+        self._by_difficulty = None
+        self._by_section = None
+        return self
+
+    def get_performance_by_difficulty(self) -> dict:
+        """
+        Calcule les performances par niveau de difficulté (même format que QuizSummary).
+
+        Returns:
+            dict: Dictionnaire avec stats par difficulté
+
+        Raises:
+            ValueError: Si le résumé n'est pas classé (voir classify)
+        """
+        if self._by_difficulty is None:
+            if self.difficulty_codes is None:
+                raise ValueError("Résumé non classé: appelez classify(bank) d'abord")
+            self._by_difficulty = self._breakdown(self.difficulty_codes, _DIFFICULTY_NAMES)
+        return {key: dict(stats) for key, stats in self._by_difficulty.items()}
+
+    def get_performance_by_section(self) -> dict:
+        """
+        Calcule les performances par section.
+
+        Returns:
+            dict: Dictionnaire avec stats par section ('' : question hors banque)
+
+        Raises:
+            ValueError: Si le résumé n'est pas classé (voir classify)
+        """
+        if self._by_section is None:
+            if self.section_codes is None:
+                raise ValueError("Résumé non classé: appelez classify(bank) d'abord")
+            self._by_section = self._breakdown(self.section_codes, self.sections)
+        return {key: dict(stats) for key, stats in self._by_section.items()}
+
+    def _breakdown(self, codes, names) -> dict:
+        """Compte bonnes réponses et réponses par code (dans l'ordre d'apparition)."""
+        stats = {}
+        correct = self.correct
+        for i, code in enumerate(codes):
+            counts = stats.get(code)
+            if counts is None:
+                counts = stats[code] = {'correct': 0, 'total': 0}
+            counts['total'] += 1
+            counts['correct'] += correct[i >> 3] >> (i & 7) & 1
+        return {names[code]: counts for code, counts in stats.items()}
+
+    def _timestamp_values(self) -> Iterable[Optional[float]]:
+        """Heure de chaque réponse (None si absente)."""
+        if self.timestamps is None:
+            return [None] * self.total
+        return [None if t != t else t for t in self.timestamps]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactQuizSummary):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (f"CompactQuizSummary(score={self.score}, total={self.total}, "
+                f"learner_id={self.learner_id!r}, cohort={self.cohort!r})")
+
+    @classmethod
+    def from_summary(cls, summary: QuizSummary, bank: QuestionBank) -> 'CompactQuizSummary':
+        """
+        Compacte un QuizSummary en codant les réponses d'après la banque.
+
+        Le résumé obtenu est classé (difficulté et section de chaque réponse).
+
+        Args:
+            summary (QuizSummary): Résumé complet
+            bank (QuestionBank): Questions du quiz (liste ou dictionnaire par ID)
+
+        Returns:
+            CompactQuizSummary: Résumé compact équivalent
+        """
+        by_id = questions_by_id(bank)
+        results = []
+        for r in summary.results:
+            question = by_id.get(r.question_id)
+            code = question.answer_code(r.user_answer) if question else -1
+            results.append(CompactResult(r.question_id, code, r.is_correct, r.timestamp))
+        return cls(results, learner_id=summary.learner_id, cohort=summary.cohort).classify(by_id)
+
+    def resolve(self, bank: QuestionBank) -> QuizSummary:
+        """
+        Reconstruit le QuizSummary complet par jointure avec la banque.
+
+        Les réponses à choix multiples sont restituées par le texte de
+        l'option (sans la lettre, qui dépendait de l'ordre d'affichage).
+
+        Args:
+            bank (QuestionBank): Questions (liste ou dictionnaire par ID)
+
+        Returns:
+            QuizSummary: Résumé complet
+
+        Raises:
+            KeyError: Si une question n'est plus dans la banque
+        """
+        by_id = questions_by_id(bank)
+        results = []
+        for r in self.results:
+            question = by_id[r.question_id]
+            results.append(QuizResult(
+                question_id=r.question_id,
+                question=question.question,
+                user_answer=question.answer_text(r.answer, r.is_correct),
+                correct_answer=question.answer,
+                is_correct=r.is_correct,
+                difficulty=question.difficulty,
+                timestamp=r.timestamp
+            ))
+        return QuizSummary(
+            score=self.score,
+            total=self.total,
+            percentage=self.percentage,
+            results=results,
+            learner_id=self.learner_id,
+            cohort=self.cohort
+        )
+
+    def to_dict(self) -> dict:
+        """Convertit le résumé en dictionnaire compact pour sauvegarde JSON."""
+        correct = self.correct
+        data = {'responses': [[qid, code, correct[i >> 3] >> (i & 7) & 1, timestamp]
+                              for i, (qid, code, timestamp) in enumerate(zip(
+                                  self.question_ids, self.answers, self._timestamp_values()))]}
+        if self.learner_id is not None:
+            data['learner_id'] = self.learner_id
+        if self.cohort is not None:
+            data['cohort'] = self.cohort
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CompactQuizSummary':
+        """
+        Crée un CompactQuizSummary à partir d'un dictionnaire (lecture JSON).
+
+        Args:
+            data (dict): Dictionnaire produit par to_dict
+
+        Returns:
+            CompactQuizSummary: Instance créée (non classée)
+        """
+        responses = data['responses']
+        return cls.from_arrays(
+            _id_array([r[0] for r in responses]),
+            array('h', [r[1] for r in responses]),
+            _pack_bits([r[2] for r in responses]),
+            _pack_timestamps([r[3] for r in responses]),
+            learner_id=data.get('learner_id'),
+            cohort=data.get('cohort')
+        )
+
+
+def _id_array(question_ids: List[int]) -> array:
+    """Code des IDs de question en array 'i', ou 'q' si l'un d'eux dépasse 32 bits."""
+    try:
+        return array('i', question_ids)
+    except OverflowError:
+        return array('q', question_ids)
+
+
+def _pack_bits(flags: List) -> bytes:
+    """Code une liste de booléens en bitset (bit i de l'octet i // 8)."""
+    bits = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+
+def _pack_timestamps(timestamps: List[Optional[float]]) -> Optional[array]:
+    """Code les heures en array 'd' (NaN si absente), None si aucune heure."""
+    if all(t is None for t in timestamps):
+        return None
+    return array('d', [math.nan if t is None else t for t in timestamps])
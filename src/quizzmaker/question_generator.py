@@ -5,10 +5,16 @@ Ce module permet de créer, valider et sauvegarder des questions
 dans une base de données CSV.
 """
 
+import csv
+import io
+import os
+import tempfile
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from dataclasses import fields
+from typing import Callable, List, Dict, Any, Optional
 from pathlib import Path
 
+from quizzmaker.lms_export import write_gift, write_qti
 from quizzmaker.models import Question
 
 
@@ -230,30 +236,149 @@ class QuestionGenerator:
             print(f"❌ Erreur lors du chargement: {e}")
             return False
     
-    def save_to_csv(self, filename: str) -> bool:
+    def save_to_csv(self, filename: str, append: bool = False) -> bool:
         """
         Sauvegarde les questions dans un fichier CSV.
-        
+
+        Les lignes sont écrites au fil de l'eau depuis les questions, sans
+        construire de DataFrame. Une réécriture complète passe par un
+        fichier temporaire renommé ensuite ; un ajout écrit seulement les
+        nouvelles lignes en fin de fichier et le tronque à sa taille
+        d'origine en cas d'échec. Une sauvegarde interrompue ne laisse
+        donc jamais de CSV tronqué.
+
         Args:
             filename (str): Chemin du fichier CSV de destination
-            
+            append (bool): Ajoute seulement les questions dont l'id n'est pas
+                déjà dans le fichier, au lieu de le réécrire entièrement
+
         Returns:
             bool: True si la sauvegarde a réussi
         """
         if not self.questions:
             print("❌ Aucune question à sauvegarder")
             return False
-        
+
+        path = Path(filename)
         try:
-            data = [q.to_dict() for q in self.questions]
-            df = pd.DataFrame(data)
-            df.to_csv(filename, index=False)
+            if append and path.exists():
+                count = self._append_to_csv(path)
+                print(f"✅ Ajouté {count} nouvelles questions dans {filename}")
+                return True
+
+            def write(f):
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(CSV_COLUMNS)
+                writer.writerows(_csv_row(q) for q in self.questions)
+
+            _replace_file(path, write)
             print(f"✅ Sauvegardé {len(self.questions)} questions dans {filename}")
             return True
         except Exception as e:
             print(f"❌ Erreur lors de la sauvegarde: {e}")
             return False
-    
+
+    def _append_to_csv(self, path: Path) -> int:
+        """
+        Ajoute à un CSV existant les questions qu'il ne contient pas encore.
+
+        Args:
+            path (Path): Fichier CSV existant
+
+        Returns:
+            int: Nombre de questions ajoutées
+
+        Raises:
+            ValueError: Si les colonnes du fichier ne correspondent pas
+        """
+        # Parcours en flux des ids existants (seule la colonne id est gardée)
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None and header != CSV_COLUMNS:
+                raise ValueError(f"Colonnes inattendues dans {path}: {header}")
+            existing = {row[0] for row in reader if row}
+
+        new_questions = [q for q in self.questions if str(q.id) not in existing]
+        if not new_questions:
+            return 0
+
+        # Seules les nouvelles lignes sont écrites, à la fin du fichier ; en
+        # cas d'échec, le fichier est tronqué à sa taille d'origine
+        with open(path, 'r+b', buffering=0) as f:
+            size = f.seek(0, os.SEEK_END)
+            # Un fichier édité à la main peut ne pas finir par un saut de ligne
+            if size > 0:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+            else:
+                needs_newline = False
+            try:
+                chunk = io.StringIO()
+                writer = csv.writer(chunk, lineterminator='\n')
+                if needs_newline:
+                    chunk.write('\n')
+                if header is None:
+                    writer.writerow(CSV_COLUMNS)
+                for question in new_questions:
+                    writer.writerow(_csv_row(question))
+                    if chunk.tell() >= _APPEND_CHUNK_SIZE:
+                        _write_all(f, chunk.getvalue().encode('utf-8'))
+                        chunk.seek(0)
+                        chunk.truncate()
+                _write_all(f, chunk.getvalue().encode('utf-8'))
+                os.fsync(f.fileno())
+            except BaseException:
+                f.truncate(size)
+                raise
+        return len(new_questions)
+
+    def export_gift(self, filename: str, category: str = 'quizzmaker') -> bool:
+        """
+        Exporte les questions au format GIFT (import Moodle).
+
+        Args:
+            filename (str): Chemin du fichier GIFT de destination
+            category (str): Catégorie racine des questions importées
+
+        Returns:
+            bool: True si l'export a réussi
+        """
+        if not self.questions:
+            print("❌ Aucune question à exporter")
+            return False
+
+        try:
+            count = write_gift(self.questions, filename, category)
+            print(f"✅ Exporté {count} questions au format GIFT dans {filename}")
+            return True
+        except Exception as e:
+            print(f"❌ Erreur lors de l'export GIFT: {e}")
+            return False
+
+    def export_qti(self, filename: str, title: str = 'Quiz') -> bool:
+        """
+        Exporte les questions au format IMS QTI 1.2 (XML).
+
+        Args:
+            filename (str): Chemin du fichier XML de destination
+            title (str): Titre de l'évaluation
+
+        Returns:
+            bool: True si l'export a réussi
+        """
+        if not self.questions:
+            print("❌ Aucune question à exporter")
+            return False
+
+        try:
+            count = write_qti(self.questions, filename, title)
+            print(f"✅ Exporté {count} questions au format QTI dans {filename}")
+            return True
+        except Exception as e:
+            print(f"❌ Erreur lors de l'export QTI: {e}")
+            return False
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Calcule les statistiques de la base de questions.
@@ -359,3 +484,60 @@ class QuestionGenerator:
                 return True
         print(f"❌ Question {question_id} non trouvée")
         return False
+
+
+# Colonnes du CSV : Question.to_dict sérialise chaque champ, dans l'ordre de déclaration
+CSV_COLUMNS = [field.name for field in fields(Question)]
+
+# Taille des blocs écrits lors d'un ajout au CSV
+_APPEND_CHUNK_SIZE = 1 << 16
+
+
+def _csv_row(question: Question) -> list:
+    """
+    Convertit une question en ligne CSV (les valeurs de to_dict).
+
+    Args:
+        question (Question): Question à convertir
+
+    Returns:
+        list: Valeurs dans l'ordre de CSV_COLUMNS
+
+    Raises:
+        ValueError: Si les clés de to_dict ne correspondent plus à CSV_COLUMNS
+    """
+    row = question.to_dict()
+    if len(row) != len(CSV_COLUMNS):
+        raise ValueError(f"Question.to_dict ne correspond pas aux colonnes du CSV: {list(row)}")
+    return list(row.values())
+
+
+def _write_all(f, data: bytes) -> None:
+    """Écrit tout data dans un fichier non tamponné (write peut être partiel)."""
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _replace_file(path: Path, write: Callable) -> None:
+    """
+    Écrit un fichier dans un fichier temporaire voisin, puis le renomme.
+
+    Une écriture interrompue laisse le fichier d'origine intact.
+
+    Args:
+        path (Path): Fichier de destination
+        write (Callable): Reçoit le fichier temporaire ouvert en texte et l'écrit
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent.absolute(), prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp crée le fichier en 0600 : garder les droits habituels
+        os.chmod(tmp_name, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
@@ -8,11 +8,14 @@ avec filtres, et exécuter des sessions interactives avec l'utilisateur.
 import pandas as pd
 import json
 import random
+import time
+from dataclasses import replace
 from typing import List, Dict, Optional
 from pathlib import Path
 
-from quizzmaker.models import Question, QuizResult, QuizSummary
+from quizzmaker.models import CompactQuizSummary, Question, QuizResult, QuizSummary
 from quizzmaker.html_exporter import export_quiz_to_html
+from quizzmaker.results_log import ResultsLog
 
 
 class QuizRunner:
@@ -176,7 +179,8 @@ class QuizRunner:
                 user_answer=user_answer,
                 correct_answer=question.answer,
                 is_correct=is_correct,
-                difficulty=question.difficulty
+                difficulty=question.difficulty,
+                timestamp=round(time.time(), 3)
             )
             results.append(result)
             
@@ -336,6 +340,9 @@ class QuizRunner:
         """
         Sauvegarde les résultats du dernier quiz dans un fichier JSON.
 
+        L'heure des réponses n'est pas écrite : le format du fichier reste
+        celui des versions précédentes (voir log_results).
+
         Args:
             filename (str): Nom du fichier de destination (défaut: "quiz_results.json")
 
@@ -352,21 +359,72 @@ class QuizRunner:
             return False
 
         try:
+            data = self.current_summary.to_dict()
+            for result in data['results']:
+                result.pop('timestamp', None)
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.current_summary.to_dict(), f, indent=2, ensure_ascii=False)
+                json.dump(data, f, indent=2, ensure_ascii=False)
             print(f"💾 Résultats sauvegardés dans {filename}")
             return True
         except Exception as e:
             print(f"❌ Erreur lors de la sauvegarde: {e}")
             return False
 
-    def export_html_quiz(self, filename: str = None, questions_per_page: str = 'all') -> Optional[str]:
+    def log_results(self, log: ResultsLog, learner_id: Optional[str] = None,
+                    compact: bool = False, cohort: Optional[str] = None) -> bool:
+        """
+        Ajoute les résultats du dernier quiz à un journal JSONL.
+
+        Contrairement à save_results (un fichier JSON par quiz), le journal
+        regroupe tous les quiz, une ligne compacte par quiz, écrits par lots.
+        Les résultats journalisés portent l'heure de chaque réponse.
+
+        Args:
+            log (ResultsLog): Journal de destination
+            learner_id (Optional[str]): Identifiant de l'apprenant à enregistrer
+            compact (bool): Enregistre un CompactQuizSummary (IDs et codes de
+                réponse, sans le texte des questions)
+            cohort (Optional[str]): Groupe de l'apprenant à enregistrer
+
+        Returns:
+            bool: True si le résultat a été ajouté
+
+        Example:
+            >>> with ResultsLog("resultats.jsonl") as log:
+            ...     runner.run_quiz()
+            ...     runner.log_results(log, learner_id="alice")
+        """
+        if not self.current_summary:
+            print("❌ Aucun résultat à sauvegarder")
+            return False
+
+        try:
+            # Identité posée sur la copie journalisée : current_summary (et
+            # donc save_results) ne dépend pas des journaux déjà écrits
+            summary = self.current_summary
+            identity = {name: value for name, value in (('learner_id', learner_id), ('cohort', cohort))
+                        if value is not None}
+            if identity:
+                summary = replace(summary, **identity)
+            if compact:
+                log.append(CompactQuizSummary.from_summary(summary, self.quiz_questions))
+            else:
+                log.append(summary)
+            return True
+        except Exception as e:
+            print(f"❌ Erreur lors de l'écriture du journal: {e}")
+            return False
+
+    def export_html_quiz(self, filename: str = None, questions_per_page: str = 'all',
+                         **export_options) -> Optional[str]:
         """
         Exporte le quiz actuel vers un fichier HTML interactif.
 
         Args:
             filename (str): Nom du fichier HTML (auto-généré avec timestamp si None)
             questions_per_page (Union[int, str]): Nombre de questions par page, ou 'all' pour une seule page
+            **export_options: Options supplémentaires transmises à HTMLQuizExporter.export
+                (ex: lazy_pages=True pour décoder les pages à la demande)
 
         Returns:
             Optional[str]: Chemin du fichier HTML créé, None si échec
@@ -387,7 +445,8 @@ class QuizRunner:
             output_path = export_quiz_to_html(
                 self.quiz_questions,
                 filename=filename,
-                questions_per_page=questions_per_page
+                questions_per_page=questions_per_page,
+                **export_options
             )
             print(f"✅ Quiz HTML exporté vers: {output_path}")
             return output_path
@@ -0,0 +1,440 @@
+"""
+Module de journal des résultats de quiz.
+
+Ce module enregistre les résumés de quiz dans un journal JSONL en ajout
+seul (une ligne JSON compacte par quiz) au lieu d'un fichier JSON indenté
+par quiz, et les relit en flux sans charger le journal entier.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import re
+import threading
+
+from quizzmaker.models import CompactQuizSummary, QuestionBank, QuizSummary, questions_by_id
+
+
+class ResultsLog:
+    """
+    Journal JSONL des résultats de quiz, en ajout seul.
+
+    Les enregistrements sont mis en tampon puis écrits par lots (« group
+    commit ») : un seul appel système, et au plus un fsync, pour plusieurs
+    quiz. Le fichier actif peut tourner par taille et/ou par jour ; les
+    segments archivés sont nommés ``<nom>.<AAAA-MM-JJ>.<NNN>.jsonl`` et se
+    trient dans l'ordre chronologique.
+
+    Example:
+        >>> with ResultsLog("results/quiz.jsonl", max_bytes=50_000_000) as log:
+        ...     log.append(summary)
+        >>> for summary in iter_summaries("results/quiz.jsonl"):
+        ...     print(summary.percentage)
+    """
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 100,
+                 flush_interval: Optional[float] = None, max_bytes: Optional[int] = None,
+                 rotate_daily: bool = False, fsync: bool = True):
+        """
+        Initialise le journal (le fichier est ouvert au premier lot écrit).
+
+        Args:
+            path (Union[str, Path]): Fichier actif du journal (ex: "results.jsonl")
+            flush_every (int): Nombre d'enregistrements par lot (défaut: 100)
+            flush_interval (Optional[float]): Délai maximal en secondes avant
+                l'écriture d'un lot incomplet, par un minuteur démarré au
+                premier enregistrement du lot (défaut None: pas de minuteur).
+                Une erreur d'écriture du minuteur est levée par l'appel
+                suivant à append, flush ou close
+            max_bytes (Optional[int]): Taille au-delà de laquelle le fichier
+                actif est archivé (None: pas de rotation par taille)
+            rotate_daily (bool): Archive le fichier actif au changement de jour
+            fsync (bool): Force l'écriture sur disque à chaque lot
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every doit être au moins 1")
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self.fsync = fsync
+        self._buffer: List[str] = []
+        self._file = None
+        self._segment_date: Optional[date] = None
+        # Clé LogCursor du fichier actif (None tant qu'il est vide)
+        self._segment_key: Optional[str] = None
+        self._timer: Optional[threading.Timer] = None
+        self._timer_error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[str, int, List[str]], None]] = []
+        # Lots écrits pas encore transmis aux abonnés, et verrou qui garde leur ordre
+        self._written: List[Tuple[str, int, List[str]]] = []
+        self._notify_lock = threading.Lock()
+
+    def __enter__(self) -> 'ResultsLog':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def append(self, summary: Union[QuizSummary, CompactQuizSummary]) -> None:
+        """
+        Ajoute un résumé de quiz au journal.
+
+        L'enregistrement est écrit avec le lot suivant : quand le tampon
+        atteint flush_every, flush_interval secondes après le premier
+        enregistrement du lot, ou à flush/close.
+
+        Args:
+            summary (Union[QuizSummary, CompactQuizSummary]): Résumé à enregistrer
+        """
+        line = json.dumps(summary.to_dict(), ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._raise_timer_error_locked()
+            self._buffer.append(line)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+            elif self._timer is None and self.flush_interval is not None:
+                self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+        self._notify()
+
+    def flush(self) -> None:
+        """Écrit le lot en attente sur disque."""
+        with self._lock:
+            self._raise_timer_error_locked()
+            self._flush_locked()
+        self._notify()
+
+    def close(self) -> None:
+        """Écrit le lot en attente et ferme le fichier actif."""
+        with self._lock:
+            self._raise_timer_error_locked()
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._notify()
+
+    def subscribe(self, callback: Callable[[str, int, List[str]], None]) -> None:
+        """
+        Abonne une fonction aux lots écrits.
+
+        Après chaque lot, la fonction reçoit la clé du segment écrit (celle
+        des positions de LogCursor), la position de début du lot dans ce
+        segment et ses lignes JSON (sans les relire).
+        Elle est appelée hors du verrou du journal, dans le thread qui a
+        appelé append, flush ou close : un lot écrit par le minuteur de
+        flush_interval est transmis au prochain de ces appels.
+
+        Args:
+            callback (Callable): Fonction appelée avec (segment, position, lignes)
+        """
+        self._subscribers.append(callback)
+
+    def segments(self) -> List[Path]:
+        """
+        Retourne les fichiers du journal dans l'ordre chronologique.
+
+        Returns:
+            List[Path]: Segments archivés puis fichier actif (s'il existe)
+        """
+        return log_segments(self.path)
+
+    def _flush_locked(self) -> None:
+        """
+        Écrit le tampon en un seul appel (le verrou doit être tenu).
+
+        Si l'écriture échoue, le fichier est ramené à sa taille d'avant le
+        lot et les lignes restent en tête du tampon pour le lot suivant.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        data = ''.join(lines).encode('utf-8')
+
+        f = offset = None
+        try:
+            f = self._open_segment(len(data))
+            offset = f.tell()
+            view = memoryview(data)
+            while view:  # un fichier non tamponné peut écrire partiellement
+                view = view[f.write(view):]
+            if self.fsync:
+                os.fsync(f.fileno())
+        except BaseException:
+            self._buffer[:0] = lines
+            if offset is not None:
+                try:
+                    f.truncate(offset)
+                except OSError:
+                    # Fichier inutilisable : rouvert (et sa ligne partielle
+                    # supprimée) au prochain lot
+                    f.close()
+                    self._file = None
+            raise
+
+        if self._segment_key is None:  # premier lot du segment : même clé que _segment_key(f)
+            first = data[:data.index(b'\n') + 1]
+            self._segment_key = f"{hashlib.sha1(first).hexdigest()}:{os.fstat(f.fileno()).st_ino}"
+        if self._subscribers:
+            self._written.append((self._segment_key, offset, lines))
+
+    def _timed_flush(self) -> None:
+        """Écrit le lot en attente depuis le minuteur ; une erreur est gardée pour l'appel suivant."""
+        with self._lock:
+            try:
+                self._flush_locked()
+            except BaseException as e:
+                self._timer_error = e
+
+    def _raise_timer_error_locked(self) -> None:
+        """Lève l'erreur d'une écriture du minuteur (le verrou doit être tenu)."""
+        error, self._timer_error = self._timer_error, None
+        if error is not None:
+            raise error
+
+    def _notify(self) -> None:
+        """Transmet les lots écrits aux abonnés, dans l'ordre d'écriture (hors du verrou du journal)."""
+        with self._notify_lock:
+            with self._lock:
+                written, self._written = self._written, []
+            for segment, offset, lines in written:
+                for callback in self._subscribers:
+                    callback(segment, offset, lines)
+
+    def _open_segment(self, incoming: int):
+        """Retourne le fichier actif, après rotation si nécessaire."""
+        today = datetime.now().date()
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size:
+                # Date du dernier écrit d'un journal existant
+                self._segment_date = datetime.fromtimestamp(self.path.stat().st_mtime).date()
+            else:
+                self._segment_date = today
+            _truncate_partial_line(self.path)
+            self._file = open(self.path, 'ab', buffering=0)
+            with open(self.path, 'rb') as f:
+                self._segment_key = _segment_key(f)
+
+        size = self._file.tell()
+        if size and ((self.max_bytes is not None and size + incoming > self.max_bytes)
+                     or (self.rotate_daily and self._segment_date != today)):
+            self._file.close()
+            os.replace(self.path, self._archive_name(self._segment_date))
+            self._file = open(self.path, 'ab', buffering=0)
+            self._segment_date = today
+            self._segment_key = None
+        elif not size:
+            self._segment_date = today
+        return self._file
+
+    def _archive_name(self, day: date) -> Path:
+        """Retourne le prochain nom de segment archivé libre pour un jour."""
+        prefix = f"{self.path.stem}.{day.isoformat()}."
+        numbers = [0]
+        for segment in log_segments(self.path):
+            if segment.name.startswith(prefix):
+                numbers.append(int(segment.name[len(prefix):-len(self.path.suffix) or None]))
+        return self.path.with_name(f"{prefix}{max(numbers) + 1:03d}{self.path.suffix}")
+
+
+def _truncate_partial_line(path: Path) -> None:
+    """Supprime la dernière ligne incomplète d'un journal (écriture interrompue)."""
+    if not path.exists():
+        return
+    with open(path, 'r+b') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 65536)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            f.truncate(position)
+
+
+def log_segments(path: Union[str, Path]) -> List[Path]:
+    """
+    Retourne les segments d'un journal dans l'ordre chronologique.
+
+    Args:
+        path (Union[str, Path]): Fichier actif du journal
+
+    Returns:
+        List[Path]: Segments archivés puis fichier actif (s'il existe)
+    """
+    path = Path(path)
+    pattern = re.compile(re.escape(path.stem) + r'\.(\d{4}-\d{2}-\d{2})\.(\d+)' + re.escape(path.suffix))
+    archived = []
+    if path.parent.is_dir():
+        for candidate in path.parent.iterdir():
+            match = pattern.fullmatch(candidate.name)
+            if match:
+                archived.append((match.group(1), int(match.group(2)), candidate))
+    segments = [p for _, _, p in sorted(archived)]
+    if path.exists():
+        segments.append(path)
+    return segments
+
+
+def iter_records(path: Union[str, Path]) -> Iterator[dict]:
+    """
+    Lit les enregistrements bruts d'un journal (dictionnaires to_dict), en flux.
+
+    Une dernière ligne incomplète (écriture interrompue) est ignorée.
+
+    Args:
+        path (Union[str, Path]): Fichier actif du journal
+
+    Yields:
+        dict: Enregistrements dans l'ordre d'écriture
+    """
+    for segment in log_segments(path):
+        with open(segment, encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                yield json.loads(line)
+
+
+class LogCursor:
+    """
+    Position de lecture dans un journal, pour ne lire que les nouveaux enregistrements.
+
+    Les segments sont identifiés par l'empreinte de leur première ligne et
+    leur numéro d'inode, et non par leur nom : un fichier actif renommé par
+    la rotation garde sa position, et deux segments commençant par le même
+    enregistrement restent distincts. Un journal copié ou restauré ailleurs
+    (autres inodes) reprend les positions des segments de même première
+    ligne, dans l'ordre. Les positions sont sérialisables (to_dict) et se
+    sauvegardent avec l'état du traitement qui les a consommées.
+
+    Example:
+        >>> cursor = LogCursor.from_dict(state.get('cursor', {}))
+        >>> for record in cursor.read("results.jsonl"):
+        ...     process(record)
+        >>> state['cursor'] = cursor.to_dict()
+    """
+
+    def __init__(self, offsets: Optional[Dict[str, int]] = None):
+        """
+        Initialise le curseur.
+
+        Args:
+            offsets (Optional[Dict[str, int]]): Position lue par empreinte de segment
+        """
+        self.offsets: Dict[str, int] = dict(offsets or {})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, int]) -> 'LogCursor':
+        """Crée un curseur à partir de positions sauvegardées par to_dict."""
+        return cls(data)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convertit le curseur en dictionnaire pour sauvegarde JSON."""
+        return dict(self.offsets)
+
+    def read(self, path: Union[str, Path]) -> Iterator[dict]:
+        """
+        Lit les enregistrements écrits depuis la dernière lecture.
+
+        La position avance à chaque enregistrement retourné. Les segments
+        qui n'existent plus sont oubliés à la fin d'une lecture complète.
+
+        Args:
+            path (Union[str, Path]): Fichier actif du journal
+
+        Yields:
+            dict: Nouveaux enregistrements dans l'ordre d'écriture
+        """
+        segments = []
+        for segment in log_segments(path):
+            with open(segment, 'rb') as f:
+                key = _segment_key(f)
+            if key is not None:
+                segments.append((segment, key))
+        current = {key for _, key in segments}
+
+        for segment, key in segments:
+            with open(segment, 'rb') as f:
+                if _segment_key(f) != key:
+                    continue  # renommé par une rotation pendant la lecture : lu la prochaine fois
+                if key not in self.offsets:
+                    self._adopt(key, current)
+                position = self.offsets.get(key, 0)
+                f.seek(position)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    position += len(line)
+                    self.offsets[key] = position
+                    yield json.loads(line)
+        for key in set(self.offsets) - current:
+            del self.offsets[key]
+
+    def _adopt(self, key: str, current: set) -> None:
+        """
+        Reprend la position d'un segment de même première ligne qui n'existe plus sous son inode.
+
+        C'est le cas d'un journal copié ou restauré, ou d'un curseur sauvegardé
+        avant l'ajout de l'inode à la clé (empreinte seule).
+        """
+        digest = key.partition(':')[0]
+        for old in list(self.offsets):
+            if old not in current and old.partition(':')[0] == digest:
+                self.offsets[key] = self.offsets.pop(old)
+                return
+
+
+def _segment_key(f) -> Optional[str]:
+    """Retourne la clé d'un segment ouvert (empreinte de la première ligne:inode), None s'il est vide."""
+    f.seek(0)
+    first = f.readline()
+    if not first.endswith(b'\n'):
+        return None
+    return f"{hashlib.sha1(first).hexdigest()}:{os.fstat(f.fileno()).st_ino}"
+
+
+def iter_summaries(path: Union[str, Path], learner_id: Optional[str] = None,
+                   bank: Optional[QuestionBank] = None) -> Iterator[Union[QuizSummary, CompactQuizSummary]]:
+    """
+    Lit un journal en flux, segment par segment et ligne par ligne.
+
+    Une dernière ligne incomplète (écriture interrompue) est ignorée.
+    Les enregistrements compacts sont reconstruits par jointure avec la
+    banque si elle est fournie, et retournés tels quels sinon.
+
+    Args:
+        path (Union[str, Path]): Fichier actif du journal
+        learner_id (Optional[str]): Ne retourne que les quiz de cet apprenant
+        bank (Optional[QuestionBank]): Banque de questions pour résoudre les
+            enregistrements compacts
+
+    Yields:
+        Union[QuizSummary, CompactQuizSummary]: Résumés dans l'ordre d'écriture
+    """
+    by_id = questions_by_id(bank) if bank is not None else None
+    for data in iter_records(path):
+        if learner_id is not None and data.get('learner_id') != learner_id:
+            continue
+        if 'responses' not in data:
+            yield QuizSummary.from_dict(data)
+        elif by_id is None:
+            yield CompactQuizSummary.from_dict(data)
+        else:
+            yield CompactQuizSummary.from_dict(data).resolve(by_id)
@@ -0,0 +1,300 @@
+"""
+Module de vues matérialisées des résultats pour les tableaux de bord.
+
+Ce module maintient, dans une petite base SQLite, les compteurs de bonnes
+réponses par groupe (cohort) et par section, difficulté et question, ainsi
+que l'histogramme des scores. Les compteurs sont mis à jour avec les seuls
+nouveaux enregistrements d'un journal de résultats ; un tableau de bord les
+lit sans rien recalculer.
+
+La position de lecture du journal est enregistrée dans la même transaction
+que les compteurs : après un arrêt brutal, la reprise ne compte aucun
+enregistrement deux fois et n'en oublie aucun.
+"""
+
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import json
+import sqlite3
+import threading
+
+from quizzmaker.aggregation import ResultsAggregate, aggregate_records_by, question_lookup
+from quizzmaker.models import QuestionBank
+from quizzmaker.results_log import LogCursor, ResultsLog
+
+# Groupe réunissant tous les résultats (aucun nom de groupe ne peut lui être égal)
+ALL_COHORTS = None
+# Dimensions des compteurs
+DIMENSIONS = ('section', 'difficulty', 'question', 'score')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS aggregates (
+    cohort TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (cohort, dimension, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS totals (
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (dimension, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS log_cursors (
+    log TEXT PRIMARY KEY,
+    offsets TEXT NOT NULL
+);
+PRAGMA user_version = 1;
+"""
+
+
+class ResultsViews:
+    """
+    Compteurs de résultats persistés, mis à jour de façon incrémentale.
+
+    Chaque compteur est une paire (bonnes réponses, réponses) indexée par
+    (groupe, dimension, clé) : dimension 'section', 'difficulty' ou
+    'question', et 'score' pour l'histogramme (clé : tranche de 10 %,
+    total : nombre de quiz). Les quiz sans groupe sont comptés dans le
+    groupe ''. Le total de tous les quiz (ALL_COHORTS, soit None) est rangé
+    dans sa propre table : un groupe nommé '*' reste un groupe comme un autre.
+
+    Example:
+        >>> views = ResultsViews("dashboard.sqlite3", bank)
+        >>> views.catch_up("results.jsonl")        # rattrape le journal
+        >>> views.follow(log)                      # puis suit chaque lot écrit
+        >>> views.rates('section', cohort='2024-A')
+        {'1.1': (812, 1024), ...}
+    """
+
+    def __init__(self, db_path: Union[str, Path], bank: Optional[QuestionBank] = None,
+                 batch_records: int = 100000):
+        """
+        Ouvre (ou crée) la base des vues.
+
+        Args:
+            db_path (Union[str, Path]): Fichier SQLite (":memory:" pour des tests)
+            bank (Optional[QuestionBank]): Banque donnant la section (et la
+                difficulté des résultats compacts) de chaque question
+            batch_records (int): Enregistrements par transaction lors d'un rattrapage
+        """
+        self.lookup = question_lookup(bank)
+        self.batch_records = batch_records
+        self._connection = sqlite3.connect(str(db_path))
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Ferme la base."""
+        self._connection.close()
+
+    def __enter__(self) -> 'ResultsViews':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def catch_up(self, log_path: Union[str, Path]) -> int:
+        """
+        Applique les enregistrements du journal écrits depuis la dernière mise à jour.
+
+        Les compteurs et la position dans le journal sont validés ensemble,
+        par transactions de batch_records enregistrements.
+
+        Args:
+            log_path (Union[str, Path]): Fichier actif du journal de résultats
+
+        Returns:
+            int: Nombre d'enregistrements appliqués
+        """
+        key = str(Path(log_path).absolute())
+        with self._lock:
+            cursor = self._load_cursor(key)
+            applied = 0
+            records = cursor.read(log_path)
+            while True:
+                # Le lot est agrégé au fil de la lecture : la mémoire dépend du
+                # nombre de compteurs, pas de batch_records
+                taken = [0]
+                batch = aggregate_records_by(_counted(islice(records, self.batch_records), taken),
+                                             self.lookup, _cohort)
+                with self._connection:
+                    self._apply(batch)
+                    self._store_cursor(key, cursor)
+                applied += taken[0]
+                if taken[0] < self.batch_records:
+                    break
+            return applied
+
+    def follow(self, log: ResultsLog) -> None:
+        """
+        Abonne les vues à un journal : chaque lot écrit est appliqué aussitôt.
+
+        Les lignes du lot sont appliquées telles que le journal les transmet,
+        sans relire le fichier, et la position du segment avance dans la
+        même transaction. Un lot qui ne suit pas la position enregistrée
+        (écrit par un autre processus entre-temps) est lu par catch_up.
+
+        Args:
+            log (ResultsLog): Journal à suivre
+        """
+        self.catch_up(log.path)
+        log.subscribe(lambda segment, offset, lines: self._apply_lines(log.path, segment, offset, lines))
+
+    def rate(self, dimension: str, key: Union[str, int],
+             cohort: Optional[str] = ALL_COHORTS) -> Tuple[int, int]:
+        """
+        Lit un compteur (une recherche par clé primaire).
+
+        Args:
+            dimension (str): 'section', 'difficulty', 'question' ou 'score'
+            key (Union[str, int]): Section, difficulté, ID de question ou tranche
+            cohort (Optional[str]): Groupe (ALL_COHORTS pour tous)
+
+        Returns:
+            Tuple[int, int]: (bonnes réponses, réponses), (0, 0) si absent
+        """
+        with self._lock:
+            row = self._select("correct, total", cohort, "dimension = ? AND key = ?",
+                               (dimension, str(key))).fetchone()
+        return tuple(row) if row else (0, 0)
+
+    def rates(self, dimension: str, cohort: Optional[str] = ALL_COHORTS) -> Dict[str, Tuple[int, int]]:
+        """
+        Lit tous les compteurs d'une dimension pour un groupe.
+
+        Args:
+            dimension (str): 'section', 'difficulty', 'question' ou 'score'
+            cohort (Optional[str]): Groupe (ALL_COHORTS pour tous)
+
+        Returns:
+            Dict[str, Tuple[int, int]]: (bonnes réponses, réponses) par clé
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Dimension inconnue: {dimension} (attendu: {', '.join(DIMENSIONS)})")
+        with self._lock:
+            rows = self._select("key, correct, total", cohort, "dimension = ? ORDER BY key",
+                                (dimension,)).fetchall()
+        return {key: (correct, total) for key, correct, total in rows}
+
+    def rates_by_cohort(self, dimension: str) -> Dict[Optional[str], Dict[str, Tuple[int, int]]]:
+        """
+        Lit tous les compteurs d'une dimension, pour tous les groupes à la fois.
+
+        Args:
+            dimension (str): 'section', 'difficulty', 'question' ou 'score'
+
+        Returns:
+            Dict[Optional[str], Dict[str, Tuple[int, int]]]: (bonnes réponses,
+                réponses) par groupe (ALL_COHORTS compris) puis par clé
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Dimension inconnue: {dimension} (attendu: {', '.join(DIMENSIONS)})")
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT NULL, key, correct, total FROM totals WHERE dimension = ? "
+                "UNION ALL SELECT cohort, key, correct, total FROM aggregates WHERE dimension = ? "
+                "ORDER BY 1, 2", (dimension, dimension)).fetchall()
+        by_cohort: Dict[Optional[str], Dict[str, Tuple[int, int]]] = {}
+        for cohort, key, correct, total in rows:
+            by_cohort.setdefault(cohort, {})[key] = (correct, total)
+        return by_cohort
+
+    def quizzes(self, cohort: Optional[str] = ALL_COHORTS) -> int:
+        """Retourne le nombre de quiz d'un groupe."""
+        return sum(total for _, total in self.rates('score', cohort).values())
+
+    def cohorts(self) -> List[str]:
+        """Retourne les groupes connus (sans ALL_COHORTS), triés."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT cohort FROM aggregates ORDER BY cohort").fetchall()
+        return [cohort for cohort, in rows]
+
+    def _apply_lines(self, log_path: Path, segment: str, offset: int, lines: List[str]) -> None:
+        """Applique un lot écrit dans un segment du journal à partir de la position offset."""
+        key = str(Path(log_path).absolute())
+        with self._lock:
+            cursor = self._load_cursor(key)
+            position = cursor.offsets.get(segment, 0)
+            if position > offset:
+                return  # déjà lu par un rattrapage
+            if position == offset:
+                batch = aggregate_records_by((json.loads(line) for line in lines), self.lookup, _cohort)
+                cursor.offsets[segment] = offset + len(''.join(lines).encode('utf-8'))
+                with self._connection:
+                    self._apply(batch)
+                    self._store_cursor(key, cursor)
+                return
+        self.catch_up(log_path)
+
+    def _load_cursor(self, key: str) -> LogCursor:
+        """Lit la position enregistrée dans un journal."""
+        row = self._connection.execute("SELECT offsets FROM log_cursors WHERE log = ?", (key,)).fetchone()
+        return LogCursor.from_dict(json.loads(row[0]) if row else {})
+
+    def _store_cursor(self, key: str, cursor: LogCursor) -> None:
+        """Enregistre la position dans un journal (dans la transaction en cours)."""
+        self._connection.execute("INSERT OR REPLACE INTO log_cursors (log, offsets) VALUES (?, ?)",
+                                 (key, json.dumps(cursor.to_dict())))
+
+    def _select(self, columns: str, cohort: Optional[str], where: str, params: tuple) -> sqlite3.Cursor:
+        """Lit les compteurs d'un groupe, ou le total de tous les groupes pour ALL_COHORTS."""
+        if cohort is ALL_COHORTS:
+            return self._connection.execute(f"SELECT {columns} FROM totals WHERE {where}", params)
+        return self._connection.execute(
+            f"SELECT {columns} FROM aggregates WHERE cohort = ? AND {where}", (cohort,) + params)
+
+    def _apply(self, aggregates: Dict[str, ResultsAggregate]) -> None:
+        """Ajoute les agrégats d'un lot, par groupe (dans la transaction en cours)."""
+        everyone = ResultsAggregate()
+        for cohort, aggregate in aggregates.items():
+            self._upsert(cohort, aggregate)
+            everyone.merge(aggregate)
+        if aggregates:
+            self._upsert(ALL_COHORTS, everyone)
+
+    def _upsert(self, cohort: Optional[str], aggregate: ResultsAggregate) -> None:
+        """Ajoute un agrégat aux compteurs d'un groupe (ALL_COHORTS : au total de tous les groupes)."""
+        if cohort is ALL_COHORTS:
+            self._connection.executemany(
+                "INSERT INTO totals (dimension, key, correct, total) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (dimension, key) DO UPDATE SET "
+                "correct = correct + excluded.correct, total = total + excluded.total",
+                _aggregate_rows(aggregate))
+            return
+        self._connection.executemany(
+            "INSERT INTO aggregates (cohort, dimension, key, correct, total) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (cohort, dimension, key) DO UPDATE SET "
+            "correct = correct + excluded.correct, total = total + excluded.total",
+            ((cohort, dimension, key, correct, total)
+             for dimension, key, correct, total in _aggregate_rows(aggregate)))
+
+
+def _aggregate_rows(aggregate: ResultsAggregate) -> Iterator[Tuple[str, str, int, int]]:
+    """Convertit un agrégat en lignes (dimension, clé, bonnes réponses, réponses)."""
+    for dimension, counts in (('section', aggregate.by_section()),
+                              ('difficulty', aggregate.by_difficulty()),
+                              ('question', aggregate.by_question)):
+        for key, (correct, total) in counts.items():
+            yield dimension, str(key), correct, total
+    for decile, quizzes in enumerate(aggregate.score_histogram):
+        if quizzes:
+            yield 'score', str(decile * 10), 0, quizzes
+
+
+def _cohort(record: dict) -> str:
+    """Retourne le groupe d'un enregistrement ('' sans groupe)."""
+    return record.get('cohort') or ''
+
+
+def _counted(records: Iterable[dict], taken: List[int]) -> Iterator[dict]:
+    """Transmet les enregistrements en les comptant dans taken[0]."""
+    for record in records:
+        taken[0] += 1
+        yield record
@@ -0,0 +1,209 @@
+"""
+Module de détection de copies par similarité des réponses.
+
+Ce module compare toutes les paires de copies d'un examen et signale les
+plus suspectes : celles qui partagent le plus de mauvaises réponses
+identiques (deux bonnes réponses identiques sont attendues, deux mêmes
+erreurs beaucoup moins). Les réponses sont encodées en matrices de bits
+copie × (question, option), 8 colonnes par octet, et les comptes de
+réponses communes de toutes les paires sont obtenus par produits
+matriciels NumPy (BLAS) sur des tuiles de copies décompressées en float32,
+bloc de copies par bloc de copies.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple, Union
+import csv
+import heapq
+
+import numpy as np
+
+from quizzmaker.item_analysis import ResponseMatrix
+
+# Nombre de bits à 1 de chaque octet
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+# Bits de chaque octet en float32, dans l'ordre de np.packbits
+_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).astype(np.float32)
+
+
+@dataclass
+class SuspiciousPair:
+    """
+    Paire de copies aux réponses anormalement semblables.
+
+    Attributs:
+        learner_a (str): Identifiant de la première copie
+        learner_b (str): Identifiant de la seconde copie
+        shared_wrong (int): Mauvaises réponses identiques (même option fausse)
+        identical (int): Réponses identiques, bonnes ou fausses
+        common (int): Questions à choix répondues par les deux copies
+        wrong_a (int): Mauvaises réponses de la première copie
+        wrong_b (int): Mauvaises réponses de la seconde copie
+    """
+    learner_a: str
+    learner_b: str
+    shared_wrong: int
+    identical: int
+    common: int
+    wrong_a: int
+    wrong_b: int
+
+    @property
+    def shared_wrong_ratio(self) -> float:
+        """Part des erreurs de la copie la moins fautive retrouvées dans l'autre."""
+        fewest = min(self.wrong_a, self.wrong_b)
+        return self.shared_wrong / fewest if fewest else 0.0
+
+
+def find_similar_pairs(matrix: ResponseMatrix, top_k: int = 20, min_shared_wrong: int = 1,
+                       block_size: int = 1024, workers: int = 1) -> List[SuspiciousPair]:
+    """
+    Retourne les paires de copies partageant le plus de mauvaises réponses.
+
+    Chaque ligne de la matrice (un learner_id, ou un quiz anonyme) est une
+    copie. Seules les questions à choix (code de réponse >= 0) sont
+    comparées ; une question répondue plusieurs fois par la même copie
+    compte pour sa dernière réponse. Les paires sont classées par mauvaises
+    réponses identiques, puis par réponses identiques.
+
+    Args:
+        matrix (ResponseMatrix): Réponses des copies
+        top_k (int): Nombre de paires retournées
+        min_shared_wrong (int): Mauvaises réponses communes minimales d'une paire
+        block_size (int): Copies comparées par produit matriciel (mémoire :
+            les réponses compressées, un bit par (copie, option), plus
+            quelques matrices block_size × nombre de copies par bloc)
+        workers (int): Blocs calculés en parallèle (threads : BLAS libère le GIL)
+
+    Returns:
+        List[SuspiciousPair]: Paires les plus suspectes, de la plus à la moins suspecte
+    """
+    chosen, wrong, answered = _encode(matrix)
+    n = chosen.shape[0]
+    n_questions = matrix.shape[1]
+    wrong_counts = _POPCOUNT[wrong].sum(axis=1, dtype=np.int64)
+
+    def block(start: int) -> List[Tuple[int, int, int, int, int]]:
+        """Meilleures paires (i, j) avec start <= i < start + block_size et i < j."""
+        stop = min(start + block_size, n)
+        wrong_rows, chosen_rows = _unpack(wrong[start:stop]), _unpack(chosen[start:stop])
+        shared_wrong = np.empty((stop - start, n - start), dtype=np.float32)
+        identical = np.empty_like(shared_wrong)
+        # Seules block_size copies à la fois sont décompressées de l'autre côté du produit
+        for tile in range(start, n, block_size):
+            end = min(tile + block_size, n)
+            columns = slice(tile - start, end - start)
+            wrong_tile = wrong_rows if tile == start else _unpack(wrong[tile:end])
+            chosen_tile = chosen_rows if tile == start else _unpack(chosen[tile:end])
+            np.matmul(wrong_rows, wrong_tile.T, out=shared_wrong[:, columns])
+            np.matmul(chosen_rows, chosen_tile.T, out=identical[:, columns])
+        # Chaque paire une seule fois : j > i
+        shared_wrong[np.tril_indices(stop - start, 0, n - start)] = 0
+        candidates = np.flatnonzero(shared_wrong.ravel() >= max(min_shared_wrong, 1))
+        if len(candidates) > top_k:
+            # Classement exact par (mauvaises réponses communes, réponses identiques) :
+            # le score est calculé en int64, float32 perdant les entiers au-delà de 2**24
+            values = (shared_wrong.ravel()[candidates].astype(np.int64) * (n_questions + 1)
+                      + identical.ravel()[candidates].astype(np.int64))
+            # Ex aequo au seuil : les premières copies d'abord, comme le classement final
+            threshold = np.partition(values, -top_k)[-top_k]
+            above = candidates[values > threshold]
+            tied = candidates[values == threshold][:top_k - len(above)]
+            candidates = np.concatenate((above, tied))
+        rows, cols = np.unravel_index(candidates, shared_wrong.shape)
+        i, j = rows + start, cols + start
+        common = _POPCOUNT[answered[i] & answered[j]].sum(axis=1, dtype=np.int64)
+        return list(zip(shared_wrong[rows, cols].astype(int).tolist(),
+                        identical[rows, cols].astype(int).tolist(),
+                        common.astype(int).tolist(), i.tolist(), j.tolist()))
+
+    starts = range(0, n, block_size)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(block, starts))
+    else:
+        blocks = [block(start) for start in starts]
+
+    best = heapq.nlargest(top_k, (pair for pairs in blocks for pair in pairs),
+                          key=lambda pair: (pair[0], pair[1], -pair[3], -pair[4]))
+    return [
+        SuspiciousPair(_learner_name(matrix, i), _learner_name(matrix, j), shared, identical, common,
+                       int(wrong_counts[i]), int(wrong_counts[j]))
+        for shared, identical, common, i, j in best
+    ]
+
+
+def write_pairs_csv(pairs: List[SuspiciousPair], filename: Union[str, Path]) -> None:
+    """
+    Écrit les paires suspectes au format CSV.
+
+    Args:
+        pairs (List[SuspiciousPair]): Paires retournées par find_similar_pairs
+        filename (Union[str, Path]): Fichier CSV de destination
+    """
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['learner_a', 'learner_b', 'shared_wrong', 'shared_wrong_ratio',
+                         'identical', 'common', 'wrong_a', 'wrong_b'])
+        for pair in pairs:
+            writer.writerow([pair.learner_a, pair.learner_b, pair.shared_wrong,
+                             f'{pair.shared_wrong_ratio:.4f}', pair.identical, pair.common,
+                             pair.wrong_a, pair.wrong_b])
+
+
+def _encode(matrix: ResponseMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encode les réponses à choix en matrices de bits (np.packbits, uint8).
+
+    Seule la dernière réponse de chaque copie à chaque question est gardée ;
+    si elle n'est pas un choix (code < 0), la question est sans réponse.
+
+    Returns:
+        Tuple: (option choisie : copie × (question, option),
+                option fausse choisie : même forme,
+                question répondue : copie × question)
+    """
+    n_learners, n_questions = matrix.shape
+    # Dernière réponse par (copie, question) : première occurrence dans l'ordre inverse
+    cells = matrix.learner_index * n_questions + matrix.question_index
+    _, last = np.unique(cells[::-1], return_index=True)
+    keep = len(cells) - 1 - last
+    keep = keep[matrix.answers[keep] >= 0]
+    rows, cols = matrix.learner_index[keep], matrix.question_index[keep]
+    answers, correct = matrix.answers[keep], matrix.correct[keep]
+
+    # Une colonne par option de chaque question : décalage = options des questions précédentes
+    widths = np.zeros(n_questions, dtype=np.int64)
+    np.maximum.at(widths, cols, answers + 1)
+    offsets = np.concatenate(([0], np.cumsum(widths)[:-1]))
+    columns = offsets[cols] + answers
+    width = int(widths.sum())
+
+    chosen = _pack_bits(n_learners, width, rows, columns)
+    wrong = _pack_bits(n_learners, width, rows[~correct], columns[~correct])
+    answered = _pack_bits(n_learners, n_questions, rows, cols)
+    return chosen, wrong, answered
+
+
+def _pack_bits(n_rows: int, width: int, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """Matrice de bits n_rows × width (ordre de np.packbits) avec des 1 aux cellules données."""
+    bits = np.zeros((n_rows, (width + 7) // 8), dtype=np.uint8)
+    np.bitwise_or.at(bits, (rows, columns >> 3), (0x80 >> (columns & 7)).astype(np.uint8))
+    return bits
+
+
+def _unpack(bits: np.ndarray) -> np.ndarray:
+    """
+    Décompresse des lignes de bits en float32 pour BLAS (8 colonnes par octet).
+
+    Les bits de remplissage du dernier octet valent 0 et ne changent aucun produit.
+    """
+    return _BITS[bits].reshape(len(bits), -1)
+
+
+def _learner_name(matrix: ResponseMatrix, row: int) -> str:
+    """Identifiant d'une copie : learner_id, ou numéro de ligne pour une copie anonyme."""
+    learner_id = matrix.learner_ids[row]
+    return f'#{row}' if learner_id is None else str(learner_id)
@@ -0,0 +1,495 @@
+"""Quiz Site Exporter - Writes a set of quizzes as a static site that also works offline."""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import hashlib
+import html
+import json
+import os
+import re
+import time
+import unicodedata
+
+from .export_manifest import MANIFEST_NAME, ExportManifest
+from .html_exporter import HTMLQuizExporter
+from .html_utils import section_key
+from .models import Question
+
+
+@dataclass
+class SiteBuildReport:
+    """
+    Outcome of a site export.
+
+    Attributes:
+        written: Files written (paths relative to the site root)
+        unchanged: Files left untouched because their content did not change
+        removed: Files of a previous build that are no longer part of the site
+        rendered: Number of quiz pages rendered (the others were up to date)
+        timings: Seconds spent in each build stage, in order
+    """
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    rendered: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_time(self) -> float:
+        """Total build time in seconds."""
+        return sum(self.timings.values())
+
+
+class QuizSiteExporter:
+    """
+    Exports several quizzes to a directory of static files.
+
+    Every quiz page links one shared stylesheet and script, whose file names
+    carry a hash of their content. With ``offline=True`` the site also gets a
+    service worker (``sw.js``) precaching every file under a content
+    revision: repeat visits are served from the cache, and after a re-export
+    only the files whose revision changed are downloaded again.
+
+    Exports are incremental: the site's ExportManifest records every file it
+    owns, so a rebuild only renders quiz pages whose questions or options
+    changed, only writes files whose content changed (unchanged files keep
+    their modification time) and removes the files of quizzes that are gone.
+    """
+
+    ASSETS_DIR = 'assets'
+    SERVICE_WORKER = 'sw.js'
+    WEB_MANIFEST = 'manifest.webmanifest'
+
+    def __init__(self, quizzes: Dict[str, List[Question]], title: str = 'Quiz Site'):
+        """
+        Initialize the site exporter.
+
+        Args:
+            quizzes: Mapping of quiz title to its list of Question objects, in
+                the order the quizzes should appear on the index page
+            title: Title of the site, shown on the index page
+        """
+        self.quizzes = quizzes
+        self.title = title
+
+    def export(self, output_dir: Union[str, Path], questions_per_page: Union[int, str] = 'all',
+               offline: bool = True, workers: Optional[int] = None, **options) -> SiteBuildReport:
+        """
+        Export the site to a directory, reusing what a previous export left there.
+
+        Args:
+            output_dir: Directory receiving the site (created if needed)
+            questions_per_page: Number of questions per page or 'all'
+            offline: Add the service worker and web app manifest
+            workers: Processes rendering quiz pages in parallel (CPU count if
+                None, 1 to render in this process)
+            **options: Extra export options forwarded to HTMLQuizExporter.render
+                (e.g. lazy_pages=True)
+
+        Returns:
+            SiteBuildReport listing written, unchanged and removed files
+        """
+        output_dir = Path(output_dir)
+        report = SiteBuildReport()
+        manifest = ExportManifest.load(output_dir / MANIFEST_NAME)
+        files = self._build(questions_per_page, offline, workers, options, report, output_dir, manifest)
+
+        with _stage(report.timings, 'write'):
+            for relative_path, content in files.items():
+                if content is not None and _write_if_changed(output_dir / relative_path, content):
+                    report.written.append(relative_path)
+                else:
+                    report.unchanged.append(relative_path)
+
+            # Files of the previous build that this one no longer produces
+            for key, entry in list(manifest.files.items()):
+                if entry.get('generator') == 'site' and key not in files:
+                    try:
+                        manifest.resolve(key).unlink()
+                    except FileNotFoundError:
+                        pass
+                    del manifest.files[key]
+                    report.removed.append(key)
+            manifest.save()
+        return report
+
+    def build(self, questions_per_page: Union[int, str] = 'all', offline: bool = True,
+              workers: Optional[int] = 1, **options) -> Dict[str, str]:
+        """
+        Render every file of the site without writing anything.
+
+        Returns:
+            Mapping of path (relative to the site root, '/'-separated) to content
+        """
+        return self._build(questions_per_page, offline, workers, options, SiteBuildReport())
+
+    def _build(self, questions_per_page: Union[int, str], offline: bool, workers: Optional[int],
+               options: dict, report: SiteBuildReport, output_dir: Path = None,
+               manifest: ExportManifest = None) -> Dict[str, Optional[str]]:
+        """
+        Render the site, stage by stage.
+
+        With a manifest, quiz pages it records as up to date are not rendered
+        again: their content is None in the returned mapping, and every file
+        is recorded in the manifest.
+        """
+        files = {}
+        revisions = {}
+
+        with _stage(report.timings, 'assets'):
+            asset_urls = {}
+            for kind, (path, content) in HTMLQuizExporter([]).shared_asset_files(self.ASSETS_DIR).items():
+                files[path] = content
+                asset_urls[kind] = path
+            service_worker = self.SERVICE_WORKER if offline else None
+
+        with _stage(report.timings, 'plan'):
+            pages = []
+            jobs = []
+            for title, questions in self.quizzes.items():
+                path = self._quiz_path(title, files)
+                # Pages in subdirectories reach the shared files through '../'
+                up = '../' * path.count('/')
+                page_options = dict(
+                    options,
+                    questions_per_page=questions_per_page,
+                    asset_urls={kind: up + url for kind, url in asset_urls.items()},
+                    service_worker=up + service_worker if service_worker else None,
+                )
+                signature = [[q.id, q.content_hash()] for q in questions]
+                entry = manifest.files.get(path) if manifest is not None else None
+                if (entry and entry['questions'] == signature and entry['options'] == page_options
+                        and (output_dir / path).exists()):
+                    files[path] = None
+                    revisions[path] = entry['revision']
+                else:
+                    files[path] = ''  # placeholder keeping the index order
+                    jobs.append((path, questions, page_options))
+                pages.append((title, path, len(questions), self._quiz_depth(title)))
+
+        with _stage(report.timings, 'render'):
+            rendered = self._render_pages([(questions, page_options) for _, questions, page_options in jobs],
+                                          workers)
+            for (path, questions, page_options), content in zip(jobs, rendered):
+                files[path] = content
+                revisions[path] = _content_revision(content)
+                if manifest is not None:
+                    manifest.record(output_dir / path, questions, page_options,
+                                    generator='site', revision=revisions[path])
+            report.rendered = len(jobs)
+
+        with _stage(report.timings, 'index'):
+            files['index.html'] = self._render_index(pages, asset_urls['css'], service_worker)
+            if offline:
+                files[self.WEB_MANIFEST] = self._render_web_manifest()
+            for path, content in files.items():
+                if path not in revisions:
+                    revisions[path] = _content_revision(content)
+            if offline:
+                # Last: it lists the revision of every other file
+                files[self.SERVICE_WORKER] = self._render_service_worker(revisions)
+
+            if manifest is not None:
+                # Record the shared files too, so later builds can remove them
+                rendered_paths = {path for path, _, _ in jobs}
+                for path, content in files.items():
+                    if content is not None and path not in rendered_paths:
+                        manifest.record(output_dir / path, [], {}, generator='site',
+                                        revision=revisions.get(path, _content_revision(content)))
+        return files
+
+    @staticmethod
+    def _render_pages(jobs: List[Tuple[List[Question], dict]], workers: Optional[int]) -> List[str]:
+        """Render quiz pages, in worker processes when there is more than one."""
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(jobs) < 2:
+            return [_render_quiz_page(job) for job in jobs]
+        workers = min(workers, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_render_quiz_page, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    def _quiz_path(self, title: str, taken: Dict[str, str]) -> str:
+        """Return a stable file name for a quiz, derived from its title."""
+        slug = unicodedata.normalize('NFKD', title).encode('ascii', 'ignore').decode('ascii')
+        slug = re.sub(r'[^a-z0-9]+', '-', slug.lower()).strip('-') or 'quiz'
+        path = f'{slug}.html'
+        suffix = 2
+        while path in taken or path == 'index.html':
+            path = f'{slug}-{suffix}.html'
+            suffix += 1
+        return path
+
+    def _quiz_depth(self, title: str) -> int:
+        """Return the indentation level of a quiz on the index page."""
+        return 0
+
+    def _render_index(self, pages: List[tuple], css_url: str, service_worker: str = None) -> str:
+        """Return the index page linking every quiz."""
+        esc = html.escape
+        items = []
+        for title, path, count, depth in pages:
+            indent = f' style="margin-left: {depth * 30}px"' if depth else ''
+            items.append(
+                f'<a class="site-item" href="{esc(path)}"{indent}><span class="site-title">{esc(title)}</span>'
+                f'<span class="site-count">{count} questions</span></a>'
+            )
+        items = ''.join(items)
+        registration = ''
+        if service_worker:
+            registration = f"""
+    <link rel="manifest" href="{self.WEB_MANIFEST}">
+    <script>
+        if ('serviceWorker' in navigator && location.protocol !== 'file:') {{
+            navigator.serviceWorker.register({json.dumps(service_worker)});
+        }}
+    </script>"""
+
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{esc(self.title)}</title>
+    <link rel="stylesheet" href="{esc(css_url)}">
+    <style>
+        .site-list {{
+            display: grid;
+            gap: 15px;
+        }}
+
+        .site-item {{
+            display: flex;
+            justify-content: space-between;
+            background: #f8f9fa;
+            border-left: 6px solid #667eea;
+            border-radius: 12px;
+            padding: 20px 25px;
+            color: #333;
+            font-weight: 600;
+            text-decoration: none;
+        }}
+
+        .site-count {{
+            color: #999;
+            font-weight: normal;
+        }}
+    </style>{registration}
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>📚 {esc(self.title)}</h1>
+            <div id="quiz-info">{len(pages)} quizzes</div>
+        </header>
+
+        <nav class="site-list">
+            {items}
+        </nav>
+    </div>
+</body>
+</html>"""
+
+    def _render_web_manifest(self) -> str:
+        """Return the web app manifest, so the site can be installed."""
+        manifest = {
+            'name': self.title,
+            'short_name': self.title[:12],
+            'start_url': 'index.html',
+            'display': 'standalone',
+            'background_color': '#ffffff',
+            'theme_color': '#667eea',
+        }
+        return json.dumps(manifest, ensure_ascii=False, indent=2)
+
+    def _render_service_worker(self, revisions: Dict[str, str]) -> str:
+        """Return the service worker precaching the given files ({ path: revision })."""
+        precache = [{'url': path, 'revision': revision} for path, revision in sorted(revisions.items())]
+        return _SERVICE_WORKER_TEMPLATE.replace('__PRECACHE__', json.dumps(precache, indent=2))
+
+
+class SectionSiteExporter(QuizSiteExporter):
+    """
+    Exports a whole question bank as a practice site, one quiz per section.
+
+    The dotted ``section`` field is a hierarchy: a question of section
+    "2.1.3" appears in the quizzes of "2", "2.1" and "2.1.3". Quiz pages are
+    written to ``sections/<section>.html``, so paths do not depend on titles
+    or on the order of the bank.
+    """
+
+    def __init__(self, bank: List[Question], title: str = 'Quiz Site'):
+        """
+        Initialize the exporter from a question bank.
+
+        Args:
+            bank: Questions to publish (their order is kept within a section)
+            title: Title of the site, shown on the index page
+        """
+        grouped: Dict[str, List[Question]] = {}
+        titles: Dict[str, str] = {}
+        for question in sorted(bank, key=lambda q: section_key(q.section)):
+            titles.setdefault(question.section, question.section_title)
+            parts = question.section.split('.')
+            for depth in range(1, len(parts) + 1):
+                grouped.setdefault('.'.join(parts[:depth]), []).append(question)
+
+        # { quiz title: section }
+        self.sections: Dict[str, str] = {}
+        quizzes = {}
+        for section in sorted(grouped, key=section_key):
+            quiz_title = f'{section} {titles[section]}' if section in titles else f'Section {section}'
+            self.sections[quiz_title] = section
+            quizzes[quiz_title] = grouped[section]
+        super().__init__(quizzes, title)
+
+    def _quiz_path(self, title: str, taken: Dict[str, str]) -> str:
+        """Return the path of a section quiz: sections/<section>.html."""
+        slug = re.sub(r'[^A-Za-z0-9._-]+', '-', self.sections[title]).strip('-.') or 'section'
+        path = f'sections/{slug}.html'
+        suffix = 2
+        while path in taken:
+            path = f'sections/{slug}-{suffix}.html'
+            suffix += 1
+        return path
+
+    def _quiz_depth(self, title: str) -> int:
+        """Return the depth of the section in the hierarchy."""
+        return self.sections[title].count('.')
+
+
+def _render_quiz_page(job: Tuple[List[Question], dict]) -> str:
+    """Render one quiz page (module-level so worker processes can run it)."""
+    questions, page_options = job
+    options = dict(page_options)
+    questions_per_page = options.pop('questions_per_page')
+    return HTMLQuizExporter(questions).render(questions_per_page, **options)
+
+
+@contextmanager
+def _stage(timings: Dict[str, float], name: str):
+    """Add the time spent in the block to timings[name]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write a file unless it already holds this content. Returns True if written."""
+    data = content.encode('utf-8')
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def _content_revision(content: str) -> str:
+    """Return the revision hash of a file's content."""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+# Cache entries are keyed by URL plus revision, so an install only downloads
+# files whose revision is not cached yet, and activate drops the old ones.
+_SERVICE_WORKER_TEMPLATE = """// Generated by quizzmaker: precaches the quiz site for offline use.
+const PRECACHE = __PRECACHE__;
+const CACHE_NAME = 'quizzmaker-precache:' + self.registration.scope;
+
+function cacheKey(entry) {
+    const url = new URL(entry.url, self.location);
+    url.searchParams.set('__rev', entry.revision);
+    return url.href;
+}
+
+// { file URL: cache key } for every precached file
+const cacheKeys = new Map(PRECACHE.map(entry => [new URL(entry.url, self.location).href, cacheKey(entry)]));
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        await Promise.all(PRECACHE.map(async entry => {
+            const key = cacheKey(entry);
+            if (await cache.match(key)) return; // unchanged since the last install
+            const response = await fetch(new URL(entry.url, self.location), { cache: 'reload' });
+            if (!response.ok) {
+                throw new Error(`Precaching ${entry.url} failed: HTTP ${response.status}`);
+            }
+            await cache.put(key, response);
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        // Drop the entries of files that changed or were removed
+        const current = new Set(cacheKeys.values());
+        const cache = await caches.open(CACHE_NAME);
+        for (const request of await cache.keys()) {
+            if (!current.has(request.url)) await cache.delete(request);
+        }
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    if (event.request.method !== 'GET') return;
+    const url = new URL(event.request.url);
+    url.search = '';
+    url.hash = '';
+    if (url.pathname.endsWith('/')) url.pathname += 'index.html';
+
+    const key = cacheKeys.get(url.href);
+    if (!key) return; // not part of the site: let the network handle it
+    event.respondWith((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        return (await cache.match(key)) || fetch(event.request);
+    })());
+});
+"""
+
+
+def export_quiz_site(quizzes: Dict[str, List[Question]], output_dir: Union[str, Path],
+                     questions_per_page: Union[int, str] = 'all', **options) -> SiteBuildReport:
+    """
+    Convenience function to export a set of quizzes as a static site.
+
+    Args:
+        quizzes: Mapping of quiz title to its list of Question objects
+        output_dir: Directory receiving the site
+        questions_per_page: Number of questions per page or 'all'
+        **options: Extra export options forwarded to QuizSiteExporter.export
+            (e.g. offline=False)
+
+    Returns:
+        SiteBuildReport of the export
+    """
+    exporter = QuizSiteExporter(quizzes)
+    return exporter.export(output_dir, questions_per_page, **options)
+
+
+def export_section_site(bank: List[Question], output_dir: Union[str, Path],
+                        questions_per_page: Union[int, str] = 'all', title: str = 'Quiz Site',
+                        **options) -> SiteBuildReport:
+    """
+    Convenience function to export a question bank as a site with one quiz per section.
+
+    Args:
+        bank: Questions to publish
+        output_dir: Directory receiving the site
+        questions_per_page: Number of questions per page or 'all'
+        title: Title of the site
+        **options: Extra export options forwarded to QuizSiteExporter.export
+            (e.g. workers=4, offline=False)
+
+    Returns:
+        SiteBuildReport of the export
+    """
+    exporter = SectionSiteExporter(bank, title)
+    return exporter.export(output_dir, questions_per_page, **options)
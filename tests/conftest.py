@@ -0,0 +1,63 @@
+"""
+Shared helpers for the test suite.
+
+pytest loads this file before the tests; a test file run as a script
+(``python tests/test_x.py``) imports it explicitly, since the tests
+directory is then first on sys.path.
+"""
+
+import inspect
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the package importable from a source checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from quizzmaker import Question
+
+
+def make_question(id, text=None, type="Multiple Choice", **overrides) -> Question:
+    """
+    Build a valid question for tests.
+
+    Multiple choice questions default to options ["A", "B"] with answer "A";
+    other types default to no options (and answer "True").
+
+    Args:
+        id: Question id
+        text: Question text (default: "Question <id>?")
+        type: Question type
+        **overrides: Any other Question field
+    """
+    choice = type == "Multiple Choice"
+    fields = dict(
+        id=id, section="1.1", section_title="Test", difficulty="Easy", type=type,
+        question=f"Question {id}?" if text is None else text,
+        options=["A", "B"] if choice else [], answer="A" if choice else "True",
+        explanation="Because."
+    )
+    fields.update(overrides)
+    return Question(**fields)
+
+
+def run_tests(namespace: dict, label: str) -> None:
+    """
+    Run a test module's test_* functions without pytest.
+
+    Tests that take pytest's ``tmp_path`` argument get a fresh temporary
+    directory, removed afterwards.
+
+    Args:
+        namespace: The test module's globals()
+        label: Name printed in the success message
+    """
+    for name, test in list(namespace.items()):
+        if not (name.startswith('test_') and callable(test)):
+            continue
+        if 'tmp_path' in inspect.signature(test).parameters:
+            with tempfile.TemporaryDirectory() as tmp:
+                test(tmp_path=Path(tmp))
+        else:
+            test()
+    print(f"✅ {label} tests passed")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Tests for the map-reduce results aggregation."""
+
+import json
+
+from conftest import make_question, run_tests
+
+from quizzmaker import CompactQuizSummary, CompactResult
+from quizzmaker.aggregation import aggregate_results, plan_shards
+from quizzmaker.results_log import ResultsLog
+
+
+def test_parallel_aggregation_matches_serial(tmp_path):
+    """Sharded multi-process aggregation gives the serial counts, over JSON files and log segments."""
+    bank = [make_question(i, type="True/False", section=f"{i % 3 + 1}.1",
+                          difficulty=("Easy", "Medium", "Hard")[i % 2 * 2]) for i in range(1, 13)]
+    with ResultsLog(tmp_path / "log" / "results.jsonl", max_bytes=4000) as log:
+        for n in range(300):
+            log.append(CompactQuizSummary(
+                [CompactResult(q, 0, (n + q) % 3 != 0) for q in range(1, 13, 1 + n % 3)]))
+    # One pretty-printed file per quiz, as written by QuizRunner.save_results
+    full = {'score': 1, 'total': 2, 'percentage': 50.0, 'results': [
+        {'question_id': 1, 'question': 'Q?', 'user_answer': 'True', 'correct_answer': 'True',
+         'is_correct': True, 'difficulty': 'Medium'},
+        {'question_id': 99, 'question': 'Q?', 'user_answer': 'True', 'correct_answer': 'False',
+         'is_correct': False, 'difficulty': 'Hard'},
+    ]}
+    (tmp_path / "quiz_results.json").write_text(json.dumps(full, indent=2), encoding='utf-8')
+
+    # Foreign or malformed JSON in the tree is skipped and reported, not fatal
+    foreign = {"manifest.json": '{"files": {}}', "config.json": '[1, 2]', "broken.json": '{"score": ',
+               "notes.jsonl": 'not json\n{"results": "nope"}\n',
+               "inner.json": '{"score": 1, "total": 1, "percentage": 100, "results": [{"is_correct": true}]}',
+               "inner.jsonl": '{"responses": [[1, 0]]}\n'}
+    for name, content in foreign.items():
+        (tmp_path / "log" / name).write_text(content, encoding='utf-8')
+
+    serial = aggregate_results([tmp_path], bank, workers=1)
+    assert sorted(serial.skipped_files) == sorted(str(tmp_path / "log" / name) for name in foreign)
+    assert len(plan_shards([tmp_path / "log" / "results.jsonl"], shard_bytes=500)) > 3
+    parallel = aggregate_results([tmp_path], bank, workers=3, shard_bytes=500)
+    assert parallel.to_dict() == serial.to_dict()
+    assert sorted(parallel.skipped_files) == sorted(serial.skipped_files)
+
+    assert serial.quizzes == 301
+    assert sum(serial.score_histogram) == 301
+    assert serial.by_question[1] == [201, 301] and serial.by_question[99] == [0, 1]
+    assert serial.by_section()[''] == [0, 1]  # question missing from the bank
+    assert serial.by_difficulty()['Medium'][1] == 1
+    report = serial.to_dict()
+    assert report['by_section']['2.1']['total'] == sum(
+        counts['total'] for counts in report['by_section_difficulty']['2.1'].values())
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Aggregation")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for the incremental Rasch difficulty calibration."""
+
+import numpy as np
+
+from conftest import run_tests
+
+from quizzmaker import CompactQuizSummary, CompactResult, Question
+from quizzmaker.calibration import RaschCalibrator
+from quizzmaker.results_log import ResultsLog
+
+
+def _simulated_quizzes(rng, difficulty, learners, per_quiz=20):
+    """Yield one compact quiz per learner, answered according to the Rasch model."""
+    for learner in range(learners):
+        ability = rng.normal()
+        asked = rng.choice(len(difficulty), per_quiz, replace=False)
+        correct = rng.random(per_quiz) < 1 / (1 + np.exp(difficulty[asked] - ability))
+        yield CompactQuizSummary(
+            [CompactResult(int(q) + 1, 0 if c else 1, bool(c)) for q, c in zip(asked, correct)],
+            learner_id=f"learner-{learner}"
+        )
+
+
+def test_incremental_calibration_recovers_difficulties(tmp_path):
+    """Estimates follow the true difficulties, and updates only read new log records."""
+    rng = np.random.default_rng(3)
+    difficulty = np.linspace(-2, 2, 40)
+    quizzes = list(_simulated_quizzes(rng, difficulty, 1200))
+    bank = [Question(id=i + 1, section="1.1", section_title="Test", difficulty="Medium",
+                     type="True/False", question=f"Question {i + 1}?", options=[],
+                     answer="True", explanation="") for i in range(40)]
+
+    log_path, state = tmp_path / "results.jsonl", tmp_path / "calibration.json"
+    with ResultsLog(log_path) as log:
+        for quiz in quizzes[:600]:
+            log.append(quiz)
+
+    first = RaschCalibrator.load(state)
+    assert first.update_from_log(log_path) == 600 * 20
+    first.save()
+
+    # More results arrive, after the active log file was rotated
+    with ResultsLog(log_path, max_bytes=1) as log:
+        for quiz in quizzes[600:]:
+            log.append(quiz)
+    assert len(log.segments()) > 2
+
+    resumed = RaschCalibrator.load(state)
+    assert resumed.update_from_log(log_path) == 600 * 20
+    assert resumed.update_from_log(log_path) == 0
+
+    batch = RaschCalibrator(tmp_path / "batch.json")
+    with ResultsLog(tmp_path / "all.jsonl") as log:
+        for quiz in quizzes:
+            log.append(quiz)
+    batch.update_from_log(tmp_path / "all.jsonl")
+
+    incremental = np.array([resumed.difficulties()[i + 1] for i in range(40)])
+    full = np.array([batch.difficulties()[i + 1] for i in range(40)])
+    assert np.corrcoef(incremental, difficulty)[0, 1] > 0.97
+    assert np.abs(incremental - full).max() < 0.25
+
+    changes = resumed.apply_labels(bank)
+    assert [q.difficulty for q in bank[:3]] == ["Easy"] * 3
+    assert [q.difficulty for q in bank[-3:]] == ["Hard"] * 3
+    assert all(change.current == "Medium" for change in changes)
+    assert len(changes) == sum(q.difficulty != "Medium" for q in bank)
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Calibration")
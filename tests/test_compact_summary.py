@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Tests for the array-backed compact quiz summary."""
+
+
+from conftest import make_question, run_tests
+
+from quizzmaker import CompactQuizSummary, CompactResult, QuizResult, QuizSummary
+
+
+def test_to_dict_is_unchanged_by_the_packed_storage():
+    """Serialized records keep the [id, code, 0/1, timestamp] layout, missing timestamps included."""
+    results = [CompactResult(i, i % 3 - 1, i % 4 == 0, None if i % 5 else 1700000000.5 + i)
+               for i in range(1, 21)]
+    summary = CompactQuizSummary(results, learner_id="ana", cohort="A")
+    expected = {
+        'responses': [[r.question_id, r.answer, int(r.is_correct), r.timestamp] for r in results],
+        'learner_id': "ana",
+        'cohort': "A",
+    }
+    assert summary.to_dict() == expected
+    assert summary.results == results
+    assert (summary.score, summary.total, summary.percentage) == (5, 20, 25.0)
+    assert [summary.is_correct(i) for i in range(20)] == [r.is_correct for r in results]
+
+    restored = CompactQuizSummary.from_dict(expected)
+    assert restored == summary and restored.to_dict() == expected
+    assert CompactQuizSummary([CompactResult(1, 0, True)]).to_dict() == {'responses': [[1, 0, 1, None]]}
+    assert CompactQuizSummary([]).percentage == 0.0
+
+
+def test_breakdowns_match_the_full_summary_and_are_cached():
+    """Per-difficulty stats equal QuizSummary's; per-section stats need a classified summary."""
+    bank = [make_question(i, difficulty=("Easy", "Medium", "Hard")[i % 3], section=f"{i % 2 + 1}.1",
+                          options=["Paris", "Lyon", "Nice"], answer="Paris") for i in range(1, 31)]
+    results = [QuizResult(q.id, q.question, "A) Paris" if q.id % 4 else "B) Lyon", "Paris",
+                          q.id % 4 != 0, q.difficulty) for q in bank]
+    full = QuizSummary(score=23, total=30, percentage=23 / 30 * 100, results=results)
+    compact = CompactQuizSummary.from_summary(full, bank)
+
+    assert compact.get_performance_by_difficulty() == full.get_performance_by_difficulty()
+    assert compact.get_performance_by_section() == {'2.1': {'correct': 15, 'total': 15},
+                                                    '1.1': {'correct': 8, 'total': 15}}
+    compact.get_performance_by_section()['1.1']['correct'] = 0
+    assert compact.get_performance_by_section()['1.1']['correct'] == 8
+
+    unclassified = CompactQuizSummary.from_dict(compact.to_dict())
+    try:
+        unclassified.get_performance_by_difficulty()
+        assert False, "an unclassified summary has no difficulty codes"
+    except ValueError:
+        pass
+    unclassified.classify(bank[:-1])  # question 30 left the bank
+    assert unclassified.get_performance_by_difficulty()[''] == {'correct': 1, 'total': 1}
+    assert unclassified.get_performance_by_section()[''] == {'correct': 1, 'total': 1}
+
+
+def test_question_ids_beyond_32_bits():
+    """Ids that do not fit a 32-bit array are stored in a 64-bit one."""
+    summary = CompactQuizSummary([CompactResult(1, 0, True), CompactResult(2 ** 40, 1, False)])
+    assert summary.question_ids.typecode == 'q'
+    assert [r.question_id for r in summary.results] == [1, 2 ** 40]
+    assert CompactQuizSummary.from_dict(summary.to_dict()) == summary
+    assert CompactQuizSummary([CompactResult(1, 0, True)]).question_ids.typecode == 'i'
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Compact summary")
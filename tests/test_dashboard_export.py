@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Tests for the cohort results dashboard export."""
+
+import json
+import re
+from pathlib import Path
+
+from conftest import make_question, run_tests
+
+from quizzmaker import CompactQuizSummary, CompactResult
+from quizzmaker.dashboard_exporter import export_results_dashboard
+from quizzmaker.results_log import ResultsLog
+from quizzmaker.results_views import ResultsViews
+
+
+def test_dashboard_ships_summary_arrays_only(tmp_path):
+    """The page embeds per-cohort summary arrays built from the views, never raw results."""
+    # Section 1.10 sorts after 1.2
+    bank = [make_question(i, f"Is <b>{i}</b> hard?", "True/False", section=("1.2", "1.10")[i % 2],
+                          difficulty=("Easy", "Medium", "Hard")[i % 3]) for i in range(1, 9)]
+    log_path = tmp_path / "results.jsonl"
+    with ResultsLog(log_path) as log:
+        for n in range(60):
+            # Question q is answered correctly by fewer learners as q grows
+            log.append(CompactQuizSummary([CompactResult(q, 0, n % 8 >= q - 1) for q in range(1, 9)],
+                                          learner_id=f"secret-learner-{n}", cohort=("A", "B")[n % 2]))
+
+    with ResultsViews(":memory:", bank) as views:
+        views.catch_up(log_path)
+        filename = export_results_dashboard(views, bank, str(tmp_path / "dashboard"),
+                                            top_questions=3, min_responses=10)
+    page = Path(filename).read_text(encoding='utf-8')
+
+    assert filename.endswith("dashboard.html")
+    assert "secret-learner" not in page and "<b>" not in page
+    data = json.loads(re.search(r'id="dashboard-data">(.*?)</script>', page, re.S).group(1))
+
+    assert data['cohorts'] == [None, 'A', 'B']
+    assert data['sections'] == ['1.2', '1.10']
+    assert data['difficulties'] == ['Easy', 'Medium', 'Hard']
+    assert [sum(histogram) for histogram in data['histogram']] == [60, 30, 30]
+    assert data['sectionCounts'][0][0][1] == 60 * 4
+    assert [a + b for a, b in zip(data['sectionCounts'][1][1], data['sectionCounts'][2][1])] == \
+        data['sectionCounts'][0][1]
+    assert [qid for qid, _, _ in data['hardest'][0]] == [8, 7, 6]
+    assert data['questions']['8'] == ['1.2', 'Is <b>8</b> hard?']
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Dashboard export")
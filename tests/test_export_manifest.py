@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Tests for the export manifest and incremental re-export."""
+
+
+from conftest import make_question, run_tests
+
+from quizzmaker import QuestionGenerator
+from quizzmaker.cli import main
+from quizzmaker.export_manifest import ExportManifest
+from quizzmaker.html_exporter import export_quiz_to_html
+
+
+def test_reexport_rewrites_only_stale_files(tmp_path):
+    """Only files holding an edited or deleted question are rewritten."""
+    bank = [make_question(i) for i in range(1, 7)]
+
+    tmp_path = tmp_path
+    with ExportManifest.load(tmp_path / 'quizzmaker-manifest.json') as manifest:
+        export_quiz_to_html(bank[0:2], str(tmp_path / 'a.html'), manifest=manifest)
+        export_quiz_to_html(bank[2:4], str(tmp_path / 'b.html'), 1, lazy_pages=True, manifest=manifest)
+        export_quiz_to_html(bank[4:6], str(tmp_path / 'c.html'), manifest=manifest)
+
+    manifest = ExportManifest.load(tmp_path / 'quizzmaker-manifest.json')
+    assert sorted(manifest.files) == ['a.html', 'b.html', 'c.html']
+    assert manifest.stale_files(bank) == []
+
+    before = {name: (tmp_path / name).read_text(encoding='utf-8') for name in manifest.files}
+    (tmp_path / 'a.html').write_text('untouched', encoding='utf-8')
+
+    edited = bank[:2] + [make_question(3, explanation="Fixed.")] + bank[3:5]  # 6 deleted
+    assert manifest.reexport(edited) == ['b.html', 'c.html']
+
+    assert (tmp_path / 'a.html').read_text(encoding='utf-8') == 'untouched'
+    b_html = (tmp_path / 'b.html').read_text(encoding='utf-8')
+    assert 'Fixed.' in b_html and 'const lazyPages = true;' in b_html
+    assert (tmp_path / 'c.html').read_text(encoding='utf-8') != before['c.html']
+    assert ExportManifest.load(tmp_path / 'quizzmaker-manifest.json').stale_files(edited) == []
+
+
+def test_reexport_command(tmp_path):
+    """The reexport command reads the bank from CSV and honours --dry-run."""
+    tmp_path = tmp_path
+    manifest_path = tmp_path / 'quizzmaker-manifest.json'
+    with ExportManifest.load(manifest_path) as manifest:
+        export_quiz_to_html([make_question(1)], str(tmp_path / 'quiz.html'), manifest=manifest)
+
+    gen = QuestionGenerator()
+    gen.add_multiple_choice_question(1, "1.1", "Test", "Easy", "Question?", ["A", "B"], "A", "Edited.")
+    gen.save_to_csv(str(tmp_path / 'bank.csv'))
+
+    assert main(['reexport', str(tmp_path / 'bank.csv'), '--manifest', str(manifest_path), '--dry-run']) == 0
+    assert 'Edited.' not in (tmp_path / 'quiz.html').read_text(encoding='utf-8')
+    assert main(['reexport', str(tmp_path / 'bank.csv'), '--manifest', str(manifest_path)]) == 0
+    assert 'Edited.' in (tmp_path / 'quiz.html').read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Export manifest")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Tests for the batch grading of answer sheets."""
+
+
+from conftest import make_question, run_tests
+
+from quizzmaker import CompactQuizSummary
+from quizzmaker.grading import BatchGrader
+
+
+def test_grading_accepts_every_answer_form():
+    """Option text, bank-order letter, QuizRunner format, index and True/False variants all grade."""
+    bank = [
+        make_question(1, options=["Lyon", "Paris", "Nice"], answer="Paris"),
+        make_question(2, type="True/False", answer="False", difficulty="Medium", section="1.2"),
+        make_question(3, type="Short Answer", answer="Photosynthesis", difficulty="Hard", section="2.1"),
+    ]
+    sheets = [
+        {1: " paris ", 2: "F", 3: "photosynthesis"},   # all correct
+        {1: "B", 2: False, 3: "Respiration"},          # letter B is Paris in bank order
+        {1: "A) Paris", 2: "a", 3: ""},                # displayed letter ignored; A is True
+        {1: 1, 2: 1, 99: "Paris"},                     # option indexes; question 99 is not in the exam
+        {1: "Marseille", 2: None},
+        {},
+        {1: 1.0, 2: 1.9, 3: "photosynthesis"},         # only int indexes are options
+    ]
+    summaries = BatchGrader(bank).grade(sheets, learner_ids=[f"l{i}" for i in range(7)], cohort="A")
+
+    assert [s.score for s in summaries] == [3, 2, 1, 2, 0, 0, 1]
+    assert [s.total for s in summaries] == [3] * 7   # unanswered exam questions are wrong
+    assert [r.answer for r in summaries[1].results] == [1, 1, -1]   # short answers are not coded
+    assert [r.answer for r in summaries[3].results] == [1, 1, -1]
+    assert [r.answer for r in summaries[6].results] == [-1, -1, -1]
+    assert summaries[4].to_dict() == {'responses': [[1, -1, 0, None], [2, -1, 0, None], [3, -1, 0, None]],
+                                      'learner_id': "l4", 'cohort': "A"}
+
+    assert summaries[0].get_performance_by_difficulty() == {
+        'Easy': {'correct': 1, 'total': 1}, 'Medium': {'correct': 1, 'total': 1},
+        'Hard': {'correct': 1, 'total': 1}}
+    assert summaries[3].get_performance_by_section() == {
+        '1.1': {'correct': 1, 'total': 1}, '1.2': {'correct': 1, 'total': 1}, '2.1': {'correct': 0, 'total': 1}}
+
+    # QuizSummary-compatible: resolves through the bank like a logged compact summary
+    full = summaries[1].resolve(bank)
+    assert (full.score, full.total) == (2, 3)
+    assert [r.user_answer for r in full.results] == ["Paris", "False", "Auto-évalué: Incorrect"]
+    assert CompactQuizSummary.from_dict(summaries[1].to_dict()).classify(bank) == summaries[1]
+
+
+def test_sheets_are_graded_on_their_exam():
+    """The exam, not the sheet, fixes the questions; invalid exams, ids and records are rejected."""
+    bank = [make_question(1), make_question(2), make_question(3, type="True/False")]
+    grader = BatchGrader(bank, question_ids=[2, 1])
+    summaries = grader.grade([{1: "B"}, {}, {1: "A", 2: "A", 3: "True"}])
+    assert [(s.score, s.total) for s in summaries] == [(0, 2), (0, 2), (2, 2)]
+    assert [r.question_id for r in summaries[2].results] == [2, 1]
+    assert grader.grade([{3: "T"}], question_ids=[3])[0].percentage == 100.0
+
+    for exam in ([], [1, 99], [1, 1], ["1"]):
+        try:
+            BatchGrader(bank, question_ids=exam)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"exam {exam} accepted")
+    try:
+        BatchGrader([make_question(2 ** 31)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("question id beyond 32 bits accepted")
+    try:
+        BatchGrader([make_question(i, section=str(i)) for i in range(2 ** 16 + 1)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("more sections than 16-bit codes accepted")
+
+    records = [
+        {"answers": {"1": "A", "2": "A"}, "learner_id": "ana"},
+        {"answers": {"x": "A"}},                                # not a question id
+        {"answers": {"3": "T"}, "question_ids": [3]},           # the sheet's own exam
+        {"answers": {"1": "A"}, "question_ids": [4]},           # exam outside the bank
+        "not a sheet",
+        {"answers": {"1": "A", "4": "A"}, "cohort": "B"},
+    ]
+    graded = grader.grade_records(records)
+    assert [s and (s.score, s.total) for s in graded] == [(2, 2), None, (1, 1), None, None, (1, 2)]
+    assert (graded[0].learner_id, graded[5].cohort) == ("ana", "B")
+
+
+def test_bitsets_stay_aligned_across_long_sheets():
+    """Sheets of exams of every length get their own byte-aligned bitset."""
+    bank = [make_question(i, options=["Lyon", "Paris", "Nice"], answer="Paris") for i in range(1, 41)]
+    records = [{"answers": {q: ("Paris" if (q * n) % 3 else "Nice") for q in range(1, n + 1) if q % 7},
+                "question_ids": list(range(1, n + 1))} for n in range(1, 41)]
+    summaries = BatchGrader(bank).grade_records(records)
+    for n, summary in enumerate(summaries, 1):
+        expected = [(q * n) % 3 != 0 and q % 7 != 0 for q in range(1, n + 1)]
+        assert [r.is_correct for r in summary.results] == expected
+        assert (summary.score, summary.total) == (sum(expected), n)
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Grading")
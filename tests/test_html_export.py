@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 """Quick test script for HTML export functionality."""
 
-import sys
+import json
+import os
+import re
+import shutil
+import subprocess
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from conftest import make_question, run_tests
 
 from quizzmaker import QuizRunner
+from quizzmaker.html_exporter import HTMLQuizBundleExporter, HTMLQuizExporter, export_quiz_bundle_to_html
 
 
-def test_html_export():
+def test_html_export(tmp_path):
     """Test HTML export with different configurations."""
     print("="*60)
     print("Testing HTML Export Functionality")
@@ -19,7 +23,7 @@ def test_html_export():
     runner = QuizRunner()
 
     # Load questions
-    csv_file = "examples/example_python_questions.csv"
+    csv_file = str(Path(__file__).resolve().parent.parent / "examples" / "example_python_questions.csv")
     print(f"\n1. Loading questions from {csv_file}...")
     if not runner.load_questions(csv_file):
         print("❌ Failed to load questions")
@@ -30,7 +34,7 @@ def test_html_export():
     # Test 1: Export all questions on one page
     print("\n2. Test 1: Export all questions on one page...")
     runner.create_quiz(num_questions=5)
-    html_path = runner.export_html_quiz("test_all_in_one.html")
+    html_path = runner.export_html_quiz(str(tmp_path / "test_all_in_one.html"))
     if html_path:
         print(f"✅ Test 1 passed: {html_path}")
     else:
@@ -40,7 +44,7 @@ def test_html_export():
     # Test 2: Export with pagination (2 questions per page)
     print("\n3. Test 2: Export with 2 questions per page...")
     runner.create_quiz(num_questions=5)
-    html_path = runner.export_html_quiz("test_paginated.html", questions_per_page=2)
+    html_path = runner.export_html_quiz(str(tmp_path / "test_paginated.html"), questions_per_page=2)
     if html_path:
         print(f"✅ Test 2 passed: {html_path}")
     else:
@@ -50,7 +54,13 @@ def test_html_export():
     # Test 3: Auto-generated filename
     print("\n4. Test 3: Auto-generated filename...")
     runner.create_quiz(num_questions=3)
-    html_path = runner.export_html_quiz()
+    # The generated name is relative to the working directory
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        html_path = runner.export_html_quiz()
+    finally:
+        os.chdir(cwd)
     if html_path:
         print(f"✅ Test 3 passed: {html_path}")
     else:
@@ -60,7 +70,7 @@ def test_html_export():
     # Test 4: Export with filters (difficulty)
     print("\n5. Test 4: Export filtered quiz (Hard questions)...")
     if runner.create_quiz(num_questions=5, difficulty_filter="Hard"):
-        html_path = runner.export_html_quiz("test_hard_questions.html")
+        html_path = runner.export_html_quiz(str(tmp_path / "test_hard_questions.html"))
         if html_path:
             print(f"✅ Test 4 passed: {html_path}")
         else:
@@ -72,16 +82,261 @@ def test_html_export():
     print("\n" + "="*60)
     print("✅ All tests passed!")
     print("="*60)
-    print("\nGenerated HTML files:")
+    print(f"\nGenerated HTML files in {tmp_path}:")
     print("  - test_all_in_one.html (all questions on one page)")
     print("  - test_paginated.html (2 questions per page)")
     print("  - quiz_*.html (auto-generated filename)")
     print("  - test_hard_questions.html (filtered by difficulty)")
-    print("\n💡 Open any of these files in your web browser to test the interactive quiz!")
 
     return True
 
 
+def test_json_payload_is_escaped(tmp_path):
+    """The question payload is an inert JSON block that survives </script>."""
+    tricky = 'What does </script><script>alert(1)</script> <!-- do?'
+    exporter = HTMLQuizExporter([make_question(1, tricky)])
+
+    html = Path(exporter.export(str(tmp_path / "payload.html"))).read_text(encoding='utf-8')
+
+    match = re.search(r'<script type="application/json" id="quiz-data">(.*?)</script>', html, re.S)
+    assert match, "Erreur: bloc JSON absent"
+    assert json.loads(match.group(1))[0]['question'] == tricky
+    assert "JSON.parse(document.getElementById('quiz-data').textContent)" in html
+
+
+def test_lazy_pages_payload(tmp_path):
+    """Lazy export stores one inert JSON block per page and no global payload."""
+    questions = [make_question(i, f"Question {i}?") for i in range(1, 8)]
+    exporter = HTMLQuizExporter(questions)
+
+    path = exporter.export(str(tmp_path / "lazy.html"), questions_per_page=3, lazy_pages=True)
+    html = Path(path).read_text(encoding='utf-8')
+
+    pages = re.findall(r'<script type="application/json" id="quiz-page-(\d+)">(.*?)</script>', html, re.S)
+    assert [int(page) for page, _ in pages] == [1, 2, 3], "Erreur: découpage en pages incorrect"
+    assert [len(json.loads(payload)) for _, payload in pages] == [3, 3, 1]
+    assert 'id="quiz-data"' not in html
+    assert "const lazyPages = true;" in html
+
+
+def test_virtual_scroll_threshold(tmp_path):
+    """Single-page exports switch to virtual scrolling above the threshold."""
+    questions = [make_question(i) for i in range(1, 11)]
+    exporter = HTMLQuizExporter(questions)
+
+    small = Path(exporter.export(str(tmp_path / "small.html"))).read_text(encoding='utf-8')
+    large = Path(exporter.export(str(tmp_path / "large.html"), virtualize_threshold=5)).read_text(encoding='utf-8')
+    paged = Path(exporter.export(str(tmp_path / "paged.html"), questions_per_page=5,
+                                 virtualize_threshold=5)).read_text(encoding='utf-8')
+
+    assert "const virtualScroll = false;" in small
+    assert "const virtualScroll = true;" in large
+    assert "const virtualScroll = false;" in paged
+
+
+def test_prerendered_cards(tmp_path):
+    """Pre-rendered exports contain escaped static cards, cached per question."""
+    questions = [make_question(1, 'Is <b>bold</b> & "quoted"?'), make_question(2), make_question(3)]
+    exporter = HTMLQuizExporter(questions)
+
+    html = Path(exporter.export(str(tmp_path / "static.html"), questions_per_page=2,
+                                prerender=True)).read_text(encoding='utf-8')
+
+    assert 'Is &lt;b&gt;bold&lt;/b&gt; &amp; &quot;quoted&quot;?' in html
+    assert '<div class="question-card" id="question-1" data-question-id="1">' in html
+    assert '<div class="question-card hidden" id="question-3" data-question-id="3">' in html
+    assert 'Question 3/3' in html
+
+    # A second exporter reuses the cached fragments of identical questions
+    cached = HTMLQuizExporter._card_fragment(questions[0])
+    assert HTMLQuizExporter([questions[0]])._card_fragment(questions[0]) is cached
+    # ...and an edited question is rendered afresh
+    questions[0].question = "Edited?"
+    assert 'Edited?' in HTMLQuizExporter([questions[0]])._card_fragment(questions[0])[1]
+
+
+def test_storage_key_follows_content(tmp_path):
+    """The localStorage key changes whenever the quiz content changes."""
+    original = HTMLQuizExporter([make_question(1), make_question(2)])
+    edited = HTMLQuizExporter([make_question(1), make_question(2, explanation="Fixed.")])
+
+    assert original.content_hash() == HTMLQuizExporter([make_question(1), make_question(2)]).content_hash()
+    assert original.content_hash() != edited.content_hash()
+
+    html = Path(original.export(str(tmp_path / "persist.html"))).read_text(encoding='utf-8')
+    no_persist = Path(original.export(str(tmp_path / "plain.html"),
+                                      persist_answers=False)).read_text(encoding='utf-8')
+
+    assert f'const storageKey = "quizzmaker:{original.content_hash()}";' in html
+    assert "const persistAnswers = true;" in html
+    assert "const persistAnswers = false;" in no_persist
+
+
+def test_bundle_deduplicates_questions(tmp_path):
+    """Questions shared between bundled quizzes are stored once in the pool."""
+    shared = make_question(2, "Shared?")
+    quizzes = {
+        "Chapter <1>": [make_question(1), shared],
+        "Chapter 2": [shared, make_question(3)],
+    }
+
+    html = Path(export_quiz_bundle_to_html(quizzes, str(tmp_path / "bundle"))).read_text(encoding='utf-8')
+
+    pool = json.loads(re.search(r'id="quiz-pool-0">(.*?)</script>', html).group(1))
+    assert [q["id"] for q in pool] == [1, 2, 3]
+    metas = [json.loads(m) for m in re.findall(r'id="quiz-bundle-\d+">(.*?)</script>', html)]
+    assert [m["items"] for m in metas] == [[0, 1], [1, 2]]
+    assert metas[0]["title"] == "Chapter <1>"
+    assert "Chapter &lt;1&gt;" in html
+    assert html.count("function renderCurrentPage") == 1
+
+    # A bundle is not a quiz: no single-quiz render or multi-file export to inherit
+    bundle = HTMLQuizBundleExporter(quizzes)
+    assert not isinstance(bundle, HTMLQuizExporter)
+    assert not hasattr(bundle, "render") and not hasattr(bundle, "export_pages")
+
+
+def test_export_pages_writes_one_file_per_page(tmp_path):
+    """Multi-file export: each page file embeds only its own questions."""
+    exporter = HTMLQuizExporter([make_question(i, f"Question {i}?") for i in range(1, 6)])
+
+    paths = exporter.export_pages(tmp_path, questions_per_page=2)
+    names = [Path(path).name for path in paths]
+    pages = {name: Path(path).read_text(encoding='utf-8') for name, path in zip(names, paths)}
+
+    assert names[:4] == ["page-1.html", "page-2.html", "page-3.html", "results.html"]
+    assert [Path(path).suffix for path in paths[4:]] == [".css", ".js"]
+    assert "Question 3?" in pages["page-2.html"] and "Question 1?" not in pages["page-2.html"]
+    assert re.findall(r'id="quiz-page-(\d+)"', pages["page-2.html"]) == ["2"]
+    assert re.findall(r'id="quiz-page-(\d+)"', pages["results.html"]) == ["1", "2", "3"]
+    assert '<link rel="prefetch" href="page-3.html">' in pages["page-2.html"]
+    assert '<link rel="prefetch" href="results.html">' in pages["page-3.html"]
+    assert "function renderCurrentPage" not in pages["page-1.html"]
+    assert len({re.search(r'const storageKey = (.*);', page).group(1)
+                for name, page in pages.items() if name.endswith(".html")}) == 1
+
+
+def test_export_pages_rejects_an_empty_quiz(tmp_path):
+    """An empty quiz has no page file to write: nothing is exported."""
+    try:
+        HTMLQuizExporter([]).export_pages(tmp_path)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Erreur: quiz vide exporté")
+    assert list(tmp_path.iterdir()) == []
+
+
+def _js_function(html, name):
+    """Return the source of a named function of the exported quiz script."""
+    start = html.index(f"function {name}(")
+    depth, end = 0, html.index("{", start)
+    for end in range(end, len(html)):
+        depth += {"{": 1, "}": -1}.get(html[end], 0)
+        if depth == 0:
+            return html[start:end + 1]
+
+
+def _run_node(script):
+    """Run a script with Node.js and return its JSON output (None without Node.js)."""
+    if shutil.which("node") is None:
+        return None
+    out = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def test_question_index_and_running_score(tmp_path):
+    """Questions are looked up in an id index and the score is kept by running counters."""
+    exporter = HTMLQuizExporter([make_question(1), make_question(2, answer="B")])
+    html = Path(exporter.export(str(tmp_path / "quiz.html"))).read_text(encoding='utf-8')
+
+    assert "questions.find(" not in html
+    assert "const questionIndex = new Map();" in html
+    assert "questionIndex.get(questionId)" in _js_function(html, "findQuestion")
+    assert "answeredCount++;" in _js_function(html, "submitAnswer")
+    assert "const correctAnswers = correctCount;" in _js_function(html, "showResults")
+
+    # Changing a draft answer or submitting twice leaves the counters alone
+    script = "\n".join([
+        "let userAnswers = {}, answeredCount = 0, correctCount = 0, checked = null;",
+        "const questionIndex = new Map(); const counts = [];",
+        "const card = { dataset: {}, querySelector: () => checked && { value: checked } };",
+        "const document = { getElementById: () => card };",
+        "function applyCardState() {} function updateQuizInfo() {} function scheduleSave() {}",
+        "function scheduleVirtualUpdate() {} function checkQuizCompletion() {}",
+        "function alert() {}",
+        *(_js_function(html, name) for name in
+          ("indexQuestions", "getAnswerState", "findQuestion", "rememberDraftAnswer", "submitAnswer")),
+        f"indexQuestions({json.dumps([q.to_dict() for q in exporter.questions])});",
+        "const draft = (id, value) => { card.dataset.questionId = String(id); checked = value;",
+        "    rememberDraftAnswer({ target: { value, closest: () => card } }); };",
+        "const submit = id => { submitAnswer(id); counts.push([answeredCount, correctCount]); };",
+        "draft(1, 'B'); draft(1, 'A'); counts.push([answeredCount, correctCount]);",
+        "submit(1); draft(1, 'B'); submit(1); draft(2, 'A'); submit(2);",
+        "console.log(JSON.stringify({ counts, first: userAnswers[1].answer }));",
+    ])
+    result = _run_node(script)
+    if result is not None:
+        assert result == {"counts": [[0, 0], [1, 1], [1, 1], [2, 1]], "first": "A"}
+
+
+def test_review_renders_in_observed_batches(tmp_path):
+    """The results review is appended in fragments of 100 items as its end comes into view."""
+    exporter = HTMLQuizExporter([make_question(i) for i in range(1, 4)])
+    html = Path(exporter.export(str(tmp_path / "quiz.html"))).read_text(encoding='utf-8')
+    show_results = _js_function(html, "showResults")
+    render_batch = _js_function(html, "renderReviewBatch")
+
+    assert "const REVIEW_BATCH_SIZE = 100;" in html
+    assert '<button id="review-more-btn"' in show_results
+    assert "resultsHTML" not in html and "innerHTML +=" not in html
+    assert "innerHTML" not in _js_function(html, "createReviewItem")
+    assert "document.createDocumentFragment()" in render_batch
+    assert "new IntersectionObserver(" in _js_function(html, "observeReviewEnd")
+    assert "reviewObserver.observe(document.getElementById('review-more-btn'))" in html
+
+    # 250 questions: three batches, then the "Show more" sentinel is hidden
+    script = "\n".join([
+        "const REVIEW_BATCH_SIZE = 100, totalQuestions = 250; let reviewRendered = 0;",
+        "const appended = [], hidden = [];",
+        "const list = { appendChild: fragment => appended.push(fragment.children.length) };",
+        "const moreBtn = { classList: { toggle: (name, on) => hidden.push(on) } };",
+        "const document = { getElementById: id => id === 'review-list' ? list : moreBtn,",
+        "    createDocumentFragment: () => ({ children: [], appendChild(c) { this.children.push(c); } }) };",
+        "function forEachQuestion(callback, start, end) { for (let i = start; i < end; i++) callback({}, i); }",
+        "function createReviewItem(q, idx) { return idx; }",
+        render_batch,
+        "renderReviewBatch(); renderReviewBatch(); renderReviewBatch();",
+        "console.log(JSON.stringify({ appended, hidden, text: moreBtn.textContent }));",
+    ])
+    result = _run_node(script)
+    if result is not None:
+        assert result == {"appended": [100, 100, 50], "hidden": [False, False, True],
+                          "text": "Show more (0 remaining)"}
+
+
+def test_cards_use_delegated_events_and_escaped_titles(tmp_path):
+    """Cards carry no inline handlers and result titles from the bank are escaped."""
+    exporter = HTMLQuizExporter([make_question(1, section="<img src=x onerror=alert(1)>")])
+    html = Path(exporter.export(str(tmp_path / "quiz.html"), prerender=True)).read_text(encoding='utf-8')
+
+    assert 'onclick="submitAnswer' not in html and "submitAnswer(${" not in html
+    assert '<button class="submit-btn" data-action="submit">' in html
+    assert "event.target.closest('[data-action=\"submit\"]')" in _js_function(html, "handleQuizClick")
+    assert "container.addEventListener('click', handleQuizClick);" in html
+    assert "<h4>${escapeHtml(title)}</h4>" in _js_function(html, "renderStatCard")
+
+    script = "\n".join([
+        _js_function(html, "escapeHtml"),
+        _js_function(html, "renderStatCard"),
+        "const stats = { correct: 1, incorrect: 0, unanswered: 0 };",
+        "console.log(JSON.stringify(renderStatCard('1.1: <img src=x onerror=alert(1)> & \"more\"', stats)));",
+    ])
+    card = _run_node(script)
+    if card is not None:
+        assert "<img" not in card
+        assert "<h4>1.1: &lt;img src=x onerror=alert(1)&gt; &amp; &quot;more&quot;</h4>" in card
+
+
 if __name__ == "__main__":
-    success = test_html_export()
-    sys.exit(0 if success else 1)
+    run_tests(globals(), "HTML export")
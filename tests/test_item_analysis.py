@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized item analysis over a results log."""
+
+import csv
+
+import numpy as np
+
+from conftest import make_question, run_tests
+
+from quizzmaker import CompactQuizSummary, CompactResult
+from quizzmaker.item_analysis import ResponseMatrix, analyze_log
+from quizzmaker.results_log import ResultsLog
+
+
+def test_statistics_match_naive_computation():
+    """p-values, rest-score point-biserial and option counts agree with a per-question loop."""
+    rng = np.random.default_rng(7)
+    learners = rng.integers(0, 40, 2000)
+    questions = rng.integers(100, 110, 2000)
+    answers = rng.integers(-1, 3, 2000)
+    correct = rng.random(2000) < 0.3 + 0.01 * learners
+    stats = ResponseMatrix.from_arrays(learners, questions, answers, correct).item_statistics()
+
+    assert stats.question_ids.tolist() == list(range(100, 110))
+    for i, qid in enumerate(stats.question_ids):
+        on_item = questions == qid
+        assert stats.responses[i] == on_item.sum()
+        assert np.isclose(stats.p_values[i], correct[on_item].mean())
+        assert stats.option_counts[i].tolist() == [np.sum(answers[on_item] == k) for k in (-1, 0, 1, 2)]
+
+        rest = []
+        for learner, is_correct in zip(learners[on_item], correct[on_item]):
+            others = correct[learners == learner]
+            rest.append((others.sum() - is_correct) / (len(others) - 1))
+        assert np.isclose(stats.point_biserial[i], np.corrcoef(correct[on_item], rest)[0, 1])
+    assert np.all(stats.point_biserial > 0)  # stronger learners succeed more often
+
+
+def test_report_from_log(tmp_path):
+    """A compact log is analysed per learner and written as a CSV report."""
+    bank = [make_question(1, options=["A", "B", "C"]), make_question(2, options=["A", "B", "C"], answer="C"),
+            make_question(3, type="True/False")]
+    log_path, report = tmp_path / "results.jsonl", tmp_path / "items.csv"
+    with ResultsLog(log_path) as log:
+        for learner, answers in (("ana", [0, 2, 0]), ("bob", [1, 2, 1]), ("cyd", [1, 0, 1])):
+            results = [CompactResult(q.id, code, code == q.answer_code(q.answer))
+                       for q, code in zip(bank, answers)]
+            log.append(CompactQuizSummary(results, learner_id=learner))
+    stats = analyze_log(log_path, bank, report)
+
+    assert stats.option_counts.tolist() == [[0, 1, 2, 0], [0, 1, 0, 2], [0, 1, 2, 0]]
+    with open(report, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [(r['question_id'], r['key'], r['option_B'], r['p_value']) for r in rows] == [
+        ('1', 'A', '0.6667', '0.3333'), ('2', 'C', '0.0000', '0.6667'), ('3', 'A', '0.6667', '0.3333'),
+    ]
+    assert rows[0]['point_biserial'] == '0.8660' and rows[0]['flags'] == ''
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Item analysis")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the streaming GIFT / QTI exporters."""
+
+import io
+import xml.etree.ElementTree as ET
+
+from conftest import run_tests
+
+from quizzmaker import Question, QuestionGenerator
+from quizzmaker.lms_export import iter_questions_from_csv, write_gift, write_qti
+
+QTI = '{http://www.imsglobal.org/xsd/ims_qtiasiv1p2}'
+
+
+def _bank():
+    """Questions of every type, with characters special to GIFT and XML."""
+    return [
+        Question(1, "1.1", "Intro", "Easy", "Multiple Choice", "2+2 = {x}: #1 ~ <b>?\nSecond line",
+                 ["3", "4 & <4>", "5"], "4 & <4>", "Because 2+2=4\x01."),
+        Question(2, "1.1", "Intro", "Medium", "True/False", "Sky is blue?", [], "False", ""),
+        Question(3, "1.2", "Next", "Hard", "Short Answer", "Capital of France?", [], "Paris", "Paris: capital"),
+    ]
+
+
+def test_gift_escaping_and_structure():
+    """GIFT output escapes special characters and marks the right answers."""
+    out = io.StringIO()
+    assert write_gift(iter(_bank()), out) == 3
+    gift = out.getvalue()
+
+    assert "::Q1::[plain]2+2 \\= \\{x\\}\\: \\#1 \\~ <b>?\\nSecond line{" in gift
+    assert "\t=4 & <4>\n" in gift and "\t~3\n" in gift
+    assert "####Because 2+2\\=4" in gift
+    assert "{FALSE}" in gift
+    assert "{=Paris####Paris\\: capital}" in gift
+    assert gift.count("$CATEGORY: quizzmaker/") == 2
+
+
+def test_qti_is_well_formed():
+    """QTI output parses as XML and points each item at its correct answer."""
+    out = io.StringIO()
+    assert write_qti(_bank(), out, title="Exam <1>") == 3
+    root = ET.fromstring(out.getvalue().encode('utf-8'))
+
+    assert root.find(f'{QTI}assessment').get('title') == "Exam <1>"
+    items = root.findall(f'.//{QTI}item')
+    assert [item.get('ident') for item in items] == ['q1', 'q2', 'q3']
+    labels = {label.get('ident'): label.find(f'.//{QTI}mattext').text
+              for label in items[0].findall(f'.//{QTI}response_label')}
+    correct = items[0].find(f'.//{QTI}varequal').text
+    assert labels[correct] == "4 & <4>"
+    assert items[1].find(f'.//{QTI}varequal').text == 'q2_1'
+    assert items[2].find(f'.//{QTI}varequal').text == 'Paris'
+    assert items[0].find(f'.//{QTI}itemfeedback//{QTI}mattext').text == "Because 2+2=4."
+
+
+def test_iter_questions_from_csv_round_trip(tmp_path):
+    """Questions streamed back from a saved bank equal the originals."""
+    gen = QuestionGenerator()
+    gen.questions = _bank()
+    path = tmp_path / "bank.csv"
+    gen.save_to_csv(str(path))
+    streamed = iter_questions_from_csv(path)
+    assert not isinstance(streamed, list)
+    assert list(streamed) == _bank()
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "LMS export")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the streaming CSV save of QuestionGenerator."""
+
+from conftest import make_question, run_tests
+
+from quizzmaker import QuestionGenerator
+from quizzmaker.question_generator import CSV_COLUMNS
+
+# Fields that need CSV quoting
+_TRICKY = dict(options=["A, really", 'B "quoted"'], answer="A, really", explanation="Because,\nsee above.")
+
+
+def test_save_to_csv_round_trip_and_append(tmp_path):
+    """Saved banks load back unchanged; append only adds new ids."""
+    path = tmp_path / "bank.csv"
+    gen = QuestionGenerator()
+    gen.questions = [make_question(i, **_TRICKY) for i in range(1, 4)]
+    assert gen.save_to_csv(str(path))
+    assert [p.name for p in tmp_path.iterdir()] == ["bank.csv"]  # temp file renamed
+
+    gen.questions.append(make_question(4, "New?", **_TRICKY))
+    gen.questions[0] = make_question(1, "Edited, but not rewritten by append", **_TRICKY)
+    inode = path.stat().st_ino
+    assert gen.save_to_csv(str(path), append=True)
+    assert path.stat().st_ino == inode  # appended in place, not rewritten
+    assert path.read_text(encoding='utf-8').count("New?") == 1
+
+    loaded = QuestionGenerator()
+    assert loaded.load_from_csv(str(path))
+    assert [q.id for q in loaded.questions] == [1, 2, 3, 4]
+    assert loaded.questions[0] == make_question(1, **_TRICKY)
+    assert loaded.questions[3] == make_question(4, "New?", **_TRICKY)
+
+    # Appending again writes nothing
+    size = path.stat().st_size
+    assert gen.save_to_csv(str(path), append=True)
+    assert path.stat().st_size == size
+
+
+class _BrokenQuestion:
+    """A question whose serialisation fails halfway through a save."""
+    id = 99
+
+    def to_dict(self):
+        raise RuntimeError("disk full")
+
+
+def test_failed_append_leaves_the_file_untouched(tmp_path):
+    """An append that fails while writing truncates the CSV back to its original bytes."""
+    path = tmp_path / "bank.csv"
+    gen = QuestionGenerator()
+    gen.questions = [make_question(1), make_question(2)]
+    assert gen.save_to_csv(str(path))
+    before = path.read_bytes()
+
+    # Enough rows for a first block to reach the disk before the failure
+    gen.questions += [make_question(i, **_TRICKY) for i in range(3, 2000)] + [_BrokenQuestion()]
+    assert not gen.save_to_csv(str(path), append=True)
+    assert path.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["bank.csv"]
+
+
+def test_csv_columns_follow_to_dict():
+    """The CSV header and rows are the keys and values of Question.to_dict."""
+    assert list(make_question(1).to_dict()) == CSV_COLUMNS
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Question generator")
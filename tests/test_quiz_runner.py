@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for saving and logging the results of an interactive quiz."""
+
+import builtins
+import json
+
+from conftest import make_question, run_tests
+
+from quizzmaker import QuizRunner
+from quizzmaker.results_log import ResultsLog
+
+
+def _run(runner, answers):
+    """Run the runner's quiz, typing the given answers."""
+    typed = iter(answers)
+    original_input, original_print = builtins.input, builtins.print
+    builtins.input = lambda prompt='': next(typed, '')
+    builtins.print = lambda *args, **kwargs: None
+    try:
+        return runner.run_quiz()
+    finally:
+        builtins.input, builtins.print = original_input, original_print
+
+
+def test_save_results_json_is_unchanged_and_log_is_timestamped(tmp_path):
+    """Answers are timestamped when recorded; save_results writes the same JSON as before."""
+    runner = QuizRunner()
+    runner.quiz_questions = [make_question(1, type="True/False"), make_question(2, type="True/False")]
+    _run(runner, ["A", "", "B"])
+
+    runner.save_results(str(tmp_path / "results.json"))
+    saved = json.loads((tmp_path / "results.json").read_text(encoding='utf-8'))
+    assert saved == {
+        'score': 1, 'total': 2, 'percentage': 50.0,
+        'results': [
+            {'question_id': 1, 'question': "Question 1?", 'user_answer': "True",
+             'correct_answer': "True", 'is_correct': True, 'difficulty': "Easy"},
+            {'question_id': 2, 'question': "Question 2?", 'user_answer': "False",
+             'correct_answer': "True", 'is_correct': False, 'difficulty': "Easy"},
+        ],
+    }
+
+    with ResultsLog(tmp_path / "results.jsonl") as log:
+        assert runner.log_results(log, learner_id="ana", cohort="A")
+        assert runner.log_results(log, compact=True)
+    full, compact = [json.loads(line) for line in
+                     (tmp_path / "results.jsonl").read_text(encoding='utf-8').splitlines()]
+    assert (full['learner_id'], full['cohort']) == ("ana", "A")
+    assert 'learner_id' not in compact and 'cohort' not in compact
+    # Logging leaves the summary, and what save_results writes, unchanged
+    runner.save_results(str(tmp_path / "after.json"))
+    assert json.loads((tmp_path / "after.json").read_text(encoding='utf-8')) == saved
+    assert all(isinstance(r['timestamp'], float) for r in full['results'])
+    assert all(isinstance(t, float) for _, _, _, t in compact['responses'])
+    assert [r.timestamp for r in runner.current_summary.results] == [r['timestamp'] for r in full['results']]
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Quiz runner")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Tests for the append-only JSONL results log."""
+
+import shutil
+import threading
+import time
+from datetime import date, timedelta
+
+from conftest import run_tests
+
+from quizzmaker import CompactQuizSummary, Question, QuizResult, QuizSummary
+from quizzmaker.results_log import LogCursor, ResultsLog, iter_summaries
+
+
+def _make_summary(score, learner_id=None):
+    """Build a two-question summary with the given score."""
+    results = [
+        QuizResult(question_id=i, question=f"Question {i}?", user_answer="A",
+                   correct_answer="A" if i <= score else "B", is_correct=i <= score,
+                   difficulty="Easy")
+        for i in (1, 2)
+    ]
+    return QuizSummary(score=score, total=2, percentage=score * 50.0, results=results,
+                       learner_id=learner_id)
+
+
+def test_group_commit_and_streaming_read(tmp_path):
+    """Records reach the file in batches and read back as equal summaries."""
+    path = tmp_path / "results.jsonl"
+    batches = []
+    with ResultsLog(path, flush_every=3, flush_interval=None) as log:
+        log.subscribe(lambda segment, offset, lines: batches.append((offset, len(lines))))
+        summaries = [_make_summary(i % 3, learner_id=f"l{i % 2}") for i in range(7)]
+        summaries.append(_make_summary(2))
+        for summary in summaries:
+            log.append(summary)
+        assert len(path.read_text(encoding='utf-8').splitlines()) == 6
+    assert [count for _, count in batches] == [3, 3, 2]
+    assert batches[1][0] == sum(len(line) + 1 for line in path.read_bytes().split(b'\n')[:3])
+
+    assert list(iter_summaries(path)) == summaries
+    assert [s.score for s in iter_summaries(path, learner_id="l1")] == [1, 0, 2]
+    assert '"learner_id"' not in path.read_text(encoding='utf-8').splitlines()[-1]
+    assert ', ' not in path.read_text(encoding='utf-8')
+
+
+def test_rotation_and_interrupted_write(tmp_path):
+    """Segments rotate by size and date, and read back in order; a torn last line is dropped."""
+    path = tmp_path / "results.jsonl"
+    with ResultsLog(path, flush_every=1, rotate_daily=True) as log:
+        log.append(_make_summary(0))
+        record_size = path.stat().st_size
+        log._segment_date -= timedelta(days=1)  # simulate midnight
+        log.append(_make_summary(1))
+    with ResultsLog(path, flush_every=1, max_bytes=2 * record_size) as log:
+        log.append(_make_summary(2))
+        log.append(_make_summary(0))
+
+    today, yesterday = date.today(), date.today() - timedelta(days=1)
+    assert [p.name for p in log.segments()] == [
+        f"results.{yesterday.isoformat()}.001.jsonl",
+        f"results.{today.isoformat()}.001.jsonl",
+        "results.jsonl",
+    ]
+    assert [s.score for s in iter_summaries(path)] == [0, 1, 2, 0]
+
+    # A crash in the middle of a write leaves a partial last line
+    with open(path, 'ab') as f:
+        f.write(b'{"score":2,"tot')
+    assert [s.score for s in iter_summaries(path)] == [0, 1, 2, 0]
+    with ResultsLog(path) as log:
+        log.append(_make_summary(2))
+    assert [s.score for s in iter_summaries(path)] == [0, 1, 2, 0, 2]
+
+
+def test_compact_records_resolve_against_bank(tmp_path):
+    """Compact records store ids and answer codes, and join back to full summaries."""
+    bank = [
+        Question(id=1, section="1.1", section_title="Test", difficulty="Easy", type="Multiple Choice",
+                 question="Long question text? " * 20, options=["Paris", "Lyon", "Nice"],
+                 answer="Paris", explanation="Because."),
+        Question(id=2, section="1.1", section_title="Test", difficulty="Hard", type="True/False",
+                 question="Is it true?", options=[], answer="False", explanation="No."),
+        Question(id=3, section="1.2", section_title="Test", difficulty="Medium", type="Short Answer",
+                 question="Explain.", options=[], answer="Like this", explanation="See course."),
+    ]
+    results = [
+        QuizResult(1, bank[0].question, "C) Lyon", "Paris", False, "Easy", 1700000000.5),
+        QuizResult(2, bank[1].question, "False", "False", True, "Hard", 1700000003.25),
+        QuizResult(3, bank[2].question, "Auto-évalué: Correct", "Like this", True, "Medium", 1700000009.0),
+    ]
+    summary = QuizSummary(score=2, total=3, percentage=(2 / 3) * 100, results=results, learner_id="alice")
+
+    compact = CompactQuizSummary.from_summary(summary, bank)
+    assert [(r.answer, r.is_correct) for r in compact.results] == [(1, False), (1, True), (-1, True)]
+    assert (compact.score, compact.total, compact.percentage) == (2, 3, summary.percentage)
+
+    path = tmp_path / "results.jsonl"
+    with ResultsLog(path) as log:
+        log.append(compact)
+        log.append(summary)
+    compact_line, full_line = path.read_text(encoding='utf-8').splitlines()
+    assert len(compact_line) * 5 < len(full_line)
+
+    stored, _ = iter_summaries(path)
+    assert stored == compact
+    resolved, full = iter_summaries(path, bank=bank)
+    assert full == summary
+    results[0].user_answer = "Lyon"  # the shuffled display letter is not stored
+    assert resolved == summary
+
+
+def test_cursor_tells_apart_segments_with_identical_first_records(tmp_path):
+    """Segments starting with the same record keep their own positions, also in a copied log."""
+    path = tmp_path / "log" / "results.jsonl"
+    with ResultsLog(path, flush_every=1, max_bytes=1) as log:
+        for _ in range(3):
+            log.append(_make_summary(1))  # one identical record per segment
+    assert len(log.segments()) == 3
+
+    cursor = LogCursor()
+    assert len(list(cursor.read(path))) == 3
+    with ResultsLog(path, flush_every=1, max_bytes=1) as log:
+        log.append(_make_summary(1))
+    assert len(log.segments()) == 4
+    assert [r['score'] for r in cursor.read(path)] == [1]
+    assert list(cursor.read(path)) == []
+
+    # A restored copy has new inodes: positions follow the segments in order
+    copy = tmp_path / "copy"
+    shutil.copytree(path.parent, copy)
+    assert list(LogCursor.from_dict(cursor.to_dict()).read(copy / "results.jsonl")) == []
+
+
+class _TornFile:
+    """Log file whose write stops halfway through a batch with an I/O error."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def write(self, data):
+        self._f.write(bytes(data[:len(data) // 2]))
+        raise OSError("disk full")
+
+
+def test_failed_write_keeps_the_batch(tmp_path):
+    """A batch whose write fails is rolled back on disk and written by the next flush."""
+    path = tmp_path / "results.jsonl"
+    log = ResultsLog(path, flush_every=2, flush_interval=None)
+    log.append(_make_summary(0))
+    log.append(_make_summary(1))
+    size = path.stat().st_size
+
+    log.append(_make_summary(2))
+    log._file = _TornFile(log._file)
+    try:
+        log.append(_make_summary(0))
+    except OSError:
+        pass
+    else:
+        raise AssertionError("the write error was not raised")
+    assert path.stat().st_size == size
+    assert len(log._buffer) == 2
+
+    log._file = log._file._f
+    log.close()
+    assert [s.score for s in iter_summaries(path)] == [0, 1, 2, 0]
+
+
+def _wait_for(condition):
+    """Wait up to 5 seconds for condition() to hold."""
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_flush_interval_writes_a_partial_batch_without_new_records(tmp_path):
+    """The timer writes a partial batch; subscribers hear of it on the caller's thread."""
+    path = tmp_path / "results.jsonl"
+    assert ResultsLog(path).flush_interval is None  # no timer unless asked for
+    threads = []
+    with ResultsLog(path, flush_every=100, flush_interval=0.05) as log:
+        log.subscribe(lambda segment, offset, lines: threads.append(threading.get_ident()))
+        log.append(_make_summary(1))
+        _wait_for(lambda: path.exists() and path.stat().st_size)
+        assert [s.score for s in iter_summaries(path)] == [1]
+        assert threads == []
+        log.flush()
+        assert threads == [threading.get_ident()]
+
+
+def test_timer_write_errors_reach_the_next_call(tmp_path):
+    """A failed timed write is raised by the next append, and its batch is kept."""
+    path = tmp_path / "results.jsonl"
+    log = ResultsLog(path, flush_every=1)
+    log.append(_make_summary(0))
+    log.flush_every, log.flush_interval = 100, 0.05
+    log._file = _TornFile(log._file)
+    log.append(_make_summary(1))
+    _wait_for(lambda: log._timer_error is not None)
+    try:
+        log.append(_make_summary(2))
+    except OSError:
+        pass
+    else:
+        raise AssertionError("the timer's write error was not raised")
+
+    log._file = log._file._f
+    log.close()
+    assert [s.score for s in iter_summaries(path)] == [0, 1]
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Results log")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for the incremental materialized result views."""
+
+
+from conftest import make_question, run_tests
+
+from quizzmaker import CompactQuizSummary, CompactResult
+from quizzmaker.aggregation import aggregate_results
+from quizzmaker.results_log import ResultsLog
+from quizzmaker.results_views import ResultsViews
+
+
+def _bank():
+    """True/False questions 1-6 in two sections."""
+    return [make_question(i, type="True/False", section=f"{i % 2 + 1}.1",
+                          difficulty=("Easy", "Hard")[i % 3 == 0]) for i in range(1, 7)]
+
+
+def _quiz(n):
+    """Compact quiz number n, in one of three cohorts."""
+    return CompactQuizSummary([CompactResult(q, 0, (n * q) % 4 != 0) for q in range(1, 7)],
+                              learner_id=f"l{n}", cohort=f"class-{n % 3}")
+
+
+def test_views_survive_a_crash_mid_catch_up(tmp_path):
+    """Counters and log position commit together: a crash neither loses nor double counts."""
+    bank = _bank()
+    log_path, db = tmp_path / "log" / "results.jsonl", tmp_path / "views.sqlite3"
+    with ResultsLog(log_path, max_bytes=2000) as log:
+        for n in range(90):
+            log.append(_quiz(n))
+
+    crashing = ResultsViews(db, bank, batch_records=25)
+    original_apply, calls = crashing._apply, []
+
+    def apply_then_crash(records):
+        calls.append(len(records))
+        if len(calls) == 3:
+            raise RuntimeError("crash")
+        original_apply(records)
+    crashing._apply = apply_then_crash
+    try:
+        crashing.catch_up(log_path)
+    except RuntimeError:
+        pass
+    assert crashing.quizzes() == 50
+    crashing.close()
+
+    with ResultsViews(db, bank, batch_records=25) as views:
+        assert views.catch_up(log_path) == 40
+        assert views.catch_up(log_path) == 0
+        expected = aggregate_results([log_path.parent], bank, workers=1)
+        assert views.quizzes() == 90
+        assert views.rates('section') == {k: tuple(v) for k, v in expected.by_section().items()}
+        assert views.rates('difficulty') == {k: tuple(v) for k, v in expected.by_difficulty().items()}
+        assert views.rate('question', 4) == tuple(expected.by_question[4])
+        assert views.cohorts() == ['class-0', 'class-1', 'class-2']
+        assert sum(views.rate('section', '1.1', cohort)[1] for cohort in views.cohorts()) == \
+            views.rate('section', '1.1')[1]
+
+
+def test_views_follow_log_flushes(tmp_path):
+    """Subscribed views apply every batch the log writes, without reading the log back."""
+    log_path = tmp_path / "results.jsonl"
+    with ResultsLog(log_path, flush_every=2, flush_interval=None, max_bytes=500) as log, \
+            ResultsViews(":memory:", _bank()) as views:
+        log.append(_quiz(0))
+        views.follow(log)
+        assert views.quizzes() == 0
+
+        catch_up, views.catch_up = views.catch_up, None  # a call would fail
+        log.append(_quiz(1))
+        assert views.quizzes() == 2 and views.quizzes('class-1') == 1
+        for n in range(2, 12):  # several rotations
+            log.append(_quiz(n))
+        log.append(_quiz(12))
+        log.flush()
+        assert len(log.segments()) > 2
+        assert views.quizzes() == 13
+
+        # The stored position matches the log: nothing is read twice
+        views.catch_up = catch_up
+        assert views.catch_up(log_path) == 0
+        assert views.quizzes() == 13
+
+
+def test_a_cohort_named_star_is_not_the_total(tmp_path):
+    """The all-cohorts total is stored apart from a cohort named '*'."""
+    log_path, db = tmp_path / "results.jsonl", tmp_path / "views.sqlite3"
+    with ResultsLog(log_path) as log:
+        log.append(CompactQuizSummary([CompactResult(1, 0, True)], cohort="*"))
+        log.append(CompactQuizSummary([CompactResult(1, 0, False)], cohort="B"))
+    with ResultsViews(db, _bank()) as views:
+        views.catch_up(log_path)
+        assert views.cohorts() == ['*', 'B']
+        assert views.rate('question', 1, '*') == (1, 1)
+        assert views.rate('question', 1) == (1, 2)
+        assert set(views.rates_by_cohort('question')) == {None, '*', 'B'}
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Results views")
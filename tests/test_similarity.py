@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Tests for the answer-pattern similarity detection."""
+
+from itertools import combinations
+
+import numpy as np
+
+from conftest import run_tests
+
+from quizzmaker.item_analysis import ResponseMatrix
+from quizzmaker.similarity import find_similar_pairs
+
+
+def _exam(rng, sheets=300, questions=40):
+    """Random answer sheets (option 0 is correct), with sheet 7 copied from sheet 201."""
+    answers = np.where(rng.random((sheets, questions)) < 0.6, 0, rng.integers(1, 4, (sheets, questions)))
+    answers[7, :30] = answers[201, :30]
+    answers[:, -1] = -1  # one short answer question, not compared
+    learners = np.repeat([f"s{i:03d}" for i in range(sheets)], questions)
+    question_ids = np.tile(np.arange(questions), sheets)
+    return answers, ResponseMatrix.from_arrays(learners, question_ids, answers.ravel(),
+                                               answers.ravel() == 0)
+
+
+def test_blocked_kernel_matches_naive_pairs():
+    """The copied pair ranks first, and blocked / threaded runs agree with a pairwise loop."""
+    answers, matrix = _exam(np.random.default_rng(5))
+    pairs = find_similar_pairs(matrix, top_k=10, block_size=64, workers=3)
+
+    assert (pairs[0].learner_a, pairs[0].learner_b) == ("s007", "s201")
+    assert pairs == find_similar_pairs(matrix, top_k=10, block_size=1000)
+
+    naive = []
+    for a, b in combinations(range(len(answers)), 2):
+        same = (answers[a] == answers[b]) & (answers[a] >= 0)
+        naive.append((int(np.sum(same & (answers[a] > 0))), int(same.sum()), -a, -b))
+    naive.sort(reverse=True)
+    assert [(p.shared_wrong, p.identical, p.learner_a, p.learner_b) for p in pairs] == [
+        (shared, identical, f"s{-a:03d}", f"s{-b:03d}") for shared, identical, a, b in naive[:10]
+    ]
+    assert pairs[0].common == 39 and pairs[0].wrong_a == np.sum(answers[7] > 0)
+
+
+def test_only_the_latest_answer_counts():
+    """A question answered twice by a sheet is compared on its last answer only."""
+    matrix = ResponseMatrix.from_arrays(
+        ["a", "b", "a", "a", "b", "a"], [1, 1, 2, 1, 2, 2], [2, 2, 3, 0, 3, 3],
+        [False, False, False, True, False, False])
+    [pair] = find_similar_pairs(matrix)
+    assert (pair.learner_a, pair.learner_b) == ("a", "b")
+    # Question 1: a changed 2 -> 0 (correct); question 2: the same wrong answer, twice for a
+    assert (pair.shared_wrong, pair.identical, pair.common, pair.wrong_a, pair.wrong_b) == (1, 1, 2, 1, 2)
+
+
+def test_an_answer_changed_to_uncoded_clears_the_question():
+    """A last answer that is not a coded choice leaves the question unanswered."""
+    matrix = ResponseMatrix.from_arrays(
+        ["a", "b", "a", "b", "a"], [1, 1, 2, 2, 1], [2, 2, 3, 3, -1],
+        [False, False, False, False, False])
+    [pair] = find_similar_pairs(matrix)
+    # Question 1: a's wrong answer 2 was changed to -1, only question 2 is shared
+    assert (pair.shared_wrong, pair.identical, pair.common, pair.wrong_a, pair.wrong_b) == (1, 1, 1, 1, 2)
+
+
+def test_ranking_stays_exact_on_long_exams():
+    """Pairs one identical answer apart keep their order when the score exceeds 2**24."""
+    questions, wrong = 5000, 3400
+    answers = np.full((3, questions), -1)
+    answers[:, :wrong] = 1  # the same wrong option everywhere
+    answers[0, wrong:] = 0
+    answers[1, wrong:wrong + 3] = 0
+    answers[2, wrong:wrong + 4] = 0
+    matrix = ResponseMatrix.from_arrays(np.repeat(["a", "b", "c"], questions), np.tile(np.arange(questions), 3),
+                                        answers.ravel(), answers.ravel() == 0)
+
+    best = find_similar_pairs(matrix, top_k=1)[0]
+    assert (best.learner_a, best.learner_b, best.identical) == ("a", "c", wrong + 4)
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Similarity")
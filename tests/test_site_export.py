@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Tests for the static quiz site export (shared assets and offline cache)."""
+
+import functools
+import hashlib
+import http.server
+import json
+import re
+import threading
+import urllib.request
+
+from conftest import make_question, run_tests
+
+from quizzmaker.site_exporter import QuizSiteExporter, SectionSiteExporter, export_section_site
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _precache(sw_source):
+    """Return the { url: revision } precache list of a generated service worker."""
+    entries = json.loads(re.search(r'const PRECACHE = (\[.*?\]);', sw_source, re.S).group(1))
+    return {entry['url']: entry['revision'] for entry in entries}
+
+
+def test_site_layout_and_shared_assets():
+    """Quiz pages link one hashed stylesheet and script instead of inlining them."""
+    site = QuizSiteExporter({
+        "Chapitre Été": [make_question(1), make_question(2)],
+        "Chapitre Été!": [make_question(3)],
+    })
+    files = site.build(questions_per_page=1)
+
+    assert set(files) == {
+        'assets/' + name for name in (
+            re.search(r'href="assets/(quizzmaker\.\w{10}\.css)"', files['index.html']).group(1),
+            re.search(r'src="assets/(quizzmaker\.\w{10}\.js)"', files['chapitre-ete.html']).group(1),
+        )
+    } | {'chapitre-ete.html', 'chapitre-ete-2.html', 'index.html', 'sw.js', 'manifest.webmanifest'}
+    assert 'function renderCurrentPage' not in files['chapitre-ete.html']
+    assert 'navigator.serviceWorker.register("sw.js")' in files['chapitre-ete.html']
+
+    offline_free = site.build(offline=False)
+    assert 'sw.js' not in offline_free
+    assert 'serviceWorker' not in offline_free['chapitre-ete.html']
+
+
+def test_service_worker_revisions_over_http(tmp_path):
+    """Every precached URL is served by a static file server with the listed revision."""
+    questions = [make_question(1), make_question(2)]
+    site = QuizSiteExporter({"Quiz A": questions, "Quiz B": [make_question(3)]})
+
+    site.export(tmp_path)
+    handler = functools.partial(_QuietHandler, directory=tmp_path)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base = f'http://127.0.0.1:{server.server_address[1]}/'
+        with urllib.request.urlopen(base + 'sw.js') as response:
+            precache = _precache(response.read().decode('utf-8'))
+        for url, revision in precache.items():
+            with urllib.request.urlopen(base + url) as response:
+                assert hashlib.sha1(response.read()).hexdigest() == revision, url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Editing one question only changes the revision of the quiz holding it
+    questions[1] = make_question(2, explanation="Fixed.")
+    updated = _precache(site.build()['sw.js'])
+    changed = {url for url in precache if precache[url] != updated[url]}
+    assert changed == {'quiz-a.html'}
+
+
+def test_section_site_partitions_hierarchy():
+    """Every section prefix gets its own quiz, ordered naturally."""
+    bank = [
+        make_question(1, section="1.10", section_title="Ten"),
+        make_question(2, section="1.2", section_title="Two"),
+        make_question(3, section="2", section_title="Second"),
+    ]
+    site = SectionSiteExporter(bank)
+
+    assert list(site.quizzes) == ["Section 1", "1.2 Two", "1.10 Ten", "2 Second"]
+    assert [q.id for q in site.quizzes["Section 1"]] == [2, 1]
+    files = site.build()
+    assert 'sections/1.10.html' in files
+    assert 'src="../assets/quizzmaker.' in files['sections/1.10.html']
+    assert 'register("../sw.js")' in files['sections/1.10.html']
+
+
+def test_section_site_colliding_section_names(tmp_path):
+    """Sections whose names sanitize alike each keep their own file."""
+    bank = [
+        make_question(1, section="1 a", section_title="Space"),
+        make_question(2, section="1-a", section_title="Dash"),
+        make_question(3, section="!", section_title="Symbol"),
+    ]
+
+    report = export_section_site(bank, tmp_path, 5, workers=1)
+    written = sorted(p for p in report.written if p.startswith('sections/'))
+    assert report.rendered == len(written) == 3
+    assert written == ['sections/1-a-2.html', 'sections/1-a.html', 'sections/section.html']
+    assert 'Question 1?' in (tmp_path / 'sections' / '1-a.html').read_text(encoding='utf-8')
+    assert 'Question 2?' in (tmp_path / 'sections' / '1-a-2.html').read_text(encoding='utf-8')
+
+
+def test_section_site_incremental_rebuild(tmp_path):
+    """Rebuilds render and write only what changed, and remove what is gone."""
+    bank = [make_question(i, section=f"{i % 3 + 1}.{i % 2 + 1}") for i in range(1, 31)]
+
+    first = export_section_site(bank, tmp_path, 5, workers=2)
+    assert first.rendered == 9 and first.unchanged == []
+    assert list(first.timings) == ['assets', 'plan', 'render', 'index', 'write']
+
+    again = export_section_site(bank, tmp_path, 5, workers=1)
+    assert again.rendered == 0 and again.written == []
+
+    # Question 4 is in sections 2 and 2.1
+    bank[3] = make_question(4, section="2.1", explanation="Fixed.")
+    edited = export_section_site(bank, tmp_path, 5, workers=1)
+    assert edited.rendered == 2
+    assert sorted(edited.written) == ['sections/2.1.html', 'sections/2.html', 'sw.js']
+    assert 'Fixed.' in (tmp_path / 'sections' / '2.1.html').read_text(encoding='utf-8')
+
+    # Section 3 disappears
+    shrunk = export_section_site([q for q in bank if not q.section.startswith("3")], tmp_path, 5, workers=1)
+    assert sorted(shrunk.removed) == ['sections/3.1.html', 'sections/3.2.html', 'sections/3.html']
+    assert not (tmp_path / 'sections' / '3.html').exists()
+    assert 'sections/3.html' not in (tmp_path / 'sw.js').read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    run_tests(globals(), "Site export")